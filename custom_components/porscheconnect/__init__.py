@@ -1,16 +1,25 @@
 """The Porsche Connect integration."""
 
-import copy
+import asyncio
 import logging
 import operator
-from datetime import timedelta
-from functools import reduce
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from datetime import datetime, timedelta
+from functools import cache, reduce
+from typing import Any
 
 import async_timeout
+import httpx
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ACCESS_TOKEN, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import CONF_ACCESS_TOKEN, CONF_SCAN_INTERVAL, EntityCategory
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
@@ -18,16 +27,68 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 from pyporscheconnectapi.account import PorscheConnectAccount
-from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.const import MEASUREMENTS
 from pyporscheconnectapi.exceptions import PorscheExceptionError
 from pyporscheconnectapi.vehicle import PorscheVehicle
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, PLATFORMS
+from .api import (
+    PendingRemoteServiceStatus,
+    PorscheConnection,
+    PorscheRemoteServices,
+    async_get_stored_overview,
+)
+from .circuit_breaker import PorscheCircuitBreaker
+from .command_queue import PorscheCommandQueue
+from .command_tracker import PorscheCommandTracker
+from .const import (
+    CONF_DEDICATED_HTTP_CLIENT,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_FLEET_MODE,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_NON_BLOCKING_COMMANDS,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_DEDICATED_HTTP_CLIENT,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_FLEET_MODE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_NON_BLOCKING_COMMANDS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DOMAIN,
+    FLEET_METRICS_SAMPLES,
+    FLEET_PAGE_SIZE,
+    FLEET_POLL_TRACES,
+    METRICS_SAMPLES,
+    PICTURE_LOCATIONS_TTL,
+    PLATFORMS,
+    POLL_TRACES,
+    SIGNAL_PICTURE_LOCATIONS_UPDATED,
+)
+from .fetch_plan import build_fetch_plan, with_dependencies
+from .http_client import PorscheHttpTimings, async_create_http_client, async_prewarm
+from .hub import async_get_vehicle_hub
+from .metrics import PorscheApiMetrics, PorschePollMetrics
+from .optimistic import ExpectedState, PorscheOptimisticState
+from .poll_trace import PollTrace
+from .rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PorscheRateLimiter,
+    async_remove_quota,
+    request_priority,
+)
+from .scheduler import PorschePollingScheduler
+from .single_flight import PorscheSingleFlight
+from .snapshot import PorscheSnapshotStore
+from .token_manager import PorscheTokenManager, PorscheTokenPersistence
 
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
 
+OPEN_STATE_NODES = tuple(m for m in MEASUREMENTS if m.startswith("OPEN_STATE_"))
+
 
 def get_from_dict(datadict, keystring):
     """Safely get value from dict."""
@@ -41,15 +102,29 @@ def get_from_dict(datadict, keystring):
     return reduce(safe_getitem, maplist, datadict)
 
 
-@callback
-def _async_save_token(hass, config_entry, access_token):
-    hass.config_entries.async_update_entry(
-        config_entry,
-        data={
-            **config_entry.data,
-            CONF_ACCESS_TOKEN: access_token,
-        },
-    )
+@cache
+def compile_measurement_accessor(
+    node: str | None, leaf: str | None
+) -> Callable[[dict[str, Any]], Any]:
+    """Return an accessor for the leaf of a measurement node in vehicle data.
+
+    The accessor behaves like get_from_dict on the node and then the leaf, but
+    the key path is split once per node and leaf pair instead of on every call.
+    """
+    if node is None or leaf is None:
+        return lambda _data: None
+
+    keys = (*node.split("."), *leaf.split("."))
+
+    def accessor(data: dict[str, Any]) -> Any:  # noqa: ANN401
+        value: Any = data
+        for key in keys:
+            if value is None or key not in value:
+                return None
+            value = value[key]
+        return value
+
+    return accessor
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -62,8 +137,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
 
-    async_client = get_async_client(hass)
-    connection = Connection(
+    dedicated_client = entry.options.get(
+        CONF_DEDICATED_HTTP_CLIENT, DEFAULT_DEDICATED_HTTP_CLIENT
+    )
+    if dedicated_client:
+        async_client = await async_create_http_client(hass)
+        entry.async_on_unload(async_client.aclose)
+    else:
+        async_client = get_async_client(hass)
+    connection = PorscheConnection(
         entry.data.get("email"),
         entry.data.get("password"),
         async_client=async_client,
@@ -79,6 +161,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         config_entry=entry,
         controller=controller,
     )
+    if dedicated_client:
+        entry.async_create_background_task(
+            hass,
+            async_prewarm(async_client, coordinator.http_timings),
+            "porscheconnect connection pre-warm",
+        )
+    await coordinator.rate_limiter.async_load()
     await coordinator.async_config_entry_first_refresh()
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -87,7 +176,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         list(PLATFORMS),
     )
 
-    _async_save_token(hass, entry, controller.token)
+    coordinator.async_save_token()
+    coordinator.async_refresh_restored_vehicles()
+    coordinator.async_schedule_picture_locations_refresh()
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     from .services import setup_services
 
@@ -97,16 +190,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 
 class PorscheConnectDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Porsche data."""
+    """Account level hub owning the vehicles and their coordinators."""
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, controller):
         """Initialise the controller."""
         self.controller = controller
         self.vehicles = []
+        self.vehicle_coordinators: dict[str, PorscheVehicleDataUpdateCoordinator] = {}
         self.hass = hass
         self.config_entry = config_entry
+        self.options = dict(config_entry.options)
+        self.token_manager = PorscheTokenManager(
+            hass,
+            controller.connection,
+            on_refresh=self._async_handle_token_refresh,
+        )
+        self.token_persistence = PorscheTokenPersistence(hass, config_entry)
+        self.circuit_breaker = PorscheCircuitBreaker(
+            hass,
+            config_entry,
+            controller.connection,
+            on_change=self.async_update_listeners,
+        )
+        self.rate_limiter = PorscheRateLimiter(
+            hass,
+            config_entry,
+            controller.connection,
+            on_change=self.async_update_listeners,
+        )
+        self.http_timings = PorscheHttpTimings(controller.connection)
+        self.api_metrics = PorscheApiMetrics(controller.connection)
+        self.snapshot = PorscheSnapshotStore(hass, config_entry)
+        self._restored = False
+        self._unsub_picture_locations: CALLBACK_TYPE | None = None
+
+        self.request_semaphore = asyncio.Semaphore(
+            config_entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                DEFAULT_MAX_CONCURRENT_REQUESTS,
+            ),
+        )
 
-        scan_interval = timedelta(
+        self.scan_interval = timedelta(
             seconds=config_entry.options.get(
                 CONF_SCAN_INTERVAL,
                 config_entry.data.get(
@@ -115,40 +240,496 @@ class PorscheConnectDataUpdateCoordinator(DataUpdateCoordinator):
                 ),
             ),
         )
+        self.fast_scan_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_FAST_SCAN_INTERVAL,
+                DEFAULT_FAST_SCAN_INTERVAL,
+            ),
+        )
+        self.slow_scan_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_SLOW_SCAN_INTERVAL,
+                DEFAULT_SLOW_SCAN_INTERVAL,
+            ),
+        )
+        self.non_blocking_commands = config_entry.options.get(
+            CONF_NON_BLOCKING_COMMANDS,
+            DEFAULT_NON_BLOCKING_COMMANDS,
+        )
+        self.fleet_mode = config_entry.options.get(
+            CONF_FLEET_MODE,
+            DEFAULT_FLEET_MODE,
+        )
 
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=scan_interval)
+        # Polling is done by the vehicle coordinators, the hub only runs once
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name=DOMAIN,
+            update_interval=None,
+        )
 
-    def get_vechicle_data_leaf(self, vehicle, node, leaf):
-        """Get data value leaf from dict."""
-        return get_from_dict(get_from_dict(vehicle.data, node), leaf)
+    @callback
+    def async_save_token(self) -> None:
+        """Persist the current access token in the config entry."""
+        self.token_persistence.async_schedule_save(self.token_manager.token)
+
+    @callback
+    def async_save_snapshot(self) -> None:
+        """Persist the vehicles for the next startup."""
+        self.snapshot.async_schedule_save(lambda: self.vehicles)
+
+    @callback
+    def _async_handle_token_refresh(self) -> None:
+        """Persist a refreshed token and update the account entities."""
+        self.api_metrics.record_token_refresh(self.token_manager.refresh_latency)
+        self.async_save_token()
+        self.async_update_listeners()
 
     async def _async_update_data(self):
-        """Fetch data from API endpoint."""
+        """Fetch the vehicle list and refresh each vehicle."""
         try:
             if len(self.vehicles) == 0:
-                self.vehicles = await self.controller.get_vehicles()
+                self.vehicles = await self.snapshot.async_load_vehicles(
+                    self.controller.connection
+                )
+                self._restored = bool(self.vehicles)
+                if self._restored:
+                    self.controller.vehicles = self.vehicles
+                else:
+                    self.vehicles = await self.controller.get_vehicles()
+                await self._async_create_vehicle_coordinators()
+                self.rate_limiter.async_set_vehicles(len(self.vehicles))
+                self.token_manager.async_schedule_refresh()
+        except PorscheExceptionError as exc:
+            msg = "Error communicating with API: %s"
+            raise UpdateFailed(msg, exc) from exc
+
+        if self._restored:
+            # Entities are set up from the snapshot, see
+            # async_refresh_restored_vehicles
+            for coordinator in self.vehicle_coordinators.values():
+                coordinator.async_restore()
+            return {}
+
+        await self._async_refresh_vehicles()
+        return {}
+
+    def _pages(self, items: list) -> list[list]:
+        """Split items into pages in fleet mode, or return them as one page."""
+        if not self.fleet_mode:
+            return [items]
+        return [
+            items[start : start + FLEET_PAGE_SIZE]
+            for start in range(0, len(items), FLEET_PAGE_SIZE)
+        ]
+
+    def vehicle_pages(self) -> list[list["PorscheVehicleDataUpdateCoordinator"]]:
+        """Return the vehicle coordinators, a page of vehicles at a time."""
+        return self._pages(list(self.vehicle_coordinators.values()))
+
+    async def _async_create_vehicle_coordinators(self) -> None:
+        """Create the vehicle coordinators, yielding between pages."""
+        self.vehicle_coordinators = {}
+        for index, page in enumerate(self._pages(self.vehicles)):
+            if index:
+                # Let other work run while a large account is set up
+                await asyncio.sleep(0)
+            for vehicle in page:
+                poll_slot = 0.0
+                if self.fleet_mode:
+                    poll_slot = len(self.vehicle_coordinators) / len(self.vehicles)
+                self.vehicle_coordinators[vehicle.vin] = (
+                    PorscheVehicleDataUpdateCoordinator(
+                        self.hass,
+                        account=self,
+                        vehicle=vehicle,
+                        poll_slot=poll_slot,
+                    )
+                )
+
+    async def _async_refresh_vehicles(self) -> None:
+        """Refresh each vehicle, a page of vehicles at a time in fleet mode."""
+        # A failing vehicle only marks its own entities unavailable
+        for page in self.vehicle_pages():
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in page))
+        self.async_save_token()
+
+    @callback
+    def async_refresh_restored_vehicles(self) -> None:
+        """Refresh vehicles restored from the snapshot in the background."""
+        if not self._restored:
+            return
+        self._restored = False
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_refresh_restored_vehicles(),
+            "porscheconnect refresh restored vehicles",
+        )
+
+    @callback
+    def async_schedule_picture_locations_refresh(self) -> None:
+        """Fetch picture locations now if missing, and then on their own TTL."""
+        self._unsub_picture_locations = async_track_time_interval(
+            self.hass,
+            self._async_handle_picture_locations_interval,
+            PICTURE_LOCATIONS_TTL,
+            name="porscheconnect picture locations refresh",
+        )
+        if not all(vehicle.picture_locations for vehicle in self.vehicles):
+            self._async_handle_picture_locations_interval(dt_util.utcnow())
+
+    @callback
+    def _async_handle_picture_locations_interval(self, _now: datetime) -> None:
+        """Start a background refresh of the picture locations."""
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_refresh_picture_locations(),
+            "porscheconnect picture locations refresh",
+        )
 
-                for vehicle in self.vehicles:
-                    await vehicle.get_stored_overview()
-                    await vehicle.get_picture_locations()
+    async def _async_refresh_picture_locations(self) -> None:
+        """Fetch the picture locations of all vehicles and announce them."""
 
-            else:
-                async with async_timeout.timeout(30):
-                    for vehicle in self.vehicles:
-                        await vehicle.get_stored_overview()
+        async def refresh(vehicle: PorscheVehicle) -> None:
+            async with self.request_semaphore:
+                await vehicle.get_picture_locations()
 
+        with request_priority(PRIORITY_BACKGROUND):
+            for page in self._pages(self.vehicles):
+                await asyncio.gather(*(refresh(vehicle) for vehicle in page))
+        self.async_save_snapshot()
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_PICTURE_LOCATIONS_UPDATED.format(self.config_entry.entry_id),
+        )
+
+    @callback
+    def async_shutdown_picture_locations(self) -> None:
+        """Stop refreshing the picture locations."""
+        if self._unsub_picture_locations is not None:
+            self._unsub_picture_locations()
+            self._unsub_picture_locations = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled work of the account and its vehicles."""
+        await super().async_shutdown()
+        self.token_manager.async_shutdown()
+        self.rate_limiter.async_shutdown()
+        self.async_shutdown_picture_locations()
+        self.token_persistence.async_flush()
+        for coordinator in self.vehicle_coordinators.values():
+            await coordinator.async_shutdown()
+
+    async def _async_refresh_restored_vehicles(self) -> None:
+        """Refresh the vehicles, reloading if the vehicle list changed."""
+        try:
+            with request_priority(PRIORITY_BACKGROUND):
+                vehicle_list = await self.controller.connection.get(
+                    "/connect/v1/vehicles"
+                )
         except PorscheExceptionError as exc:
-            msg = "Error communicating with API: %s"
-            raise UpdateFailed(msg, exc) from exc
+            _LOGGER.warning("Could not check the vehicle list: %s", exc)
         else:
-            accesstoken = copy.deepcopy(self.controller.token)
+            if {vehicle["vin"] for vehicle in vehicle_list} != set(
+                self.vehicle_coordinators
+            ):
+                _LOGGER.info("Vehicle list changed since the snapshot, reloading")
+                await self.snapshot.async_remove()
+                self.hass.config_entries.async_schedule_reload(
+                    self.config_entry.entry_id
+                )
+                return
+
+        await self._async_refresh_vehicles()
+
+
+class PorscheVehicleDataUpdateCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching data for a single Porsche vehicle."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        account: PorscheConnectDataUpdateCoordinator,
+        vehicle: PorscheVehicle,
+        poll_slot: float = 0.0,
+    ) -> None:
+        """Initialise the vehicle coordinator.
+
+        The poll slot is the share of the polling interval to shift the polls
+        of the vehicle by, to spread the vehicles of an account over it.
+        """
+        self.account = account
+        self.vehicle = vehicle
+        self.poll_slot = poll_slot
+        self.latency: float | None = None
+        self.poll_metrics = PorschePollMetrics(
+            FLEET_METRICS_SAMPLES if account.fleet_mode else METRICS_SAMPLES
+        )
+        self.poll_traces: deque[PollTrace] = deque(
+            maxlen=FLEET_POLL_TRACES if account.fleet_mode else POLL_TRACES
+        )
+        self.scheduler = PorschePollingScheduler(
+            base_interval=account.scan_interval,
+            fast_interval=account.fast_scan_interval,
+            slow_interval=account.slow_scan_interval,
+        )
+        self.single_flight = PorscheSingleFlight(hass, vehicle.vin)
+        self.command_queue = PorscheCommandQueue(hass, vehicle.vin)
+        self.optimistic = PorscheOptimisticState(self)
+        self.command_tracker = PorscheCommandTracker(self)
+        vehicle.remote_services = PorscheRemoteServices(
+            vehicle, non_blocking=account.non_blocking_commands
+        )
+        self._fetch_plan: tuple[str, ...] | None = None
+        self._fetched_nodes: frozenset[str] = frozenset()
+        self._snapshot: dict[str, Any] = {}
+        self._dispatched_success: bool | None = None
+        self._staggered = False
+        self._dispatch_trace: PollTrace | None = None
+        self.hub = async_get_vehicle_hub(hass)
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=account.config_entry,
+            name=f"{DOMAIN} {vehicle.vin}",
+            update_interval=account.scan_interval,
+        )
+        self.hub.async_register(self)
+
+    @callback
+    def async_restore(self) -> None:
+        """Use the restored vehicle data until the first poll."""
+        self.data = self.vehicle.data
 
-            _async_save_token(
-                hass=self.hass,
-                config_entry=self.config_entry,
-                access_token=accesstoken,
+    async def async_remote_command(
+        self,
+        operation: str,
+        job: Callable[[], Awaitable[Any]],
+        args: tuple[Hashable, ...] = (),
+        slot: str | None = None,
+        on_failure: Callable[[], None] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Run a remote command of the vehicle.
+
+        Identical concurrent commands are merged, and commands are queued in
+        their slot, where a later command supersedes a waiting one. Commands
+        that return once accepted are tracked until they complete, calling
+        on_failure if the vehicle does not perform them.
+        """
+        with request_priority(PRIORITY_COMMAND):
+            result = await self.single_flight.async_run(
+                operation,
+                lambda: self.command_queue.async_submit(slot or operation, job),
+                args,
             )
-            return {}
+            if isinstance(result, PendingRemoteServiceStatus):
+                self.command_tracker.async_track(operation, result, on_failure)
+        return result
+
+    async def async_optimistic_command(
+        self,
+        expected: ExpectedState,
+        operation: str,
+        job: Callable[[], Awaitable[Any]],
+        args: tuple[Hashable, ...] = (),
+        slot: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Run a remote command, showing the requested state right away.
+
+        The requested state is shown until the vehicle reports it, and rolled
+        back if the command fails or the vehicle does not confirm it in time.
+        """
+        self.optimistic.async_expect(expected)
+        self._async_dispatch(expected.nodes)
+
+        @callback
+        def rollback() -> None:
+            self.optimistic.async_rollback(expected)
+            self._async_dispatch(expected.nodes)
+
+        try:
+            result = await self.async_remote_command(
+                operation, job, args, slot, rollback
+            )
+        except Exception:
+            rollback()
+            raise
+
+        self.optimistic.async_start_confirmation(expected)
+        # Unless the command returned when accepted, the library fetched the
+        # overview after it, which may already confirm the state
+        self.async_update_listeners()
+        return result
+
+    async def async_fetch_nodes(self, nodes: Iterable[str]) -> None:
+        """Fetch only the given measurement nodes of the vehicle."""
+        measurements = tuple(
+            node for node in MEASUREMENTS if node in with_dependencies(nodes)
+        )
+        async with self.account.request_semaphore:
+            await self.single_flight.async_run(
+                "stored_overview",
+                lambda: async_get_stored_overview(self.vehicle, measurements),
+                (measurements,),
+            )
+
+    def get_vechicle_data_leaf(self, vehicle, node, leaf):
+        """Get data value leaf from dict."""
+        return compile_measurement_accessor(node, leaf)(vehicle.data)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: frozenset[str] | None = None
+    ) -> Callable[[], None]:
+        """Listen for data updates and rebuild the fetch plan."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._async_invalidate_fetch_plan(context)
+
+        @callback
+        def remove_listener_and_invalidate() -> None:
+            remove_listener()
+            self._async_invalidate_fetch_plan(context)
+
+        return remove_listener_and_invalidate
+
+    @callback
+    def _async_invalidate_fetch_plan(self, context: frozenset[str] | None) -> None:
+        """Rebuild the fetch plan on the next poll if a listener changed it."""
+        if not context:
+            return
+        if (primary := self.hub.primary(self)) is not self:
+            primary._async_invalidate_fetch_plan(context)  # noqa: SLF001
+            return
+        self._fetch_plan = None
+        if self._fetched_nodes and not context <= self._fetched_nodes:
+            # A newly enabled entity reads a node we have not fetched yet
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @property
+    def fetch_plan(self) -> tuple[str, ...]:
+        """Return the measurement nodes read by the entities of the vehicle."""
+        if self._fetch_plan is None:
+            # Includes the entities of other config entries showing the vehicle
+            self._fetch_plan = build_fetch_plan(
+                self.hub.listener_contexts(self),
+                privacy_mode=bool(self.vehicle.privacy_mode),
+            )
+        return self._fetch_plan
+
+    @callback
+    def _async_changed_nodes(self) -> set[str]:
+        """Return the measurement nodes changed since the last dispatch."""
+        data = self.vehicle.data
+        snapshot = self._snapshot
+        changed = {node for node, value in data.items() if snapshot.get(node) != value}
+        changed.update(node for node in snapshot if node not in data)
+        # Parsing builds new node values, so a shallow copy is enough
+        self._snapshot = dict(data)
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners that depend on a changed measurement node.
+
+        Listeners register the measurement nodes they read as their context,
+        listeners without a context are updated on every refresh.
+        """
+        start = time.monotonic()
+        changed: set[str] | None = self._async_changed_nodes()
+        # Entities showing a state that was just confirmed or rolled back
+        changed |= self.optimistic.async_settle()
+        if self.last_update_success != self._dispatched_success:
+            # Availability changed, every entity needs to write its state
+            self._dispatched_success = self.last_update_success
+            changed = None
+
+        self._async_dispatch(changed)
+        if (trace := self._dispatch_trace) is not None:
+            self._dispatch_trace = None
+            trace.dispatch = time.monotonic() - start
+
+    @callback
+    def _async_dispatch(self, changed: set[str] | frozenset[str] | None) -> None:
+        """Update the listeners that read one of the changed nodes."""
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def _async_update_data(self):
+        """Fetch the stored overview of the vehicle."""
+        if (primary := self.hub.primary(self)) is not self:
+            return await self._async_update_from_primary(primary)
+
+        trace = PollTrace(
+            self.vehicle.vin, retries=self.poll_metrics.consecutive_failures
+        )
+        self.poll_traces.append(trace)
+        try:
+            with trace.activate():
+                queued = time.monotonic()
+                async with self.account.request_semaphore:
+                    start = time.monotonic()
+                    trace.queued = start - queued
+                    async with async_timeout.timeout(30):
+                        # Entities are created from what the first full fetch
+                        # reports, so we cannot know what to skip before that
+                        measurements = (
+                            MEASUREMENTS if self.data is None else self.fetch_plan
+                        )
+                        trace.measurements = len(measurements)
+                        privacy_mode = self.vehicle.privacy_mode
+                        await self.single_flight.async_run(
+                            "stored_overview",
+                            lambda: async_get_stored_overview(
+                                self.vehicle, measurements
+                            ),
+                            (tuple(measurements),),
+                        )
+                        self._fetched_nodes = frozenset(measurements)
+                        if self.vehicle.privacy_mode != privacy_mode:
+                            self._fetch_plan = None
+                    self.latency = time.monotonic() - start
+
+        except TimeoutError:
+            self.poll_metrics.record_failure()
+            raise
+        except (PorscheExceptionError, httpx.HTTPError) as exc:
+            self.poll_metrics.record_failure()
+            msg = "Error communicating with API: %s"
+            raise UpdateFailed(msg, exc) from exc
+
+        self.poll_metrics.record_success(self.latency)
+        self._dispatch_trace = trace
+        self.update_interval = self.scheduler.next_interval(self.vehicle)
+        if not self._staggered:
+            self._staggered = True
+            self.update_interval += self.hub.stagger_offset(self)
+        _LOGGER.debug(
+            "Fetched vehicle %s in %.3f s, next poll in %s (%s)",
+            self.vehicle.vin,
+            self.latency,
+            self.update_interval,
+            self.scheduler.reason,
+        )
+        self.account.async_save_token()
+        self.account.async_save_snapshot()
+        self.hub.async_fan_out(self)
+        return self.vehicle.data
+
+    async def _async_update_from_primary(
+        self, primary: "PorscheVehicleDataUpdateCoordinator"
+    ) -> dict[str, Any]:
+        """Update from the coordinator of another entry polling the vehicle."""
+        if primary.data is None:
+            await primary.async_refresh()
+        elif self.data is not None:
+            # The primary fans its result out to us when it is done
+            await primary.async_request_refresh()
+        self.hub.async_copy_from_primary(self)
+        return self.vehicle.data
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -159,11 +740,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN].pop(
+            entry.entry_id,
+        )
+        await coordinator.async_shutdown()
+        hub = async_get_vehicle_hub(hass)
+        for vehicle_coordinator in coordinator.vehicle_coordinators.values():
+            hub.async_unregister(vehicle_coordinator)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the vehicle snapshot and quota of a removed config entry."""
+    await PorscheSnapshotStore(hass, entry).async_remove()
+    await async_remove_quota(hass, entry)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options have changed."""
+    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Token updates also trigger this listener, only reload for option changes
+    if entry.options != coordinator.options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     _LOGGER.info("Reloading config entry: %s", entry)
@@ -171,19 +772,45 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await async_setup_entry(hass, entry)
 
 
+async def async_add_vehicle_entities(
+    account: PorscheConnectDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    vehicle_entities: Callable[[PorscheVehicleDataUpdateCoordinator], Iterable[Entity]],
+) -> None:
+    """Add the entities of every vehicle of an account.
+
+    In fleet mode the entities are created and added a page of vehicles at a
+    time, letting other work run in between.
+    """
+    for index, page in enumerate(account.vehicle_pages()):
+        if index:
+            await asyncio.sleep(0)
+        async_add_entities(
+            [entity for coordinator in page for entity in vehicle_entities(coordinator)]
+        )
+
+
 class PorscheBaseEntity(CoordinatorEntity):
     """Common base for entities."""
 
-    coordinator: PorscheConnectDataUpdateCoordinator
+    coordinator: PorscheVehicleDataUpdateCoordinator
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
+        measurement_nodes: Iterable[str] | None = None,
     ) -> None:
-        """Initialise the entity."""
-        super().__init__(coordinator)
+        """Initialise the entity.
+
+        The entity is only updated when one of its measurement nodes changes,
+        or on every refresh if no measurement nodes are given.
+        """
+        super().__init__(
+            coordinator,
+            context=None if measurement_nodes is None else frozenset(measurement_nodes),
+        )
 
         self.vehicle = vehicle
 
@@ -204,3 +831,29 @@ class PorscheBaseEntity(CoordinatorEntity):
         """When entity is added to hass."""
         await super().async_added_to_hass()
         self._handle_coordinator_update()
+
+
+class PorscheAccountEntity(CoordinatorEntity):
+    """Common base for account level entities."""
+
+    coordinator: PorscheConnectDataUpdateCoordinator
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: PorscheConnectDataUpdateCoordinator) -> None:
+        """Initialise the entity."""
+        super().__init__(coordinator)
+
+        entry = coordinator.config_entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Porsche",
+            model="Porsche Connect account",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
@@ -0,0 +1,166 @@
+"""Porsche Connect API connection used by the integration."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import httpx
+from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.const import API_BASE_URL, TIMEOUT
+from pyporscheconnectapi.exceptions import (
+    PorscheExceptionError,
+    PorscheRemoteServiceError,
+)
+from pyporscheconnectapi.remote_services import RemoteServices, RemoteServiceStatus
+from pyporscheconnectapi.vehicle import PorscheVehicle
+
+from .poll_trace import PHASE_PARSE, PHASE_TOKEN, trace_phase
+
+if TYPE_CHECKING:
+    from .circuit_breaker import PorscheCircuitBreaker
+    from .http_client import PorscheHttpTimings
+    from .metrics import PorscheApiMetrics
+    from .rate_limiter import PorscheRateLimiter
+    from .token_manager import PorscheTokenManager
+
+
+class PorscheConnection(Connection):
+    """Connection that waits on the integration's token manager.
+
+    Calls fail right away while the circuit breaker of the account is open,
+    and take their share of the account quota from the rate limiter. Each
+    call is traced to measure its connect, TLS and first byte times, and
+    its latency and payload size are recorded in the metrics.
+    """
+
+    token_manager: PorscheTokenManager | None = None
+    circuit_breaker: PorscheCircuitBreaker | None = None
+    rate_limiter: PorscheRateLimiter | None = None
+    timings: PorscheHttpTimings | None = None
+    metrics: PorscheApiMetrics | None = None
+
+    async def request(self, method, url, **kwargs: object):
+        """Create a request to the Porsche Connect API."""
+        if self.circuit_breaker is None:
+            return await self._async_request(method, url, **kwargs)
+
+        self.circuit_breaker.async_before_call()
+        try:
+            result = await self._async_request(method, url, **kwargs)
+        except BaseException as exc:
+            self.circuit_breaker.async_record_failure(exc)
+            raise
+        self.circuit_breaker.async_record_success()
+        return result
+
+    async def _async_request(self, method, url, **kwargs: object):
+        """Create a request with a valid access token within the quota."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.async_acquire()
+        if self.token_manager is not None:
+            with trace_phase(PHASE_TOKEN):
+                await self.token_manager.async_get_access_token()
+        if self.timings is not None:
+            kwargs["extensions"] = {"trace": self.timings.trace()}
+        if self.metrics is None:
+            return await super().request(method, url, **kwargs)
+        return await self._async_measured_request(method, url, **kwargs)
+
+    async def _async_measured_request(self, method, url, **kwargs: object):
+        """Make the request of Connection.request, recording latency and size.
+
+        Connection.request only returns the decoded body, so the request is
+        made here to get at the response.
+        """
+        await self.get_token()
+        start = time.monotonic()
+        payload_bytes = 0
+        error = True
+        try:
+            response = await self.asyncClient.request(
+                method,
+                f"{API_BASE_URL}{url}",
+                headers=self.headers
+                | {"Authorization": f"Bearer {self.token.access_token}"},
+                timeout=TIMEOUT,
+                **kwargs,
+            )
+            payload_bytes = len(response.content)
+            response.raise_for_status()
+            error = False
+        except httpx.HTTPStatusError as exc:
+            raise PorscheExceptionError(exc.response.status_code) from exc
+        finally:
+            self.metrics.record(
+                url, time.monotonic() - start, payload_bytes, error=error
+            )
+        return response.json()
+
+
+class PendingRemoteServiceStatus(RemoteServiceStatus):
+    """Status of a remote command accepted by Porsche but not yet performed."""
+
+
+class PorscheRemoteServices(RemoteServices):
+    """Remote services that can return as soon as a command is accepted.
+
+    In non-blocking mode the caller gets a pending status once Porsche has
+    accepted the command, instead of waiting for the vehicle to perform it.
+    Tracking its completion is then up to the caller.
+    """
+
+    def __init__(self, vehicle: PorscheVehicle, *, non_blocking: bool) -> None:
+        """Initialise the remote services."""
+        super().__init__(vehicle)
+        self.non_blocking = non_blocking
+
+    async def _send_command(self, payload):
+        """Send a command, waiting for its completion unless non-blocking."""
+        if not self.non_blocking:
+            return await super()._send_command(payload)
+
+        response = await self._connection.post(
+            f"/connect/v1/vehicles/{self._vehicle.vin}/commands",
+            json=payload,
+        )
+        if not response:
+            msg = "Did not receive response for remote service request"
+            raise PorscheRemoteServiceError(msg)
+
+        status_id = response.get("status", {}).get("id")
+        if status_id and response.get("status", {}).get("result") == "ACCEPTED":
+            return PendingRemoteServiceStatus({}, status_id=status_id)
+        return RemoteServiceStatus(response, status_id=status_id)
+
+
+async def async_get_command_status(
+    vehicle: PorscheVehicle,
+    status_id: str,
+) -> RemoteServiceStatus:
+    """Fetch the execution status of a remote command of a vehicle."""
+    return RemoteServiceStatus(
+        await vehicle.connection.get(
+            f"/connect/v1/vehicles/{vehicle.vin}/commands/{status_id}",
+        ),
+        status_id=status_id,
+    )
+
+
+async def async_get_stored_overview(
+    vehicle: PorscheVehicle,
+    measurements: Iterable[str],
+) -> None:
+    """Fetch the stored overview of the given measurements of a vehicle.
+
+    Unlike PorscheVehicle.get_stored_overview, only the given measurements are
+    requested and API errors are raised to the caller.
+    """
+    query = "&".join(f"mf={measurement}" for measurement in measurements)
+    status = await vehicle.connection.get(
+        f"/connect/v1/vehicles/{vehicle.vin}?{query}",
+    )
+    with trace_phase(PHASE_PARSE):
+        vehicle.status = status
+        vehicle._update_vehicle_data()  # noqa: SLF001
@@ -18,8 +18,12 @@ from pyporscheconnectapi.vehicle import PorscheVehicle
 
 from . import DOMAIN as PORSCHE_DOMAIN
 from . import (
+    OPEN_STATE_NODES,
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
+    compile_measurement_accessor,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +35,7 @@ class PorscheBinarySensorEntityDescription(BinarySensorEntityDescription):
 
     measurement_node: str | None = None
     measurement_leaf: str | None = None
+    measurement_nodes: tuple[str, ...] = ()
     value_fn: Callable[[PorscheVehicle], bool] | None = None
     attr_fn: Callable[[PorscheVehicle], dict[str, str]] | None = None
     is_available: Callable[[PorscheVehicle], bool] = lambda v: v.has_porsche_connect
@@ -73,6 +78,7 @@ SENSOR_TYPES: list[PorscheBinarySensorEntityDescription] = [
         name="Doors and lids",
         key="doors_and_lids",
         translation_key="doors_and_lids",
+        measurement_nodes=OPEN_STATE_NODES,
         value_fn=lambda v: not v.vehicle_closed,
         attr_fn=lambda v: v.doors_and_lids,
         device_class=BinarySensorDeviceClass.OPENING,
@@ -81,6 +87,7 @@ SENSOR_TYPES: list[PorscheBinarySensorEntityDescription] = [
         name="Tire pressure status",
         key="tire_pressure_status",
         translation_key="tire_pressure_status",
+        measurement_nodes=("TIRE_PRESSURE",),
         value_fn=lambda v: not v.tire_pressure_status,
         attr_fn=lambda v: v.tire_pressures,
         is_available=lambda v: v.has_tire_pressure_monitoring,
@@ -95,18 +102,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensors from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[PORSCHE_DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[PORSCHE_DOMAIN][
         config_entry.entry_id
     ]
 
-    entities = [
-        PorscheBinarySensor(coordinator, vehicle, description)
-        for vehicle in coordinator.vehicles
-        for description in SENSOR_TYPES
-        if description.is_available(vehicle)
-    ]
-
-    async_add_entities(entities)
+    await async_add_vehicle_entities(
+        account,
+        async_add_entities,
+        lambda coordinator: [
+            PorscheBinarySensor(coordinator, coordinator.vehicle, description)
+            for description in SENSOR_TYPES
+            if description.is_available(coordinator.vehicle)
+        ],
+    )
 
 
 class PorscheBinarySensor(BinarySensorEntity, PorscheBaseEntity):
@@ -116,16 +124,24 @@ class PorscheBinarySensor(BinarySensorEntity, PorscheBaseEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
         description: PorscheBinarySensorEntityDescription,
     ) -> None:
         """Initialize of the sensor."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(
+            coordinator,
+            vehicle,
+            description.measurement_nodes or (description.measurement_node,),
+        )
 
         self.coordinator = coordinator
         self.entity_description = description
         self._attr_unique_id = f'{vehicle.data["name"]}-{description.key}'
+        self._value_accessor = compile_measurement_accessor(
+            description.measurement_node,
+            description.measurement_leaf,
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -133,11 +149,7 @@ class PorscheBinarySensor(BinarySensorEntity, PorscheBaseEntity):
         if self.entity_description.value_fn:
             self._attr_is_on = self.entity_description.value_fn(self.vehicle)
         else:
-            self._attr_is_on = self.coordinator.get_vechicle_data_leaf(
-                self.vehicle,
-                self.entity_description.measurement_node,
-                self.entity_description.measurement_leaf,
-            )
+            self._attr_is_on = self._value_accessor(self.vehicle.data)
 
         _LOGGER.debug(
             "Updating binary sensor '%s' of %s with state '%s'",
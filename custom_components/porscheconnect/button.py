@@ -15,6 +15,8 @@ from pyporscheconnectapi.vehicle import PorscheVehicle
 from . import (
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
 )
 from .const import DOMAIN
 
@@ -52,22 +54,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Porsche buttons from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
 
-    entities: list[PorscheButton] = []
-
-    for vehicle in coordinator.vehicles:
-        entities.extend(
-            [
-                PorscheButton(coordinator, vehicle, description)
-                for description in BUTTON_TYPES
-                if description.is_available(vehicle)
-            ],
-        )
-
-    async_add_entities(entities)
+    await async_add_vehicle_entities(
+        account,
+        async_add_entities,
+        lambda coordinator: [
+            PorscheButton(coordinator, coordinator.vehicle, description)
+            for description in BUTTON_TYPES
+            if description.is_available(coordinator.vehicle)
+        ],
+    )
 
 
 class PorscheButton(PorscheBaseEntity, ButtonEntity):
@@ -77,19 +76,22 @@ class PorscheButton(PorscheBaseEntity, ButtonEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
         description: PorscheButtonEntityDescription,
     ) -> None:
         """Initialize Porsche Connect button."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, ())
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
 
     async def async_press(self) -> None:
         """Press the button."""
         try:
-            await self.entity_description.remote_function(self.vehicle)
+            await self.coordinator.async_remote_command(
+                self.entity_description.key,
+                lambda: self.entity_description.remote_function(self.vehicle),
+            )
         except PorscheExceptionError as ex:
             raise HomeAssistantError(ex) from ex
 
@@ -0,0 +1,178 @@
+"""Circuit breaker for the Porsche Connect API of an account."""
+
+from __future__ import annotations
+
+import logging
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+import httpx
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.exceptions import (
+    PorscheCaptchaRequiredError,
+    PorscheExceptionError,
+    PorscheWrongCredentialsError,
+)
+
+from .const import (
+    CIRCUIT_BREAKER_BACKOFF,
+    CIRCUIT_BREAKER_MAX_BACKOFF,
+    CIRCUIT_BREAKER_THRESHOLD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+STATES = [STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN]
+
+# Errors that say something about the backend rather than the request
+_BACKEND_ERROR_CODES = frozenset({423, 429})
+_AUTH_ERROR_CODES = frozenset({401})
+
+
+class PorscheCircuitOpenError(PorscheExceptionError):
+    """Raised instead of calling the API while the circuit is open."""
+
+    def __init__(self, retry_at: datetime | None) -> None:
+        """Initialise the error."""
+        super().__init__(
+            "CIRCUIT_OPEN",
+            f"Porsche Connect API unavailable, not retrying before {retry_at}",
+        )
+        self.retry_at = retry_at
+
+
+def _retry_after(exc: BaseException) -> timedelta | None:
+    """Return the Retry-After delay of the response that caused an error."""
+    cause = exc.__cause__ if isinstance(exc, PorscheExceptionError) else exc
+    if not isinstance(cause, httpx.HTTPStatusError):
+        return None
+    if (value := cause.response.headers.get("retry-after")) is None:
+        return None
+    try:
+        return timedelta(seconds=max(0, int(value)))
+    except ValueError:
+        pass
+    try:
+        return max(timedelta(0), parsedate_to_datetime(value) - dt_util.utcnow())
+    except (TypeError, ValueError):
+        return None
+
+
+class PorscheCircuitBreaker:
+    """Stop calling the API of an account while it keeps failing.
+
+    The circuit opens after a number of consecutive backend failures, or right
+    away on a response with a Retry-After header. While open, calls fail
+    without reaching the API. After the backoff, which grows exponentially
+    with jitter, a single trial call is let through to close it again.
+    Authentication errors do not count as failures but start a reauth flow,
+    as retrying them cannot succeed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        connection: Connection,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialise the circuit breaker."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.retry_at: datetime | None = None
+        self.last_error: str | None = None
+
+        self._on_change = on_change
+        self._trial_in_flight = False
+        connection.circuit_breaker = self
+
+    @callback
+    def async_before_call(self) -> None:
+        """Raise unless a call to the API may be made now."""
+        if self.state == STATE_CLOSED:
+            return
+        if self.state == STATE_OPEN:
+            if self.retry_at is not None and dt_util.utcnow() < self.retry_at:
+                raise PorscheCircuitOpenError(self.retry_at)
+            self._async_set_state(STATE_HALF_OPEN)
+        if self._trial_in_flight:
+            raise PorscheCircuitOpenError(self.retry_at)
+        self._trial_in_flight = True
+
+    @callback
+    def async_record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._trial_in_flight = False
+        self.failures = 0
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("Porsche Connect API recovered, closing circuit")
+            self.trips = 0
+            self.retry_at = None
+            self._async_set_state(STATE_CLOSED)
+
+    @callback
+    def async_record_failure(self, exc: BaseException) -> None:
+        """Count a failed call, opening the circuit when the backend is failing."""
+        self._trial_in_flight = False
+        if isinstance(exc, PorscheCircuitOpenError):
+            return
+        if (
+            isinstance(exc, (PorscheWrongCredentialsError, PorscheCaptchaRequiredError))
+            or getattr(exc, "code", None) in _AUTH_ERROR_CODES
+        ):
+            _LOGGER.warning("Porsche Connect rejected the credentials: %s", exc)
+            self.config_entry.async_start_reauth(self.hass)
+            return
+        if isinstance(exc, PorscheExceptionError):
+            code = getattr(exc, "code", None)
+            if not isinstance(code, int) or (
+                code < 500 and code not in _BACKEND_ERROR_CODES  # noqa: PLR2004
+            ):
+                # The request was refused, the backend itself is fine
+                return
+        elif not isinstance(exc, (httpx.TransportError, TimeoutError)):
+            return
+
+        self.failures += 1
+        self.last_error = repr(exc)
+        retry_after = _retry_after(exc)
+        if (
+            retry_after is None
+            and self.state == STATE_CLOSED
+            and self.failures < CIRCUIT_BREAKER_THRESHOLD
+        ):
+            return
+
+        self.trips += 1
+        if retry_after is None:
+            backoff = min(
+                CIRCUIT_BREAKER_BACKOFF * 2 ** (self.trips - 1),
+                CIRCUIT_BREAKER_MAX_BACKOFF,
+            )
+            # Spread the retries of accounts that failed at the same time
+            retry_after = backoff * random.uniform(0.5, 1)  # noqa: S311
+        self.retry_at = dt_util.utcnow() + retry_after
+        _LOGGER.warning(
+            "Porsche Connect API is failing (%s), pausing calls until %s",
+            exc,
+            self.retry_at,
+        )
+        self._async_set_state(STATE_OPEN)
+
+    @callback
+    def _async_set_state(self, state: str) -> None:
+        """Change the state and let the account entities know."""
+        self.state = state
+        if self._on_change is not None:
+            self._on_change()
@@ -0,0 +1,129 @@
+"""Remote command queue for Porsche Connect vehicles."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import COMMAND_QUEUE_DEPTH, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PorscheCommandQueueFullError(HomeAssistantError):
+    """Raised when a vehicle has too many remote commands waiting."""
+
+
+@dataclass
+class _Command:
+    """A queued remote command and the callers waiting for it."""
+
+    job: Callable[[], Awaitable[Any]]
+    queued_at: float
+    waiters: list[asyncio.Future[Any]] = field(default_factory=list)
+
+
+def _resolve(
+    command: _Command,
+    result: Any = None,  # noqa: ANN401
+    exception: Exception | None = None,
+) -> None:
+    """Hand the outcome of a command to its waiting callers."""
+    for future in command.waiters:
+        if future.done():
+            continue
+        if exception is not None:
+            future.set_exception(exception)
+            # Mark as retrieved in case the caller stopped waiting
+            future.exception()
+        else:
+            future.set_result(result)
+
+
+class PorscheCommandQueue:
+    """Run the remote commands of a vehicle one at a time.
+
+    Commands share a slot when a later one supersedes an earlier one, like
+    the values of a slider or turning a switch on and then off. A command
+    replaces the command waiting in its slot, and the callers of both get the
+    result of the last one. Commands for new slots are rejected while the
+    queue is full.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        max_depth: int = COMMAND_QUEUE_DEPTH,
+    ) -> None:
+        """Initialise the command queue."""
+        self.hass = hass
+        self.name = name
+        self.max_depth = max_depth
+        self.executed = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.queue_wait: float | None = None
+        self.execution_time: float | None = None
+
+        self._pending: OrderedDict[str, _Command] = OrderedDict()
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting to run."""
+        return len(self._pending)
+
+    async def async_submit(self, slot: str, job: Callable[[], Awaitable[Any]]) -> Any:  # noqa: ANN401
+        """Queue a command and wait for it, or for the command superseding it."""
+        future: asyncio.Future[Any] = self.hass.loop.create_future()
+
+        if (command := self._pending.get(slot)) is not None:
+            _LOGGER.debug("Coalescing %s command of %s", slot, self.name)
+            self.coalesced += 1
+            command.job = job
+        elif len(self._pending) >= self.max_depth:
+            self.rejected += 1
+            raise PorscheCommandQueueFullError(
+                translation_domain=DOMAIN,
+                translation_key="command_queue_full",
+                translation_placeholders={"vehicle": self.name},
+            )
+        else:
+            command = self._pending[slot] = _Command(job, time.monotonic())
+        command.waiters.append(future)
+
+        # A worker whose commands did not suspend may have finished eagerly
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_background_task(
+                self._async_run(), f"porscheconnect command queue {self.name}"
+            )
+        # A caller giving up must not cancel the command for the others
+        return await asyncio.shield(future)
+
+    async def _async_run(self) -> None:
+        """Run queued commands until the queue is empty."""
+        try:
+            while self._pending:
+                _, command = self._pending.popitem(last=False)
+                start = time.monotonic()
+                self.queue_wait = start - command.queued_at
+                try:
+                    result = await command.job()
+                except Exception as exc:  # noqa: BLE001
+                    _resolve(command, exception=exc)
+                else:
+                    _resolve(command, result=result)
+                finally:
+                    self.execution_time = time.monotonic() - start
+                    self.executed += 1
+        finally:
+            self._worker = None
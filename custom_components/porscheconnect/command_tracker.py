@@ -0,0 +1,178 @@
+"""Completion tracking of non-blocking Porsche Connect remote commands."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import httpx
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pyporscheconnectapi.remote_services import ExecutionState
+
+from .api import PendingRemoteServiceStatus, async_get_command_status
+from .const import (
+    COMMAND_STATUS_POLL_MAX,
+    COMMAND_STATUS_POLL_MIN,
+    COMMAND_STATUS_TIMEOUT,
+    EVENT_COMMAND_COMPLETED,
+)
+
+if TYPE_CHECKING:
+    from . import PorscheVehicleDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_PERFORMED = "performed"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUSES = [STATUS_PENDING, STATUS_PERFORMED, STATUS_ERROR, STATUS_TIMEOUT]
+
+# Weight of the latest completion time in the expected completion time
+_COMPLETION_SMOOTHING = 0.3
+_POLL_BACKOFF = 1.5
+
+
+@dataclass
+class _TrackedCommand:
+    """A command accepted by Porsche that has not completed yet."""
+
+    operation: str
+    status_id: str
+    started: datetime
+    started_monotonic: float
+    on_failure: list[Callable[[], None]] = field(default_factory=list)
+
+
+class PorscheCommandTracker:
+    """Track the completion of accepted remote commands in the background.
+
+    The status of a command is first polled after about half the time
+    commands of its kind took so far, and then with a growing interval. The
+    outcome is fired as an event and kept as the last command status.
+    """
+
+    def __init__(self, coordinator: PorscheVehicleDataUpdateCoordinator) -> None:
+        """Initialise the command tracker."""
+        self.coordinator = coordinator
+        self.last_command: str | None = None
+        self.status: str | None = None
+        self.status_id: str | None = None
+        self.started: datetime | None = None
+        self.duration: float | None = None
+
+        self._pending: dict[str, _TrackedCommand] = {}
+        self._completion_times: dict[str, float] = {}
+
+    @callback
+    def async_track(
+        self,
+        operation: str,
+        status: PendingRemoteServiceStatus,
+        on_failure: Callable[[], None] | None = None,
+    ) -> None:
+        """Track an accepted command until the vehicle has performed it."""
+        if (command := self._pending.get(status.status_id)) is None:
+            command = self._pending[status.status_id] = _TrackedCommand(
+                operation, status.status_id, dt_util.utcnow(), time.monotonic()
+            )
+            self.coordinator.config_entry.async_create_background_task(
+                self.coordinator.hass,
+                self._async_poll(command),
+                f"porscheconnect command {operation} {self.coordinator.vehicle.vin}",
+            )
+            self._async_set_status(command, STATUS_PENDING)
+        if on_failure is not None:
+            command.on_failure.append(on_failure)
+
+    def _first_delay(self, operation: str) -> float:
+        """Return how long to wait before the first status poll."""
+        delay = COMMAND_STATUS_POLL_MIN.total_seconds()
+        if (expected := self._completion_times.get(operation)) is not None:
+            delay = max(delay, expected / 2)
+        return min(delay, COMMAND_STATUS_POLL_MAX.total_seconds())
+
+    async def _async_poll(self, command: _TrackedCommand) -> None:
+        """Poll the status of a command until it completes or times out."""
+        deadline = command.started_monotonic + COMMAND_STATUS_TIMEOUT.total_seconds()
+        delay = self._first_delay(command.operation)
+        state = ExecutionState.UNKNOWN
+        try:
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                delay = min(
+                    delay * _POLL_BACKOFF, COMMAND_STATUS_POLL_MAX.total_seconds()
+                )
+                try:
+                    status = await async_get_command_status(
+                        self.coordinator.vehicle, command.status_id
+                    )
+                except (PorscheExceptionError, httpx.HTTPError, TimeoutError) as exc:
+                    _LOGGER.debug("Could not poll command status: %s", exc)
+                    continue
+                if (state := status.state) is not ExecutionState.UNKNOWN:
+                    break
+        except Exception:
+            _LOGGER.exception("Could not track command %s", command.operation)
+            state = ExecutionState.ERROR
+        finally:
+            # Never leave the command pending, also when tracking is cancelled
+            del self._pending[command.status_id]
+            self._async_complete(command, state)
+
+        if state is ExecutionState.PERFORMED:
+            await self.coordinator.async_request_refresh()
+
+    @callback
+    def _async_complete(self, command: _TrackedCommand, state: ExecutionState) -> None:
+        """Record the outcome of a command and undo it if it was not performed."""
+        if state is ExecutionState.PERFORMED:
+            elapsed = time.monotonic() - command.started_monotonic
+            expected = self._completion_times.get(command.operation, elapsed)
+            self._completion_times[command.operation] = (
+                1 - _COMPLETION_SMOOTHING
+            ) * expected + _COMPLETION_SMOOTHING * elapsed
+            self._async_set_status(command, STATUS_PERFORMED)
+            return
+
+        _LOGGER.error(
+            "Command %s of vehicle %s %s",
+            command.operation,
+            self.coordinator.vehicle.vin,
+            "failed" if state is ExecutionState.ERROR else "did not complete in time",
+        )
+        for on_failure in command.on_failure:
+            on_failure()
+        self._async_set_status(
+            command,
+            STATUS_ERROR if state is ExecutionState.ERROR else STATUS_TIMEOUT,
+        )
+
+    @callback
+    def _async_set_status(self, command: _TrackedCommand, status: str) -> None:
+        """Record the status of a command and let entities and automations know."""
+        self.last_command = command.operation
+        self.status = status
+        self.status_id = command.status_id
+        self.started = command.started
+        self.duration = None
+        if status != STATUS_PENDING:
+            self.duration = time.monotonic() - command.started_monotonic
+            self.coordinator.hass.bus.async_fire(
+                EVENT_COMMAND_COMPLETED,
+                {
+                    "vin": self.coordinator.vehicle.vin,
+                    "command": command.operation,
+                    "status": status,
+                    "status_id": command.status_id,
+                    "duration": self.duration,
+                },
+            )
+        self.coordinator.async_update_listeners()
@@ -11,10 +11,17 @@ from homeassistant.config_entries import (
     CONN_CLASS_CLOUD_POLL,
     SOURCE_REAUTH,
     SOURCE_RECONFIGURE,
+    ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import (
+    CONF_ACCESS_TOKEN,
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
 )
-from homeassistant.const import CONF_ACCESS_TOKEN, CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import callback
 from pyporscheconnectapi.connection import Connection
 from pyporscheconnectapi.exceptions import (
@@ -23,7 +30,23 @@ from pyporscheconnectapi.exceptions import (
     PorscheWrongCredentialsError,
 )
 
-from .const import DOMAIN
+from .const import (
+    CONF_DEDICATED_HTTP_CLIENT,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_FLEET_MODE,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_NON_BLOCKING_COMMANDS,
+    CONF_QUOTA_CAPACITY,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_DEDICATED_HTTP_CLIENT,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_FLEET_MODE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_NON_BLOCKING_COMMANDS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +106,12 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
     captcha = None
     state = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:  # noqa: ARG004
+        """Return the options flow for this handler."""
+        return PorscheConnectOptionsFlow()
+
     @callback
     def _get_entry_for_current_flow(self):
         """Return the existing entry for reauth/reconfigure flows."""
@@ -294,6 +323,90 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
+class PorscheConnectOptionsFlow(OptionsFlow):
+    """Handle Porsche Connect options."""
+
+    async def async_step_init(self, user_input=None) -> ConfigFlowResult:
+        """Manage the polling options."""
+        errors = {}
+        options = self.config_entry.options
+        if user_input is not None:
+            if (
+                user_input[CONF_FAST_SCAN_INTERVAL]
+                <= user_input[CONF_SCAN_INTERVAL]
+                <= user_input[CONF_SLOW_SCAN_INTERVAL]
+            ):
+                return self.async_create_entry(data=user_input)
+            errors["base"] = "invalid_scan_intervals"
+            # Show the form again with the values entered
+            options = user_input
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_SCAN_INTERVAL,
+                            self.config_entry.data.get(
+                                CONF_SCAN_INTERVAL,
+                                DEFAULT_SCAN_INTERVAL,
+                            ),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60)),
+                    vol.Optional(
+                        CONF_FAST_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_FAST_SCAN_INTERVAL,
+                            DEFAULT_FAST_SCAN_INTERVAL,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60)),
+                    vol.Optional(
+                        CONF_SLOW_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_SLOW_SCAN_INTERVAL,
+                            DEFAULT_SLOW_SCAN_INTERVAL,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60)),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_NON_BLOCKING_COMMANDS,
+                        default=options.get(
+                            CONF_NON_BLOCKING_COMMANDS,
+                            DEFAULT_NON_BLOCKING_COMMANDS,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DEDICATED_HTTP_CLIENT,
+                        default=options.get(
+                            CONF_DEDICATED_HTTP_CLIENT,
+                            DEFAULT_DEDICATED_HTTP_CLIENT,
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_FLEET_MODE,
+                        default=options.get(CONF_FLEET_MODE, DEFAULT_FLEET_MODE),
+                    ): bool,
+                    # Left empty, the quota is sized by the number of vehicles
+                    vol.Optional(
+                        CONF_QUOTA_CAPACITY,
+                        description={
+                            "suggested_value": options.get(CONF_QUOTA_CAPACITY),
+                        },
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                },
+            ),
+            errors=errors,
+        )
+
+
 class InvalidAuth(exceptions.HomeAssistantError):
     """Error to indicate there is invalid auth."""
 
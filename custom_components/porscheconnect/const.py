@@ -1,8 +1,81 @@
 """Constants for the Porsche Connect integration."""
 
+from datetime import timedelta
+
 DOMAIN = "porscheconnect"
 DEFAULT_SCAN_INTERVAL = 1920
 
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"
+DEFAULT_FAST_SCAN_INTERVAL = 300
+CONF_SLOW_SCAN_INTERVAL = "slow_scan_interval"
+DEFAULT_SLOW_SCAN_INTERVAL = 14400
+
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+CONF_NON_BLOCKING_COMMANDS = "non_blocking_commands"
+DEFAULT_NON_BLOCKING_COMMANDS = False
+CONF_DEDICATED_HTTP_CLIENT = "dedicated_http_client"
+DEFAULT_DEDICATED_HTTP_CLIENT = False
+CONF_FLEET_MODE = "fleet_mode"
+DEFAULT_FLEET_MODE = False
+# API calls an account may make per refill period
+CONF_QUOTA_CAPACITY = "quota_capacity"
+DEFAULT_QUOTA_CAPACITY = 300
+
+HTTP_MAX_CONNECTIONS = 4
+HTTP_KEEPALIVE_EXPIRY = timedelta(minutes=5)
+HTTP_CONNECT_TIMEOUT = timedelta(seconds=10)
+HTTP_READ_TIMEOUT = timedelta(seconds=90)
+
+METRICS_SAMPLES = 100
+POLL_TRACES = 20
+
+# Vehicles set up and polled together in fleet mode
+FLEET_PAGE_SIZE = 25
+# Per vehicle history kept in fleet mode
+FLEET_METRICS_SAMPLES = 20
+FLEET_POLL_TRACES = 3
+
+TOKEN_REFRESH_AHEAD = timedelta(minutes=5)
+TOKEN_REFRESH_RETRY = timedelta(minutes=1)
+TOKEN_SAVE_DELAY = timedelta(minutes=1)
+
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_BACKOFF = timedelta(seconds=30)
+CIRCUIT_BREAKER_MAX_BACKOFF = timedelta(minutes=30)
+
+# Calls per vehicle the quota grows to when it is not configured
+QUOTA_CAPACITY_PER_VEHICLE = 24
+QUOTA_REFILL_PERIOD = timedelta(hours=1)
+QUOTA_MAX_WAIT = timedelta(seconds=30)
+QUOTA_SAVE_DELAY = timedelta(minutes=1)
+QUOTA_UPDATE_COOLDOWN = timedelta(seconds=10)
+
+COMMAND_QUEUE_DEPTH = 5
+# Status polling of commands completing in the background
+COMMAND_STATUS_POLL_MIN = timedelta(seconds=1)
+COMMAND_STATUS_POLL_MAX = timedelta(seconds=15)
+COMMAND_STATUS_TIMEOUT = timedelta(seconds=240)
+# Delays between the fetches confirming the state requested by a command,
+# which is not rolled back while the command may still be performed
+COMMAND_CONFIRM_DELAYS = (5, 10, 20, 40)
+COMMAND_CONFIRM_DEADLINE = COMMAND_STATUS_TIMEOUT + COMMAND_STATUS_POLL_MAX
+EVENT_COMMAND_COMPLETED = f"{DOMAIN}_command_completed"
+
+SNAPSHOT_SAVE_DELAY = timedelta(minutes=5)
+
+PICTURE_LOCATIONS_TTL = timedelta(hours=24)
+SIGNAL_PICTURE_LOCATIONS_UPDATED = f"{DOMAIN}_picture_locations_updated_{{}}"
+
+IMAGE_FETCH_TIMEOUT = timedelta(seconds=10)
+IMAGE_MEMORY_CACHE_SIZE = 40
+IMAGE_REVALIDATE_INTERVAL = timedelta(hours=1)
+IMAGE_VARIANT_WIDTHS = (256, 512, 1024)
+# Width of the variant shown by the frontend, which does not ask for a width
+IMAGE_DEFAULT_WIDTH = 512
+IMAGE_WEBP_QUALITY = 85
+
 NAME = "porscheconnect"
 DOMAIN_DATA = f"{DOMAIN}_data"
 VERSION = "0.1.10"
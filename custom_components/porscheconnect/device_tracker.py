@@ -15,6 +15,8 @@ from pyporscheconnectapi.vehicle import PorscheVehicle
 from . import (
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
 )
 from .const import DOMAIN
 
@@ -27,18 +29,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the device tracker from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
-    entities: list[PorscheDeviceTracker] = []
 
-    for vehicle in coordinator.vehicles:
-        if not vehicle.privacy_mode:
-            entities.append(PorscheDeviceTracker(coordinator, vehicle))
-        else:
+    def vehicle_entities(
+        coordinator: PorscheVehicleDataUpdateCoordinator,
+    ) -> list[PorscheDeviceTracker]:
+        if coordinator.vehicle.privacy_mode:
             _LOGGER.info("Vehicle is in privacy mode with location tracking disabled")
+            return []
+        return [PorscheDeviceTracker(coordinator, coordinator.vehicle)]
 
-    async_add_entities(entities)
+    await async_add_vehicle_entities(account, async_add_entities, vehicle_entities)
 
 
 class PorscheDeviceTracker(PorscheBaseEntity, TrackerEntity):
@@ -46,11 +49,11 @@ class PorscheDeviceTracker(PorscheBaseEntity, TrackerEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
     ) -> None:
         """Initialize the device tracker."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, ("GPS_LOCATION", "BATTERY_LEVEL"))
 
         self._attr_unique_id = vehicle.vin
         if (
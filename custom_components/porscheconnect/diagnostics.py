@@ -0,0 +1,118 @@
+"""Diagnostics support for Porsche Connect."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ACCESS_TOKEN, CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from . import PorscheConnectDataUpdateCoordinator, PorscheVehicleDataUpdateCoordinator
+from .const import DOMAIN
+
+TO_REDACT = {
+    CONF_ACCESS_TOKEN,
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    "refresh_token",
+    "id_token",
+    "vin",
+    "name",
+    "customName",
+    "licensePlate",
+    "location",
+    "latitude",
+    "longitude",
+    "firstName",
+    "lastName",
+}
+
+
+def _account_diagnostics(account: PorscheConnectDataUpdateCoordinator) -> dict:
+    """Return the state of the API connection of an account."""
+    circuit_breaker = account.circuit_breaker
+    rate_limiter = account.rate_limiter
+    api_metrics = account.api_metrics
+    return {
+        "token_issued": account.token_manager.issued_at,
+        "token_refresh_duration": account.token_manager.refresh_latency,
+        "circuit_breaker": {
+            "state": circuit_breaker.state,
+            "failures": circuit_breaker.failures,
+            "trips": circuit_breaker.trips,
+            "retry_at": circuit_breaker.retry_at,
+            "last_error": circuit_breaker.last_error,
+        },
+        "quota": {
+            "remaining": rate_limiter.remaining,
+            "capacity": rate_limiter.capacity,
+            "calls": dict(rate_limiter.calls),
+            "throttled": dict(rate_limiter.throttled),
+        },
+        "api_calls": {
+            "calls": dict(api_metrics.calls),
+            "errors": dict(api_metrics.errors),
+            "payload_bytes": dict(api_metrics.payload_bytes),
+            "latency_ms": api_metrics.latency_by_endpoint(),
+            "last_success": api_metrics.last_success,
+        },
+        "http": account.http_timings.as_dict(),
+    }
+
+
+def _vehicle_diagnostics(coordinator: PorscheVehicleDataUpdateCoordinator) -> dict:
+    """Return the recent polls and last overview of a vehicle."""
+    # Another config entry may be polling the vehicle for this one
+    primary = coordinator.hub.primary(coordinator)
+    durations = primary.poll_metrics.durations
+    return {
+        "vin": coordinator.vehicle.vin,
+        "model_name": coordinator.vehicle.data.get("modelName"),
+        "polled_by_other_entry": primary is not coordinator,
+        "update_interval": primary.update_interval,
+        "interval_reason": primary.scheduler.reason,
+        "last_update_success": coordinator.last_update_success,
+        "fetch_plan": list(primary.fetch_plan),
+        "poll_duration": {
+            "last": durations.last,
+            "p95": durations.p95,
+            "polls": durations.count,
+            "failures": primary.poll_metrics.failures,
+        },
+        "poll_traces": [trace.as_dict() for trace in primary.poll_traces],
+        "last_overview": primary.vehicle.status,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return async_redact_data(
+        {
+            "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+            "account": _account_diagnostics(account),
+            "vehicles": [
+                _vehicle_diagnostics(coordinator)
+                for coordinator in account.vehicle_coordinators.values()
+            ],
+        },
+        TO_REDACT,
+    )
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a vehicle or the account device."""
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    for domain, identifier in device.identifiers:
+        if domain != DOMAIN:
+            continue
+        if (coordinator := account.vehicle_coordinators.get(identifier)) is not None:
+            return async_redact_data(_vehicle_diagnostics(coordinator), TO_REDACT)
+    return async_redact_data(_account_diagnostics(account), TO_REDACT)
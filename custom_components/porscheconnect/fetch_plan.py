@@ -0,0 +1,56 @@
+"""Measurement fetch plan for Porsche Connect vehicles."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from pyporscheconnectapi.const import MEASUREMENTS
+
+# Read by the integration itself regardless of which entities are enabled:
+# privacy and remote access decide availability, the rest drive the polling
+# schedule.
+BASE_NODES = frozenset(
+    {
+        "CHARGING_SUMMARY",
+        "CLIMATIZER_STATE",
+        "GLOBAL_PRIVACY_MODE",
+        "GPS_LOCATION",
+        "REMOTE_ACCESS_AUTHORIZATION",
+    }
+)
+
+# Nodes the library reads while parsing another node
+NODE_DEPENDENCIES: dict[str, frozenset[str]] = {
+    "CHARGING_SUMMARY": frozenset({"CHARGING_SETTINGS", "DEPARTURES"}),
+}
+
+LOCATION_NODES = frozenset({"GPS_LOCATION"})
+
+
+def with_dependencies(nodes: Iterable[str]) -> set[str]:
+    """Return the measurement nodes together with the nodes they depend on."""
+    nodes = set(nodes)
+    for node in list(nodes):
+        nodes.update(NODE_DEPENDENCIES.get(node, ()))
+    return nodes
+
+
+def build_fetch_plan(
+    contexts: Iterable[frozenset[str] | None],
+    *,
+    privacy_mode: bool,
+) -> tuple[str, ...]:
+    """Return the measurement nodes to fetch for the given listener contexts.
+
+    Location nodes are left out while the vehicle is in privacy mode, as the
+    API does not report them then.
+    """
+    nodes = set(BASE_NODES)
+    for context in contexts:
+        if context:
+            nodes.update(context)
+    nodes = with_dependencies(nodes)
+    if privacy_mode:
+        nodes -= LOCATION_NODES
+
+    return tuple(node for node in MEASUREMENTS if node in nodes)
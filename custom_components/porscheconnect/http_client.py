@@ -0,0 +1,160 @@
+"""Dedicated HTTP client for the Porsche Connect API of an account."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+from homeassistant.core import HomeAssistant
+from homeassistant.util.ssl import get_default_context
+from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.const import API_BASE_URL, AUTHORIZATION_SERVER, USER_AGENT
+
+from .const import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_READ_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hosts the integration talks to, in the order they are needed at startup
+PREWARM_URLS = (f"https://{AUTHORIZATION_SERVER}", API_BASE_URL)
+
+_CONNECT = "connection.connect_tcp"
+_START_TLS = "connection.start_tls"
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Create the client, with HTTP/2 when the h2 package is available."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        http2 = False
+    else:
+        http2 = True
+
+    return httpx.AsyncClient(
+        http2=http2,
+        # Shared with the rest of Home Assistant, the CA bundle is loaded once
+        verify=get_default_context(),
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY.total_seconds(),
+        ),
+        timeout=httpx.Timeout(
+            HTTP_READ_TIMEOUT.total_seconds(),
+            connect=HTTP_CONNECT_TIMEOUT.total_seconds(),
+        ),
+    )
+
+
+async def async_create_http_client(hass: HomeAssistant) -> httpx.AsyncClient:
+    """Create an HTTP client used by a single account.
+
+    Unlike the client shared by Home Assistant, its connections are kept open
+    between polls and multiplexed over HTTP/2 when possible. Responses are
+    compressed with every encoding httpx can decode. The caller closes it.
+    """
+    # Importing h2 and building the client touch the disk
+    return await hass.async_add_executor_job(_create_http_client)
+
+
+async def async_prewarm(client: httpx.AsyncClient, timings: PorscheHttpTimings) -> None:
+    """Open the connections to the identity provider and the API ahead of use."""
+    for url in PREWARM_URLS:
+        try:
+            await client.head(url, extensions={"trace": timings.trace()})
+        except httpx.HTTPError as exc:
+            _LOGGER.debug("Could not open a connection to %s: %s", url, exc)
+        else:
+            _LOGGER.debug("Opened a connection to %s", url)
+
+
+class PorscheHttpTimings:
+    """Connect, TLS and first byte times of the API calls of an account.
+
+    The times are taken from the trace of each request. A request on a kept
+    open connection has no connect or TLS time, so the share of new
+    connections shows how well connections are reused.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """Initialise the timings."""
+        self.requests = 0
+        self.connections = 0
+        self.http_version: str | None = None
+
+        self._totals: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+        connection.timings = self
+
+    @property
+    def connect_time(self) -> float | None:
+        """Return the mean time to open a TCP connection, in milliseconds."""
+        return self._mean(_CONNECT)
+
+    @property
+    def tls_time(self) -> float | None:
+        """Return the mean time of a TLS handshake, in milliseconds."""
+        return self._mean(_START_TLS)
+
+    @property
+    def first_byte_time(self) -> float | None:
+        """Return the mean time from request to response headers, in milliseconds."""
+        return self._mean("first_byte")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings as state attributes."""
+        return {
+            "requests": self.requests,
+            "new_connections": self.connections,
+            "connect_time": self.connect_time,
+            "tls_time": self.tls_time,
+            "http_version": self.http_version,
+        }
+
+    def trace(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """Return the httpcore trace callback measuring a single request."""
+        started: dict[str, float] = {}
+
+        async def _trace(event: str, info: dict[str, Any]) -> None:
+            name, _, phase = event.rpartition(".")
+            now = time.monotonic()
+            if phase == "started":
+                started[name] = now
+                return
+            if phase != "complete" or name not in started:
+                return
+
+            protocol, _, step = name.partition(".")
+            if name in (_CONNECT, _START_TLS):
+                self._add(name, now - started[name])
+                if name == _CONNECT:
+                    self.connections += 1
+            elif step == "send_request_headers":
+                self.requests += 1
+                self.http_version = "HTTP/2" if protocol == "http2" else "HTTP/1.1"
+            elif step == "receive_response_headers":
+                request = started.get(f"{protocol}.send_request_headers")
+                if request is not None:
+                    self._add("first_byte", now - request)
+
+        return _trace
+
+    def _add(self, name: str, seconds: float) -> None:
+        """Add a measured time."""
+        self._totals[name] = self._totals.get(name, 0.0) + seconds
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def _mean(self, name: str) -> float | None:
+        """Return the mean of a measured time in milliseconds."""
+        if not (count := self._counts.get(name)):
+            return None
+        return round(self._totals[name] / count * 1000, 1)
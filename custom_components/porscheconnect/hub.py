@@ -0,0 +1,155 @@
+"""Vehicle hub shared by the Porsche Connect config entries."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from pyporscheconnectapi.const import MEASUREMENTS
+
+from .const import DOMAIN_DATA
+
+if TYPE_CHECKING:
+    from . import PorscheVehicleDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+_MEASUREMENT_NODES = frozenset(MEASUREMENTS)
+
+
+def _measurements(coordinator: PorscheVehicleDataUpdateCoordinator) -> dict[str, Any]:
+    """Return the measurement nodes of the vehicle data of a coordinator."""
+    return {
+        node: value
+        for node, value in coordinator.vehicle.data.items()
+        if node in _MEASUREMENT_NODES
+    }
+
+
+def async_get_vehicle_hub(hass: HomeAssistant) -> PorscheVehicleHub:
+    """Return the vehicle hub shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN_DATA, {})
+    if (hub := domain_data.get("vehicle_hub")) is None:
+        hub = domain_data["vehicle_hub"] = PorscheVehicleHub()
+    return hub
+
+
+class PorscheVehicleHub:
+    """Poll each vehicle once, no matter how many config entries show it.
+
+    The first coordinator registered for a VIN polls it for every entry,
+    fetching the measurements read by the entities of all of them, and fans
+    the result out to the other coordinators of the VIN. When it goes away,
+    the next one takes over. Polls of different config entries are spread
+    over the polling interval, so accounts set up together do not poll
+    together. Within the share of an entry, vehicles are spread by their
+    poll slot.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the vehicle hub."""
+        self.fanned_out = 0
+
+        self._coordinators: dict[str, list[PorscheVehicleDataUpdateCoordinator]] = {}
+        self._entry_ids: list[str] = []
+
+    @callback
+    def async_register(self, coordinator: PorscheVehicleDataUpdateCoordinator) -> None:
+        """Add the coordinator of a vehicle of a config entry."""
+        entry_id = coordinator.config_entry.entry_id
+        if entry_id not in self._entry_ids:
+            self._entry_ids.append(entry_id)
+
+        vin = coordinator.vehicle.vin
+        previous = self._coordinators.get(vin, [])
+        # Left behind by an earlier setup of the same entry
+        coordinators = [c for c in previous if c.config_entry.entry_id != entry_id]
+        coordinators.append(coordinator)
+        self._coordinators[vin] = coordinators
+        if coordinators[0] is not coordinator:
+            _LOGGER.debug("Vehicle %s is already polled by another config entry", vin)
+            coordinator.update_interval = None
+            if previous and previous[0] is not coordinators[0]:
+                self._async_hand_over(coordinators[0])
+
+    @callback
+    def async_unregister(
+        self, coordinator: PorscheVehicleDataUpdateCoordinator
+    ) -> None:
+        """Remove the coordinator, handing over polling if it was polling."""
+        vin = coordinator.vehicle.vin
+        coordinators = self._coordinators.get(vin, [])
+        if coordinator not in coordinators:
+            return
+
+        was_primary = coordinators[0] is coordinator
+        coordinators.remove(coordinator)
+        if not coordinators:
+            del self._coordinators[vin]
+        elif was_primary:
+            self._async_hand_over(coordinators[0])
+
+        entry_id = coordinator.config_entry.entry_id
+        if not any(
+            c.config_entry.entry_id == entry_id
+            for coordinators in self._coordinators.values()
+            for c in coordinators
+        ):
+            self._entry_ids.remove(entry_id)
+
+    @callback
+    def _async_hand_over(self, primary: PorscheVehicleDataUpdateCoordinator) -> None:
+        """Let a coordinator take over polling its vehicle."""
+        _LOGGER.debug("Handing over polling of vehicle %s", primary.vehicle.vin)
+        primary.update_interval = primary.scheduler.next_interval(primary.vehicle)
+        primary.hass.async_create_task(primary.async_request_refresh())
+
+    def primary(
+        self, coordinator: PorscheVehicleDataUpdateCoordinator
+    ) -> PorscheVehicleDataUpdateCoordinator:
+        """Return the coordinator polling the vehicle of the coordinator."""
+        coordinators = self._coordinators.get(coordinator.vehicle.vin)
+        return coordinators[0] if coordinators else coordinator
+
+    def listener_contexts(
+        self, coordinator: PorscheVehicleDataUpdateCoordinator
+    ) -> Iterator[frozenset[str] | None]:
+        """Return the listener contexts of every coordinator of the vehicle."""
+        for other in self._coordinators.get(coordinator.vehicle.vin, [coordinator]):
+            for _, context in other._listeners.values():  # noqa: SLF001
+                yield context
+
+    def stagger_offset(
+        self, coordinator: PorscheVehicleDataUpdateCoordinator
+    ) -> timedelta:
+        """Return how far to shift the polls of the vehicle of a coordinator."""
+        entry_id = coordinator.config_entry.entry_id
+        if entry_id not in self._entry_ids or coordinator.update_interval is None:
+            return timedelta(0)
+        slot = self._entry_ids.index(entry_id) + coordinator.poll_slot
+        return coordinator.update_interval * slot / len(self._entry_ids)
+
+    @callback
+    def async_fan_out(self, primary: PorscheVehicleDataUpdateCoordinator) -> None:
+        """Hand the measurements polled by the primary to the other coordinators."""
+        measurements = _measurements(primary)
+        for coordinator in self._coordinators.get(primary.vehicle.vin, [])[1:]:
+            # Keep the name and model the other account knows the vehicle by
+            coordinator.vehicle.data = coordinator.vehicle.data | measurements
+            coordinator.async_set_updated_data(coordinator.vehicle.data)
+            self.fanned_out += 1
+
+    @callback
+    def async_copy_from_primary(
+        self, coordinator: PorscheVehicleDataUpdateCoordinator
+    ) -> None:
+        """Copy the last measurements polled by the primary to a coordinator."""
+        primary = self.primary(coordinator)
+        # The vehicle never fetches an overview of its own, so it also takes
+        # the base data it lacks, such as the name, from the primary
+        coordinator.vehicle.data = (
+            primary.vehicle.data | coordinator.vehicle.data | _measurements(primary)
+        )
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from homeassistant.components.image import Image, ImageEntity, ImageEntityDescription
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.image import ImageEntity, ImageEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
@@ -14,10 +17,23 @@ from . import (
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
     PorscheVehicle,
+    PorscheVehicleDataUpdateCoordinator,
+)
+from .const import (
+    DOMAIN,
+    DOMAIN_DATA,
+    IMAGE_DEFAULT_WIDTH,
+    SIGNAL_PICTURE_LOCATIONS_UPDATED,
+)
+from .image_cache import (
+    CONTENT_TYPE_PNG,
+    CONTENT_TYPE_WEBP,
+    CachedImage,
+    async_get_image_cache,
 )
-from .const import DOMAIN
 
-CONTENT_TYPE = "image/png"
+CONTENT_TYPE = CONTENT_TYPE_PNG
+IMAGE_VIEW_URL = f"/api/{DOMAIN}/image/{{entity_id}}"
 
 
 @dataclass(frozen=True)
@@ -67,18 +83,95 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Porsche Connect image entity from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
 
-    entities = [
-        PorscheImage(hass, coordinator, vehicle, description)
-        for vehicle in coordinator.vehicles
-        for description in IMAGE_TYPES
-        if description.view in vehicle.picture_locations
-    ]
-
-    async_add_entities(entities)
+    entities: dict[tuple[str, str], PorscheImage] = {}
+
+    @callback
+    def async_update_picture_locations() -> None:
+        """Add image entities for new picture locations and update the others."""
+        new_entities = []
+        for coordinator in account.vehicle_coordinators.values():
+            picture_locations = coordinator.vehicle.picture_locations
+            for description in IMAGE_TYPES:
+                if description.view not in picture_locations:
+                    continue
+                key = (coordinator.vehicle.vin, description.view)
+                if (entity := entities.get(key)) is None:
+                    entities[key] = entity = PorscheImage(
+                        hass, coordinator, coordinator.vehicle, description
+                    )
+                    new_entities.append(entity)
+                else:
+                    entity.async_update_image_url()
+
+        async_add_entities(new_entities)
+
+    # Picture locations are fetched in the background once setup completes
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_PICTURE_LOCATIONS_UPDATED.format(config_entry.entry_id),
+            async_update_picture_locations,
+        )
+    )
+    async_update_picture_locations()
+
+
+class PorscheImageView(HomeAssistantView):
+    """Serve vehicle images in the smallest variant the client accepts.
+
+    Clients may pass a width to get an image at least that wide, and get WebP
+    if their Accept header allows it. The entity picture asks for the width
+    of a dashboard tile.
+    """
+
+    url = IMAGE_VIEW_URL
+    name = f"api:{DOMAIN}:image"
+    requires_auth = False
+
+    def __init__(self) -> None:
+        """Initialise the image view."""
+        self.entities: dict[str, PorscheImage] = {}
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        """Return an image variant of the entity."""
+        if (entity := self.entities.get(entity_id)) is None:
+            raise web.HTTPNotFound
+        if not (
+            request[KEY_AUTHENTICATED]
+            or request.query.get("token") in entity.access_tokens
+        ):
+            raise web.HTTPForbidden
+
+        try:
+            width = int(request.query["width"]) if "width" in request.query else None
+        except ValueError:
+            raise web.HTTPBadRequest from None
+
+        content_types: tuple[str, ...] = (CONTENT_TYPE_PNG,)
+        if CONTENT_TYPE_WEBP in request.headers.get(hdrs.ACCEPT, ""):
+            content_types = (CONTENT_TYPE_WEBP, CONTENT_TYPE_PNG)
+
+        if (image := await entity.async_image_variant(width, content_types)) is None:
+            raise web.HTTPInternalServerError
+
+        return web.Response(
+            body=image.content,
+            content_type=image.content_type,
+            headers={hdrs.VARY: hdrs.ACCEPT},
+        )
+
+
+def async_get_image_view(hass: HomeAssistant) -> PorscheImageView:
+    """Return the image view, registering it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN_DATA, {})
+    if (view := domain_data.get("image_view")) is None:
+        view = domain_data["image_view"] = PorscheImageView()
+        hass.http.register_view(view)
+    return view
 
 
 class PorscheImage(PorscheBaseEntity, ImageEntity):
@@ -89,12 +182,12 @@ class PorscheImage(PorscheBaseEntity, ImageEntity):
     def __init__(
         self,
         hass: HomeAssistant,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
         description: PorscheImageEntityDescription,
     ) -> None:
         """Initialize the image entity."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, ())
         ImageEntity.__init__(self, hass)
 
         self.entity_description = description
@@ -102,17 +195,57 @@ class PorscheImage(PorscheBaseEntity, ImageEntity):
         self._attr_content_type = CONTENT_TYPE
         self._attr_unique_id = f'{vehicle.data["name"]}-{description.key}'
         self._attr_image_url = vehicle.picture_locations[description.view]
+        self._image_cache = async_get_image_cache(hass)
+        self._image_digest: str | None = None
 
     async def async_added_to_hass(self):
         """Set the update time."""
         self._attr_image_last_updated = dt_util.utcnow()
 
-    async def _async_load_image_from_url(self, url: str) -> Image | None:
-        """Load an image by url."""
-        if response := await self._fetch_url(url):
-            image_data = response.content
-            return Image(
-                content=image_data,
-                content_type=CONTENT_TYPE,
+        view = async_get_image_view(self.hass)
+        view.entities[self.entity_id] = self
+        self.async_on_remove(lambda: view.entities.pop(self.entity_id, None))
+
+    @property
+    def entity_picture(self) -> str:
+        """Return the URL of the image variant shown by the frontend."""
+        url = IMAGE_VIEW_URL.format(entity_id=self.entity_id)
+        return f"{url}?width={IMAGE_DEFAULT_WIDTH}&token={self.access_tokens[-1]}"
+
+    @callback
+    def async_update_image_url(self) -> None:
+        """Pick up a changed picture location of the vehicle."""
+        url = self.vehicle.picture_locations[self.entity_description.view]
+        if url == self._attr_image_url:
+            return
+        self._attr_image_url = url
+        if self.hass is not None:
+            # Marks the image as updated if the new URL has different bytes
+            self.hass.async_create_background_task(
+                self.async_image(), f"porscheconnect image {self.entity_id}"
             )
-        return None
+
+    async def async_image(self) -> bytes | None:
+        """Return the original image."""
+        if (image := await self.async_image_variant()) is None:
+            return None
+        self._attr_content_type = image.content_type
+        return image.content
+
+    async def async_image_variant(
+        self,
+        width: int | None = None,
+        content_types: tuple[str, ...] = (CONTENT_TYPE_PNG,),
+    ) -> CachedImage | None:
+        """Return an image variant from the shared image cache."""
+        image = await self._image_cache.async_get_variant(
+            self._attr_image_url, width, content_types
+        )
+        if image is None:
+            return None
+
+        if self._image_digest is not None and image.digest != self._image_digest:
+            self._attr_image_last_updated = dt_util.utcnow()
+            self.async_write_ha_state()
+        self._image_digest = image.digest
+        return image
@@ -0,0 +1,360 @@
+"""Shared cache for Porsche Connect vehicle images."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    DOMAIN,
+    DOMAIN_DATA,
+    IMAGE_FETCH_TIMEOUT,
+    IMAGE_MEMORY_CACHE_SIZE,
+    IMAGE_REVALIDATE_INTERVAL,
+    IMAGE_VARIANT_WIDTHS,
+    IMAGE_WEBP_QUALITY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE_PNG = "image/png"
+CONTENT_TYPE_WEBP = "image/webp"
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    """An image with its content digest."""
+
+    content: bytes
+    content_type: str
+    digest: str
+
+
+@dataclass
+class _CacheEntry:
+    """Validators and content digest of a cached image URL."""
+
+    digest: str
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def _variant_name(digest: str, width: int | None, content_type: str) -> str:
+    """Return the file name of a variant of an image."""
+    extension = "webp" if content_type == CONTENT_TYPE_WEBP else "png"
+    return f"{digest}-{width or 'full'}.{extension}"
+
+
+def async_get_image_cache(hass: HomeAssistant) -> PorscheImageCache:
+    """Return the image cache shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN_DATA, {})
+    if (cache := domain_data.get("image_cache")) is None:
+        cache = domain_data["image_cache"] = PorscheImageCache(hass)
+    return cache
+
+
+class PorscheImageCache:
+    """Cache vehicle images on disk with a bounded in-memory LRU in front.
+
+    Image bytes are stored under the hash of their content, so identical
+    images are stored once no matter how many cars or URLs refer to them.
+    URLs are keyed by their hash and revalidated with the ETag and
+    Last-Modified validators of the last response. Width bounded PNG and
+    WebP variants are generated once per image in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the image cache."""
+        self.hass = hass
+        self.hits = 0
+        self.revalidations = 0
+        self.downloads = 0
+
+        self._path = Path(hass.config.path(STORAGE_DIR, DOMAIN, "images"))
+        self._entries: dict[str, _CacheEntry] = {}
+        self._checked: dict[str, float] = {}
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[CachedImage | None]] = {}
+        self._variant_tasks: dict[str, asyncio.Task[None]] = {}
+
+    async def async_get(self, url: str) -> CachedImage | None:
+        """Return the image at the URL, downloading it only when it changed."""
+        # A finished fetch stays listed until its done callback has run
+        if (task := self._in_flight.get(url)) is None or task.done():
+            task = self._in_flight[url] = self.hass.async_create_task(
+                self._async_get(url), "porscheconnect image fetch"
+            )
+
+            def done(task: asyncio.Task[CachedImage | None]) -> None:
+                if self._in_flight.get(url) is task:
+                    del self._in_flight[url]
+                if not task.cancelled():
+                    # Retrieved here in case every caller was cancelled meanwhile
+                    task.exception()
+
+            task.add_done_callback(done)
+        # Callers that got cancelled must not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def async_get_variant(
+        self,
+        url: str,
+        width: int | None = None,
+        content_types: tuple[str, ...] = (CONTENT_TYPE_PNG,),
+    ) -> CachedImage | None:
+        """Return the smallest variant of the image the client can accept.
+
+        The variant is at least the requested width, or full size if no width
+        is given. Content types are in order of preference, the original image
+        is returned if no variant fits.
+        """
+        if (image := await self.async_get(url)) is None:
+            return None
+
+        bucket = None
+        if width is not None:
+            bucket = next((w for w in IMAGE_VARIANT_WIDTHS if w >= width), None)
+
+        candidates = [
+            (variant_width, content_type)
+            for variant_width in dict.fromkeys((bucket, None))
+            for content_type in content_types
+            if (variant_width, content_type) != (None, CONTENT_TYPE_PNG)
+        ]
+        if not candidates:
+            return image
+
+        if (task := self._variant_tasks.get(image.digest)) is not None:
+            # Do not read variants that are still being written
+            await asyncio.shield(task)
+        if (variant := await self._async_read_variant(image, candidates)) is None:
+            await self._async_ensure_variants(image)
+            variant = await self._async_read_variant(image, candidates)
+        return variant or image
+
+    async def _async_read_variant(
+        self,
+        image: CachedImage,
+        candidates: list[tuple[int | None, str]],
+    ) -> CachedImage | None:
+        """Return the first candidate variant of an image that was generated."""
+        for variant_width, content_type in candidates:
+            name = _variant_name(image.digest, variant_width, content_type)
+            if (content := await self._async_read(name)) is not None:
+                return CachedImage(content, content_type, image.digest)
+        return None
+
+    async def _async_ensure_variants(self, image: CachedImage) -> None:
+        """Generate the variants of an image unless they are on disk."""
+        digest = image.digest
+        # A finished generation stays listed until its done callback has run
+        if (task := self._variant_tasks.get(digest)) is None or task.done():
+            task = self._variant_tasks[digest] = self.hass.async_create_background_task(
+                self._async_generate_variants(image),
+                f"porscheconnect image variants {digest}",
+            )
+
+            def done(task: asyncio.Task[None]) -> None:
+                # Variants are read from disk once generated, and a failed
+                # generation is tried again on the next request
+                if self._variant_tasks.get(digest) is task:
+                    del self._variant_tasks[digest]
+
+            task.add_done_callback(done)
+        await asyncio.shield(task)
+
+    async def _async_generate_variants(self, image: CachedImage) -> None:
+        """Generate and store the variants of an image in the executor."""
+        await self.hass.async_add_executor_job(
+            self._generate_variants, image.digest, image.content
+        )
+
+    async def _async_get(self, url: str) -> CachedImage | None:
+        """Return the cached image, revalidating it when it is due."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        headers = {}
+        if (cached := await self._async_load(key)) is not None:
+            checked = self._checked.get(key)
+            if (
+                checked is not None
+                and time.monotonic() - checked
+                < IMAGE_REVALIDATE_INTERVAL.total_seconds()
+            ):
+                self.hits += 1
+                return cached
+            entry = self._entries[key]
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        try:
+            async with asyncio.timeout(IMAGE_FETCH_TIMEOUT.total_seconds()):
+                response = await get_async_client(self.hass).get(
+                    url, headers=headers, follow_redirects=True
+                )
+            if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+                self._checked[key] = time.monotonic()
+                self.revalidations += 1
+                return cached
+            response.raise_for_status()
+        except (httpx.HTTPError, TimeoutError) as exc:
+            _LOGGER.warning("Could not fetch vehicle image: %s", exc)
+            # Serve what we have rather than a broken image
+            return cached
+
+        self._checked[key] = time.monotonic()
+
+        self.downloads += 1
+        content = response.content
+        entry = _CacheEntry(
+            digest=hashlib.sha256(content).hexdigest(),
+            content_type=response.headers.get("content-type", "image/png"),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        stale_digest = None
+        if cached is not None and cached.digest != entry.digest:
+            stale_digest = cached.digest
+        self._entries[key] = entry
+        self._remember(entry.digest, content)
+        await self.hass.async_add_executor_job(
+            self._write, key, entry, content, stale_digest
+        )
+        image = CachedImage(content, entry.content_type, entry.digest)
+        # Start on the variants right away, clients will ask for them next
+        self.hass.async_create_background_task(
+            self._async_ensure_variants(image),
+            f"porscheconnect image variants {image.digest}",
+        )
+        return image
+
+    async def _async_load(self, key: str) -> CachedImage | None:
+        """Return the cached image of a URL key, if there is one."""
+        if (entry := self._entries.get(key)) is None:
+            entry = await self.hass.async_add_executor_job(self._load_entry, key)
+            if entry is None:
+                return None
+            self._entries[key] = entry
+
+        if (content := await self._async_read(entry.digest)) is None:
+            return None
+        return CachedImage(content, entry.content_type, entry.digest)
+
+    async def _async_read(self, digest: str) -> bytes | None:
+        """Return the image bytes from memory or disk."""
+        if (content := self._memory.get(digest)) is not None:
+            self._memory.move_to_end(digest)
+            return content
+
+        content = await self.hass.async_add_executor_job(self._read, digest)
+        if content is not None:
+            self._remember(digest, content)
+        return content
+
+    def _remember(self, digest: str, content: bytes) -> None:
+        """Keep the image bytes in memory, evicting the least recently used."""
+        self._memory[digest] = content
+        self._memory.move_to_end(digest)
+        while len(self._memory) > IMAGE_MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
+    def _load_entry(self, key: str) -> _CacheEntry | None:
+        """Load the cache entry of a URL from disk."""
+        try:
+            return _CacheEntry(**json.loads((self._path / f"{key}.json").read_text()))
+        except (OSError, TypeError, ValueError):
+            return None
+
+    def _read(self, digest: str) -> bytes | None:
+        """Read image bytes from disk."""
+        try:
+            return (self._path / digest).read_bytes()
+        except OSError:
+            return None
+
+    def _write(
+        self,
+        key: str,
+        entry: _CacheEntry,
+        content: bytes,
+        stale_digest: str | None,
+    ) -> None:
+        """Write image bytes and the entry of their URL to disk."""
+        try:
+            self._path.mkdir(parents=True, exist_ok=True)
+            if not (blob := self._path / entry.digest).exists():
+                blob.write_bytes(content)
+            (self._path / f"{key}.json").write_text(json.dumps(asdict(entry)))
+            if stale_digest is not None and not self._in_use(stale_digest):
+                (self._path / stale_digest).unlink(missing_ok=True)
+                for variant in self._path.glob(f"{stale_digest}-*"):
+                    variant.unlink(missing_ok=True)
+        except OSError as exc:
+            _LOGGER.warning("Could not write vehicle image cache: %s", exc)
+
+    def _in_use(self, digest: str) -> bool:
+        """Return whether the entry of any URL still refers to the image."""
+        for path in self._path.glob("*.json"):
+            if (entry := self._load_entry(path.stem)) is not None and (
+                entry.digest == digest
+            ):
+                return True
+        return False
+
+    def _generate_variants(self, digest: str, content: bytes) -> None:
+        """Write width bounded PNG and WebP variants of an image to disk."""
+        if (self._path / _variant_name(digest, None, CONTENT_TYPE_WEBP)).exists():
+            return
+
+        try:
+            from PIL import Image
+        except ImportError:
+            _LOGGER.debug("Pillow is not available, serving original images")
+            return
+
+        variants: dict[str, bytes] = {}
+        try:
+            with Image.open(io.BytesIO(content)) as original:
+                original.load()
+                for width in (*IMAGE_VARIANT_WIDTHS, None):
+                    if width is not None and width >= original.width:
+                        continue
+                    resized = original
+                    if width is not None:
+                        height = max(1, round(original.height * width / original.width))
+                        resized = original.resize(
+                            (width, height), Image.Resampling.LANCZOS
+                        )
+                    if width is not None:
+                        buffer = io.BytesIO()
+                        resized.save(buffer, "PNG", optimize=True)
+                        name = _variant_name(digest, width, CONTENT_TYPE_PNG)
+                        variants[name] = buffer.getvalue()
+                    buffer = io.BytesIO()
+                    resized.save(buffer, "WEBP", quality=IMAGE_WEBP_QUALITY)
+                    name = _variant_name(digest, width, CONTENT_TYPE_WEBP)
+                    variants[name] = buffer.getvalue()
+        except (OSError, ValueError) as exc:
+            _LOGGER.warning("Could not generate vehicle image variants: %s", exc)
+            return
+
+        try:
+            self._path.mkdir(parents=True, exist_ok=True)
+            for name, variant in variants.items():
+                (self._path / name).write_bytes(variant)
+        except OSError as exc:
+            _LOGGER.warning("Could not write vehicle image variants: %s", exc)
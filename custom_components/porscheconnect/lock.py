@@ -14,11 +14,16 @@ from pyporscheconnectapi.vehicle import PorscheVehicle
 from . import (
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
 )
 from .const import DOMAIN
+from .optimistic import ExpectedState
 
 _LOGGER = logging.getLogger(__name__)
 
+LOCK_NODES = ("LOCK_STATE_VEHICLE",)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,12 +31,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Porsche Connect lock entity from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
 
-    async_add_entities(
-        PorscheLock(coordinator, vehicle) for vehicle in coordinator.vehicles
+    await async_add_vehicle_entities(
+        account,
+        async_add_entities,
+        lambda coordinator: [PorscheLock(coordinator, coordinator.vehicle)],
     )
 
 
@@ -42,11 +49,11 @@ class PorscheLock(PorscheBaseEntity, LockEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
     ) -> None:
         """Initialize the lock."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, LOCK_NODES)
 
         self._attr_unique_id = f'{vehicle.data["name"]}-lock'
         self.door_lock_state_available = vehicle.has_remote_services
@@ -54,13 +61,19 @@ class PorscheLock(PorscheBaseEntity, LockEntity):
     async def async_lock(self) -> None:
         """Lock the vehicle."""
         try:
-            await self.vehicle.remote_services.lock_vehicle()
+            await self.coordinator.async_optimistic_command(
+                ExpectedState(
+                    "lock",
+                    True,  # noqa: FBT003
+                    lambda v: v.vehicle_locked,
+                    frozenset(LOCK_NODES),
+                ),
+                "lock",
+                self.vehicle.remote_services.lock_vehicle,
+                slot="lock",
+            )
         except PorscheExceptionError as ex:
-            self._attr_is_locked = None
-            self.async_write_ha_state()
             raise HomeAssistantError(ex) from ex
-        finally:
-            self.coordinator.async_update_listeners()
 
     async def async_unlock(self, **kwargs: dict) -> None:
         """Unlock the vehicle."""
@@ -72,13 +85,20 @@ class PorscheLock(PorscheBaseEntity, LockEntity):
 
         if pin:
             try:
-                await self.vehicle.remote_services.unlock_vehicle(pin)
+                await self.coordinator.async_optimistic_command(
+                    ExpectedState(
+                        "lock",
+                        False,  # noqa: FBT003
+                        lambda v: not v.vehicle_locked,
+                        frozenset(LOCK_NODES),
+                    ),
+                    "unlock",
+                    lambda: self.vehicle.remote_services.unlock_vehicle(pin),
+                    (pin,),
+                    slot="lock",
+                )
             except PorscheExceptionError as ex:
-                self._attr_is_locked = None
-                self.async_write_ha_state()
                 raise HomeAssistantError(ex) from ex
-            finally:
-                self.coordinator.async_update_listeners()
         else:
             msg = "PIN code not provided."
             raise ValueError(msg)
@@ -87,6 +107,8 @@ class PorscheLock(PorscheBaseEntity, LockEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         _LOGGER.debug("Updating lock data of %s", self.vehicle.vin)
-        self._attr_is_locked = self.vehicle.vehicle_locked
+        self._attr_is_locked = self.coordinator.optimistic.get(
+            "lock", self.vehicle.vehicle_locked
+        )
 
         super()._handle_coordinator_update()
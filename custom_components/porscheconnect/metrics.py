@@ -0,0 +1,177 @@
+"""API call and polling metrics for Porsche Connect."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter, deque
+from collections.abc import Iterator
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.connection import Connection
+
+from .const import METRICS_SAMPLES
+
+ENDPOINT_OVERVIEW = "overview"
+ENDPOINT_VEHICLES = "vehicles"
+ENDPOINT_PICTURES = "pictures"
+ENDPOINT_COMMANDS = "commands"
+ENDPOINT_COMMAND_STATUS = "command_status"
+ENDPOINT_TOKEN = "token"  # noqa: S105
+ENDPOINT_OTHER = "other"
+ENDPOINTS = (
+    ENDPOINT_OVERVIEW,
+    ENDPOINT_VEHICLES,
+    ENDPOINT_PICTURES,
+    ENDPOINT_COMMANDS,
+    ENDPOINT_COMMAND_STATUS,
+    ENDPOINT_TOKEN,
+    ENDPOINT_OTHER,
+)
+
+_VEHICLE_ENDPOINTS = {
+    (): ENDPOINT_OVERVIEW,
+    ("pictures",): ENDPOINT_PICTURES,
+    ("commands",): ENDPOINT_COMMANDS,
+}
+
+
+def endpoint_of(url: str) -> tuple[str, str | None]:
+    """Return the endpoint and VIN of an API path."""
+    parts = url.partition("?")[0].strip("/").split("/")
+    if parts[:3] != ["connect", "v1", "vehicles"]:
+        return ENDPOINT_OTHER, None
+    if len(parts) == 3:  # noqa: PLR2004
+        return ENDPOINT_VEHICLES, None
+
+    vin, rest = parts[3], tuple(parts[4:])
+    if rest in _VEHICLE_ENDPOINTS:
+        return _VEHICLE_ENDPOINTS[rest], vin
+    if rest[:1] == ("commands",):
+        return ENDPOINT_COMMAND_STATUS, vin
+    return ENDPOINT_OTHER, vin
+
+
+class PorscheSamples:
+    """The most recent samples of a measured value."""
+
+    def __init__(self, maxlen: int = METRICS_SAMPLES) -> None:
+        """Initialise the samples."""
+        self.count = 0
+        self._samples: deque[float] = deque(maxlen=maxlen)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one when full."""
+        self.count += 1
+        self._samples.append(value)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the kept samples, oldest first."""
+        return iter(self._samples)
+
+    def __len__(self) -> int:
+        """Return the number of kept samples."""
+        return len(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        """Return the last sample."""
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples."""
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    @property
+    def p95(self) -> float | None:
+        """Return the 95th percentile of the samples, by the nearest rank."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[math.ceil(len(ordered) * 0.95) - 1]
+
+
+class PorscheApiMetrics:
+    """Calls, latency and payload size of the API calls of an account.
+
+    The connection reports every call, the account reports token refreshes,
+    which do not go through the connection. Latency is kept for the most
+    recent calls of each endpoint, counts and sizes since startup.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """Initialise the metrics."""
+        self.calls: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.payload_bytes: Counter[str] = Counter()
+        self.latency = {endpoint: PorscheSamples() for endpoint in ENDPOINTS}
+        self.overview_bytes: dict[str, int] = {}
+        self.last_success: datetime | None = None
+        connection.metrics = self
+
+    def record(
+        self, url: str, duration: float, payload_bytes: int, *, error: bool = False
+    ) -> None:
+        """Record an API call."""
+        endpoint, vin = endpoint_of(url)
+        self._record(endpoint, duration, payload_bytes, error=error)
+        if endpoint == ENDPOINT_OVERVIEW and vin is not None and not error:
+            self.overview_bytes[vin] = payload_bytes
+
+    def record_token_refresh(self, duration: float | None) -> None:
+        """Record a refresh of the access token."""
+        if duration is not None:
+            self._record(ENDPOINT_TOKEN, duration, 0, error=False)
+
+    def _record(
+        self, endpoint: str, duration: float, payload_bytes: int, *, error: bool
+    ) -> None:
+        """Add a call to the metrics of an endpoint."""
+        self.calls[endpoint] += 1
+        self.latency[endpoint].add(duration)
+        self.payload_bytes[endpoint] += payload_bytes
+        if error:
+            self.errors[endpoint] += 1
+        else:
+            self.last_success = dt_util.utcnow()
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean latency of the recent calls of all endpoints."""
+        samples = [value for latency in self.latency.values() for value in latency]
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+    def latency_by_endpoint(self) -> dict[str, float | None]:
+        """Return the mean latency of each endpoint in milliseconds."""
+        return {
+            endpoint: None if samples.mean is None else round(samples.mean * 1000)
+            for endpoint, samples in self.latency.items()
+            if samples.count
+        }
+
+
+class PorschePollMetrics:
+    """Duration and outcome of the polls of a vehicle."""
+
+    def __init__(self, maxlen: int = METRICS_SAMPLES) -> None:
+        """Initialise the poll metrics."""
+        self.durations = PorscheSamples(maxlen)
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_success: datetime | None = None
+
+    def record_success(self, duration: float) -> None:
+        """Record a successful poll."""
+        self.durations.add(duration)
+        self.consecutive_failures = 0
+        self.last_success = dt_util.utcnow()
+
+    def record_failure(self) -> None:
+        """Record a failed poll."""
+        self.failures += 1
+        self.consecutive_failures += 1
@@ -22,8 +22,11 @@ from pyporscheconnectapi.vehicle import PorscheVehicle
 from . import (
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
 )
 from .const import DOMAIN
+from .optimistic import ExpectedState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +37,7 @@ class PorscheNumberEntityDescription(NumberEntityDescription):
 
     value_fn: Callable[[PorscheVehicle], float | int | None]
     remote_service: Callable[[PorscheVehicle, float | int], Coroutine[Any, Any, Any]]
+    measurement_nodes: tuple[str, ...]
     is_available: Callable[[PorscheVehicle], bool] = lambda _: False
 
 
@@ -48,6 +52,8 @@ NUMBER_TYPES: list[PorscheNumberEntityDescription] = [
         native_unit_of_measurement="%",
         native_step=5.0,
         mode=NumberMode.SLIDER,
+        # Without departures, setting the target rewrites the charging profiles
+        measurement_nodes=("CHARGING_SUMMARY", "CHARGING_PROFILES"),
         value_fn=lambda v: v.charging_target,
         remote_service=lambda v, o: v.remote_services.set_target_soc(
             target_soc=int(o),
@@ -62,21 +68,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Porsche number from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
 
-    entities: list[PorscheNumber] = []
-
-    for vehicle in coordinator.vehicles:
-        entities.extend(
-            [
-                PorscheNumber(coordinator, vehicle, description)
-                for description in NUMBER_TYPES
-                if description.is_available(vehicle)
-            ],
-        )
-    async_add_entities(entities)
+    await async_add_vehicle_entities(
+        account,
+        async_add_entities,
+        lambda coordinator: [
+            PorscheNumber(coordinator, coordinator.vehicle, description)
+            for description in NUMBER_TYPES
+            if description.is_available(coordinator.vehicle)
+        ],
+    )
 
 
 class PorscheNumber(PorscheBaseEntity, NumberEntity):
@@ -86,12 +90,12 @@ class PorscheNumber(PorscheBaseEntity, NumberEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
         description: PorscheNumberEntityDescription,
     ) -> None:
         """Initialize an Porsche Number."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.measurement_nodes)
 
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.data['name']}-{description.key}"
@@ -99,7 +103,10 @@ class PorscheNumber(PorscheBaseEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the entity value to represent the entity state."""
-        return self.entity_description.value_fn(self.vehicle)
+        return self.coordinator.optimistic.get(
+            self.entity_description.key,
+            self.entity_description.value_fn(self.vehicle),
+        )
 
     async def async_set_native_value(self, value: float) -> None:
         """Update to the vehicle."""
@@ -109,9 +116,18 @@ class PorscheNumber(PorscheBaseEntity, NumberEntity):
             self.vehicle.vin,
             value,
         )
+        description = self.entity_description
         try:
-            await self.entity_description.remote_service(self.vehicle, value)
+            await self.coordinator.async_optimistic_command(
+                ExpectedState(
+                    description.key,
+                    value,
+                    lambda v: description.value_fn(v) == value,
+                    frozenset(description.measurement_nodes),
+                ),
+                description.key,
+                lambda: description.remote_service(self.vehicle, value),
+                (value,),
+            )
         except Exception as ex:
             raise HomeAssistantError(ex) from ex
-
-        self.coordinator.async_update_listeners()
@@ -0,0 +1,142 @@
+"""Optimistic entity state for Porsche Connect remote commands."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from homeassistant.core import callback
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pyporscheconnectapi.vehicle import PorscheVehicle
+
+from .const import COMMAND_CONFIRM_DEADLINE, COMMAND_CONFIRM_DELAYS
+
+if TYPE_CHECKING:
+    from . import PorscheVehicleDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExpectedState:
+    """The state requested for an entity and how to tell the vehicle reports it."""
+
+    key: str
+    value: Any
+    confirmed: Callable[[PorscheVehicle], bool]
+    nodes: frozenset[str]
+
+
+class PorscheOptimisticState:
+    """Show the requested state of entities until the vehicle confirms it.
+
+    Once a command has completed, the measurement nodes it affects are
+    fetched on a backed off schedule until the vehicle reports the requested
+    state. States that are not confirmed before the deadline are rolled back.
+    """
+
+    def __init__(self, coordinator: PorscheVehicleDataUpdateCoordinator) -> None:
+        """Initialise the optimistic state."""
+        self.coordinator = coordinator
+        self.confirmed = 0
+        self.rolled_back = 0
+
+        self._expected: dict[str, ExpectedState] = {}
+        self._deadlines: dict[str, float] = {}
+        self._confirm_task: asyncio.Task[None] | None = None
+
+    def get(self, key: str, default: Any) -> Any:  # noqa: ANN401
+        """Return the requested state of an entity, or its reported state."""
+        if (expected := self._expected.get(key)) is not None:
+            return expected.value
+        return default
+
+    @callback
+    def async_expect(self, expected: ExpectedState) -> None:
+        """Show the requested state of an entity until it is confirmed."""
+        self._expected[expected.key] = expected
+        # Not confirmed before the command has run
+        self._deadlines.pop(expected.key, None)
+
+    @callback
+    def async_rollback(self, expected: ExpectedState) -> None:
+        """Drop the requested state of an entity, unless it was superseded."""
+        if self._expected.get(expected.key) is expected:
+            del self._expected[expected.key]
+            self._deadlines.pop(expected.key, None)
+            self.rolled_back += 1
+
+    @callback
+    def async_start_confirmation(self, expected: ExpectedState) -> None:
+        """Start confirming the requested state of an entity."""
+        if self._expected.get(expected.key) is not expected:
+            return
+        self._deadlines[expected.key] = (
+            time.monotonic() + COMMAND_CONFIRM_DEADLINE.total_seconds()
+        )
+        if self._confirm_task is None:
+            self._confirm_task = self.coordinator.hass.async_create_background_task(
+                self._async_confirm(),
+                f"porscheconnect confirm commands {self.coordinator.vehicle.vin}",
+            )
+
+    @callback
+    def async_settle(self) -> set[str]:
+        """Drop confirmed and expired states, returning the nodes they read."""
+        vehicle = self.coordinator.vehicle
+        now = time.monotonic()
+        settled: set[str] = set()
+        for key, expected in list(self._expected.items()):
+            if expected.confirmed(vehicle):
+                self.confirmed += 1
+            elif key in self._deadlines and now >= self._deadlines[key]:
+                _LOGGER.error(
+                    "Vehicle %s did not confirm %s within %s, reverting its state",
+                    vehicle.vin,
+                    key,
+                    COMMAND_CONFIRM_DEADLINE,
+                )
+                self.rolled_back += 1
+            else:
+                continue
+            del self._expected[key]
+            self._deadlines.pop(key, None)
+            settled |= expected.nodes
+        return settled
+
+    async def _async_confirm(self) -> None:
+        """Fetch the affected nodes with backoff until all states are settled."""
+        try:
+            for delay in self._delays():
+                if not self._deadlines:
+                    return
+                # Fetch once more at the deadline instead of rolling back late
+                deadline = min(self._deadlines.values())
+                await asyncio.sleep(max(0, min(delay, deadline - time.monotonic())))
+                nodes: set[str] = set()
+                for key in self._deadlines:
+                    if (expected := self._expected.get(key)) is not None:
+                        nodes |= expected.nodes
+                if nodes:
+                    try:
+                        await self.coordinator.async_fetch_nodes(nodes)
+                    except (
+                        PorscheExceptionError,
+                        httpx.HTTPError,
+                        TimeoutError,
+                    ) as exc:
+                        _LOGGER.debug("Could not confirm command state: %s", exc)
+                self.coordinator.async_update_listeners()
+        finally:
+            self._confirm_task = None
+
+    def _delays(self) -> Iterator[float]:
+        """Yield the delays between confirmation fetches."""
+        yield from COMMAND_CONFIRM_DELAYS
+        while True:
+            yield COMMAND_CONFIRM_DELAYS[-1]
@@ -0,0 +1,95 @@
+"""Timing traces of the polls of a Porsche vehicle."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+PHASE_TOKEN = "token"  # noqa: S105
+PHASE_PARSE = "parse"
+
+poll_trace_var: ContextVar[PollTrace | None] = ContextVar(
+    "porscheconnect_poll_trace", default=None
+)
+
+
+@dataclass
+class PollTrace:
+    """Where the time of a single poll of a vehicle went.
+
+    Times are in seconds. Waiting for the access token and parsing the
+    overview are measured where they happen, fetching is what is left of
+    the poll after them. Dispatching to the entities happens after the poll
+    and is filled in by the coordinator.
+    """
+
+    vin: str
+    retries: int = 0
+    measurements: int = 0
+    started: datetime = field(default_factory=dt_util.utcnow)
+    queued: float = 0.0
+    token: float = 0.0
+    fetch: float = 0.0
+    parse: float = 0.0
+    dispatch: float | None = None
+    duration: float | None = None
+    error: str | None = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase of the poll."""
+        setattr(self, phase, getattr(self, phase) + seconds)
+
+    @contextmanager
+    def activate(self) -> Iterator[PollTrace]:
+        """Trace the poll made in this context, recording its outcome."""
+        context = poll_trace_var.set(self)
+        start = time.monotonic()
+        try:
+            yield self
+        except BaseException as exc:
+            self.error = repr(exc)
+            raise
+        finally:
+            poll_trace_var.reset(context)
+            self.duration = time.monotonic() - start
+            self.fetch = max(0.0, self.duration - self.queued - self.token - self.parse)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace for diagnostics, with times in milliseconds."""
+
+        def ms(seconds: float | None) -> float | None:
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        return {
+            "vin": self.vin,
+            "started": self.started.isoformat(),
+            "measurements": self.measurements,
+            "retries": self.retries,
+            "queued_ms": ms(self.queued),
+            "token_ms": ms(self.token),
+            "fetch_ms": ms(self.fetch),
+            "parse_ms": ms(self.parse),
+            "dispatch_ms": ms(self.dispatch),
+            "duration_ms": ms(self.duration),
+            "error": self.error,
+        }
+
+
+@contextmanager
+def trace_phase(phase: str) -> Iterator[None]:
+    """Add the time spent in this context to a phase of the traced poll."""
+    if (trace := poll_trace_var.get()) is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        trace.add(phase, time.monotonic() - start)
@@ -0,0 +1,229 @@
+"""Account-wide API quota for Porsche Connect."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+
+from .const import (
+    CONF_QUOTA_CAPACITY,
+    DEFAULT_QUOTA_CAPACITY,
+    DOMAIN,
+    QUOTA_CAPACITY_PER_VEHICLE,
+    QUOTA_MAX_WAIT,
+    QUOTA_REFILL_PERIOD,
+    QUOTA_SAVE_DELAY,
+    QUOTA_UPDATE_COOLDOWN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+PRIORITY_COMMAND = "command"
+PRIORITY_POLL = "poll"
+PRIORITY_BACKGROUND = "background"
+PRIORITIES = (PRIORITY_COMMAND, PRIORITY_POLL, PRIORITY_BACKGROUND)
+
+# Share of the quota each priority leaves for the ones above it
+_RESERVES = {
+    PRIORITY_COMMAND: 0.0,
+    PRIORITY_POLL: 0.2,
+    PRIORITY_BACKGROUND: 0.5,
+}
+
+request_priority_var: ContextVar[str] = ContextVar(
+    "porscheconnect_request_priority", default=PRIORITY_POLL
+)
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Make the API calls made in this context count with the given priority.
+
+    Tasks started in the context, like merged calls or queued commands, keep
+    the priority they were started with.
+    """
+    token = request_priority_var.set(priority)
+    try:
+        yield
+    finally:
+        request_priority_var.reset(token)
+
+
+def _quota_store(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> Store[dict[str, Any]]:
+    """Return the store of the quota of an account."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}.quota")
+
+
+async def async_remove_quota(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the stored quota of a removed account."""
+    await _quota_store(hass, config_entry).async_remove()
+
+
+class PorscheQuotaExceededError(PorscheExceptionError):
+    """Raised instead of calling the API when the account is out of quota."""
+
+    def __init__(self, priority: str) -> None:
+        """Initialise the error."""
+        super().__init__(
+            "QUOTA_EXCEEDED",
+            f"Porsche Connect API quota exhausted for {priority} calls",
+        )
+        self.priority = priority
+
+
+class PorscheRateLimiter:
+    """Token bucket shared by every API call of an account.
+
+    The bucket refills evenly over the refill period. Polls and background
+    calls leave a share of the bucket to the priorities above them, so a busy
+    polling schedule cannot use up the quota needed for commands. Commands
+    wait briefly for a token, other calls are throttled right away. The
+    bucket and counters are stored, so a restart does not reset the quota.
+
+    Unless the capacity is configured, it is sized by the number of vehicles
+    of the account, so a large account is not throttled on its first poll.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        connection: Connection,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialise the rate limiter."""
+        self.hass = hass
+        self.configured = CONF_QUOTA_CAPACITY in config_entry.options
+        self.capacity = config_entry.options.get(
+            CONF_QUOTA_CAPACITY, DEFAULT_QUOTA_CAPACITY
+        )
+        self.tokens = float(self.capacity)
+        self.calls: Counter[str] = Counter()
+        self.throttled: Counter[str] = Counter()
+
+        self._updated = dt_util.utcnow()
+        self._store = _quota_store(hass, config_entry)
+        # The counters change with every call, update the entities now and then
+        self._debouncer = None
+        if on_change is not None:
+            self._debouncer = Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=QUOTA_UPDATE_COOLDOWN.total_seconds(),
+                immediate=True,
+                function=on_change,
+            )
+        connection.rate_limiter = self
+
+    @property
+    def _rate(self) -> float:
+        """Return the tokens added to the bucket per second."""
+        return self.capacity / QUOTA_REFILL_PERIOD.total_seconds()
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of calls left in the bucket."""
+        self._refill()
+        return int(self.tokens)
+
+    async def async_load(self) -> None:
+        """Restore the bucket and counters from the last run."""
+        if not (data := await self._store.async_load()):
+            return
+        if not self.configured and "capacity" in data:
+            self.capacity = int(data["capacity"])
+        if (updated := dt_util.parse_datetime(data["updated"])) is not None:
+            self.tokens = min(float(data["tokens"]), self.capacity)
+            self._updated = updated
+        self.calls.update(data.get("calls", {}))
+        self.throttled.update(data.get("throttled", {}))
+
+    @callback
+    def async_set_vehicles(self, vehicles: int) -> None:
+        """Size the capacity by the number of vehicles, unless configured."""
+        if self.configured:
+            return
+        capacity = max(DEFAULT_QUOTA_CAPACITY, vehicles * QUOTA_CAPACITY_PER_VEHICLE)
+        if capacity == self.capacity:
+            return
+        self._refill()
+        # New vehicles bring their share of calls
+        self.tokens = min(capacity, self.tokens + max(0, capacity - self.capacity))
+        self.capacity = capacity
+        self._async_changed()
+
+    async def async_acquire(self) -> None:
+        """Take a token for an API call, or raise if the call is throttled."""
+        priority = request_priority_var.get()
+        floor = self.capacity * _RESERVES[priority]
+        self._refill()
+        if priority == PRIORITY_COMMAND and self.tokens < 1:
+            wait = (1 - self.tokens) / self._rate
+            if wait <= QUOTA_MAX_WAIT.total_seconds():
+                await asyncio.sleep(wait)
+                self._refill()
+
+        if self.tokens - 1 < floor:
+            self.throttled[priority] += 1
+            _LOGGER.warning(
+                "Throttling %s call, %.1f of %d API calls left",
+                priority,
+                self.tokens,
+                self.capacity,
+            )
+            self._async_changed()
+            raise PorscheQuotaExceededError(priority)
+
+        self.tokens -= 1
+        self.calls[priority] += 1
+        self._async_changed()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = dt_util.utcnow()
+        elapsed = max(0.0, (now - self._updated).total_seconds())
+        self.tokens = min(self.capacity, self.tokens + elapsed * self._rate)
+        self._updated = now
+
+    @callback
+    def _async_changed(self) -> None:
+        """Schedule a save and let the account entities know."""
+        self._store.async_delay_save(
+            self._data_to_save, QUOTA_SAVE_DELAY.total_seconds()
+        )
+        if self._debouncer is not None:
+            self._debouncer.async_schedule_call()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a pending update of the entities."""
+        if self._debouncer is not None:
+            self._debouncer.async_shutdown()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the bucket and counters to store."""
+        return {
+            "capacity": self.capacity,
+            "tokens": self.tokens,
+            "updated": self._updated.isoformat(),
+            "calls": dict(self.calls),
+            "throttled": dict(self.throttled),
+        }
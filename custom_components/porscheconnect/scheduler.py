@@ -0,0 +1,75 @@
+"""Adaptive polling schedule for Porsche Connect vehicles."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pyporscheconnectapi.vehicle import PorscheVehicle
+
+ACTIVE_CHARGING_STATES = {"CHARGING", "INITIALISING", "INSTANT_CHARGING"}
+
+REASON_CHARGING = "charging"
+REASON_CLIMATISING = "climatising"
+REASON_DIRECT_CHARGING = "direct_charging"
+REASON_MOVING = "moving"
+REASON_PARKED = "parked"
+
+
+class PorschePollingScheduler:
+    """Pick the next poll interval of a vehicle from its last known state.
+
+    Vehicles that are charging, climatising or moving are polled at the fast
+    interval. A parked vehicle starts at the base interval and backs off
+    exponentially towards the slow interval for every poll that finds it
+    still parked.
+    """
+
+    def __init__(
+        self,
+        base_interval: timedelta,
+        fast_interval: timedelta,
+        slow_interval: timedelta,
+    ) -> None:
+        """Initialise the scheduler."""
+        self.fast_interval = min(fast_interval, base_interval)
+        self.slow_interval = max(slow_interval, base_interval)
+        self.base_interval = base_interval
+        self.interval = base_interval
+        self.reason = REASON_PARKED
+
+        self._last_location: tuple[float | None, float | None] | None = None
+        self._idle_polls = 0
+
+    def _active_reason(self, vehicle: PorscheVehicle) -> str | None:
+        """Return why the vehicle needs fast polling, if it does."""
+        location = vehicle.location[:2]
+        moved = self._last_location is not None and location != self._last_location
+        self._last_location = location
+
+        charging_status = vehicle.data.get("CHARGING_SUMMARY", {}).get("status")
+        if charging_status in ACTIVE_CHARGING_STATES:
+            return REASON_CHARGING
+        if vehicle.remote_climatise_on:
+            return REASON_CLIMATISING
+        if vehicle.direct_charge_on:
+            return REASON_DIRECT_CHARGING
+        if moved:
+            return REASON_MOVING
+
+        return None
+
+    def next_interval(self, vehicle: PorscheVehicle) -> timedelta:
+        """Update and return the interval until the next poll of the vehicle."""
+        if reason := self._active_reason(vehicle):
+            self._idle_polls = 0
+            self.interval = self.fast_interval
+            self.reason = reason
+        else:
+            self.interval = min(
+                self.base_interval * 2**self._idle_polls,
+                self.slow_interval,
+            )
+            self._idle_polls += 1
+            self.reason = REASON_PARKED
+
+        return self.interval
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,19 +17,31 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
     UnitOfLength,
     UnitOfPower,
     UnitOfSpeed,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 from pyporscheconnectapi.vehicle import PorscheVehicle
 
 from . import DOMAIN as PORSCHE_DOMAIN
 from . import (
+    PorscheAccountEntity,
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
+    compile_measurement_accessor,
 )
+from .circuit_breaker import STATES as CIRCUIT_BREAKER_STATES
+from .command_tracker import STATUSES
+from .metrics import ENDPOINTS, PorschePollMetrics
+from .rate_limiter import PRIORITIES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +55,26 @@ class PorscheSensorEntityDescription(SensorEntityDescription):
     is_available: Callable[[PorscheVehicle], bool] = lambda v: v.has_porsche_connect
 
 
+@dataclass(frozen=True, kw_only=True)
+class PorscheDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Class describing Porsche Connect integration diagnostic sensor entities."""
+
+    value_fn: Callable[[PorscheVehicleDataUpdateCoordinator], StateType]
+    attr_fn: Callable[[PorscheVehicleDataUpdateCoordinator], dict[str, Any]] | None = (
+        None
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class PorscheAccountSensorEntityDescription(SensorEntityDescription):
+    """Class describing Porsche Connect account sensor entities."""
+
+    value_fn: Callable[[PorscheConnectDataUpdateCoordinator], StateType | datetime]
+    attr_fn: Callable[[PorscheConnectDataUpdateCoordinator], dict[str, Any]] | None = (
+        None
+    )
+
+
 SENSOR_TYPES: list[PorscheSensorEntityDescription] = [
     PorscheSensorEntityDescription(
         key="charging_target",
@@ -153,24 +187,270 @@ SENSOR_TYPES: list[PorscheSensorEntityDescription] = [
 ]
 
 
+def _poll_metrics(
+    coordinator: PorscheVehicleDataUpdateCoordinator,
+) -> PorschePollMetrics:
+    """Return the poll metrics of the coordinator polling the vehicle."""
+    return coordinator.hub.primary(coordinator).poll_metrics
+
+
+def _overview_bytes(coordinator: PorscheVehicleDataUpdateCoordinator) -> int | None:
+    """Return the size of the last overview fetched for the vehicle."""
+    primary = coordinator.hub.primary(coordinator)
+    return primary.account.api_metrics.overview_bytes.get(coordinator.vehicle.vin)
+
+
+def _polling_interval(coordinator: PorscheVehicleDataUpdateCoordinator) -> float | None:
+    """Return the interval the vehicle is polled at, by its primary coordinator."""
+    primary = coordinator.hub.primary(coordinator)
+    if primary.update_interval is None:
+        return None
+    return primary.update_interval.total_seconds()
+
+
+DIAGNOSTIC_SENSOR_TYPES: list[PorscheDiagnosticSensorEntityDescription] = [
+    PorscheDiagnosticSensorEntityDescription(
+        key="polling_interval",
+        translation_key="polling_interval",
+        icon="mdi:timer-sync-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_polling_interval,
+        attr_fn=lambda c: {"reason": c.hub.primary(c).scheduler.reason},
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="command_queue_wait",
+        translation_key="command_queue_wait",
+        icon="mdi:tray-full",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda c: c.command_queue.queue_wait,
+        attr_fn=lambda c: {
+            "queued": c.command_queue.depth,
+            "executed": c.command_queue.executed,
+            "coalesced": c.command_queue.coalesced,
+            "rejected": c.command_queue.rejected,
+        },
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="command_execution_time",
+        translation_key="command_execution_time",
+        icon="mdi:timer-play-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda c: c.command_queue.execution_time,
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="last_command_status",
+        translation_key="last_command_status",
+        icon="mdi:car-connected",
+        device_class=SensorDeviceClass.ENUM,
+        options=STATUSES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda c: c.command_tracker.status,
+        attr_fn=lambda c: {
+            "command": c.command_tracker.last_command,
+            "status_id": c.command_tracker.status_id,
+            "started": c.command_tracker.started,
+            "duration": c.command_tracker.duration,
+        },
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="poll_duration",
+        translation_key="poll_duration",
+        icon="mdi:timer-refresh-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda c: _poll_metrics(c).durations.last,
+        attr_fn=lambda c: {
+            "polls": _poll_metrics(c).durations.count,
+            "failures": _poll_metrics(c).failures,
+        },
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="poll_duration_p95",
+        translation_key="poll_duration_p95",
+        icon="mdi:timer-refresh-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda c: _poll_metrics(c).durations.p95,
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="overview_payload_size",
+        translation_key="overview_payload_size",
+        icon="mdi:file-download-outline",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_overview_bytes,
+    ),
+    PorscheDiagnosticSensorEntityDescription(
+        key="last_successful_poll",
+        translation_key="last_successful_poll",
+        icon="mdi:clock-check-outline",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda c: _poll_metrics(c).last_success,
+    ),
+]
+
+ACCOUNT_SENSOR_TYPES: list[PorscheAccountSensorEntityDescription] = [
+    PorscheAccountSensorEntityDescription(
+        key="token_issued",
+        translation_key="token_issued",
+        icon="mdi:key-chain",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda c: c.token_manager.issued_at,
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="token_refresh_duration",
+        translation_key="token_refresh_duration",
+        icon="mdi:key-chain-variant",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda c: c.token_manager.refresh_latency,
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_circuit_breaker",
+        translation_key="api_circuit_breaker",
+        icon="mdi:electric-switch",
+        device_class=SensorDeviceClass.ENUM,
+        options=CIRCUIT_BREAKER_STATES,
+        value_fn=lambda c: c.circuit_breaker.state,
+        attr_fn=lambda c: {
+            "failures": c.circuit_breaker.failures,
+            "trips": c.circuit_breaker.trips,
+            "retry_at": c.circuit_breaker.retry_at,
+            "last_error": c.circuit_breaker.last_error,
+        },
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_quota_remaining",
+        translation_key="api_quota_remaining",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c: c.rate_limiter.remaining,
+        attr_fn=lambda c: {
+            "capacity": c.rate_limiter.capacity,
+            **{
+                f"{priority}_calls": c.rate_limiter.calls[priority]
+                for priority in PRIORITIES
+            },
+        },
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_throttled_calls",
+        translation_key="api_throttled_calls",
+        icon="mdi:speedometer-slow",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.rate_limiter.throttled.total(),
+        attr_fn=lambda c: {
+            priority: c.rate_limiter.throttled[priority] for priority in PRIORITIES
+        },
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_first_byte_time",
+        translation_key="api_first_byte_time",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c: c.http_timings.first_byte_time,
+        attr_fn=lambda c: c.http_timings.as_dict(),
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_calls",
+        translation_key="api_calls",
+        icon="mdi:api",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.api_metrics.calls.total(),
+        attr_fn=lambda c: {
+            **{endpoint: c.api_metrics.calls[endpoint] for endpoint in ENDPOINTS},
+            "errors": c.api_metrics.errors.total(),
+        },
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_latency",
+        translation_key="api_latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda c: (
+            None if (latency := c.api_metrics.mean_latency) is None else latency * 1000
+        ),
+        attr_fn=lambda c: c.api_metrics.latency_by_endpoint(),
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_payload_size",
+        translation_key="api_payload_size",
+        icon="mdi:download-network-outline",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.api_metrics.payload_bytes.total(),
+        attr_fn=lambda c: {
+            endpoint: c.api_metrics.payload_bytes[endpoint] for endpoint in ENDPOINTS
+        },
+    ),
+    PorscheAccountSensorEntityDescription(
+        key="api_last_success",
+        translation_key="api_last_success",
+        icon="mdi:clock-check-outline",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda c: c.api_metrics.last_success,
+    ),
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensors from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[PORSCHE_DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[PORSCHE_DOMAIN][
         config_entry.entry_id
     ]
 
-    entities = [
-        PorscheSensor(coordinator, vehicle, description)
-        for vehicle in coordinator.vehicles
-        for description in SENSOR_TYPES
-        if description.is_available(vehicle)
-    ]
-
-    async_add_entities(entities)
+    await async_add_vehicle_entities(
+        account,
+        async_add_entities,
+        lambda coordinator: [
+            *(
+                PorscheSensor(coordinator, coordinator.vehicle, description)
+                for description in SENSOR_TYPES
+                if description.is_available(coordinator.vehicle)
+            ),
+            *(
+                PorscheDiagnosticSensor(coordinator, coordinator.vehicle, description)
+                for description in DIAGNOSTIC_SENSOR_TYPES
+            ),
+        ],
+    )
+    async_add_entities(
+        PorscheAccountSensor(account, description)
+        for description in ACCOUNT_SENSOR_TYPES
+    )
 
 
 class PorscheSensor(PorscheBaseEntity, SensorEntity):
@@ -180,24 +460,24 @@ class PorscheSensor(PorscheBaseEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
         description: PorscheSensorEntityDescription,
     ) -> None:
         """Initialize of the sensor."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, (description.measurement_node,))
 
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.data['name']}-{description.key}"
+        self._value_accessor = compile_measurement_accessor(
+            description.measurement_node,
+            description.measurement_leaf,
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        state = self.coordinator.get_vechicle_data_leaf(
-            self.vehicle,
-            self.entity_description.measurement_node,
-            self.entity_description.measurement_leaf,
-        )
+        state = self._value_accessor(self.vehicle.data)
 
         if type(state) is str:
             state = state.lower()
@@ -211,3 +491,59 @@ class PorscheSensor(PorscheBaseEntity, SensorEntity):
 
         self._attr_native_value = state
         super()._handle_coordinator_update()
+
+
+class PorscheDiagnosticSensor(PorscheBaseEntity, SensorEntity):
+    """Representation of a Porsche Connect integration diagnostic sensor."""
+
+    entity_description: PorscheDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
+        vehicle: PorscheVehicle,
+        description: PorscheDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize of the sensor."""
+        super().__init__(coordinator, vehicle)
+
+        self.entity_description = description
+        self._attr_unique_id = f"{vehicle.vin}-{description.key}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
+        if self.entity_description.attr_fn:
+            self._attr_extra_state_attributes = self.entity_description.attr_fn(
+                self.coordinator,
+            )
+
+        super()._handle_coordinator_update()
+
+
+class PorscheAccountSensor(PorscheAccountEntity, SensorEntity):
+    """Representation of a Porsche Connect account sensor."""
+
+    entity_description: PorscheAccountSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PorscheConnectDataUpdateCoordinator,
+        description: PorscheAccountSensorEntityDescription,
+    ) -> None:
+        """Initialize of the sensor."""
+        super().__init__(coordinator)
+
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{description.key}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
+        if self.entity_description.attr_fn:
+            self._attr_extra_state_attributes = self.entity_description.attr_fn(
+                self.coordinator,
+            )
+        super()._handle_coordinator_update()
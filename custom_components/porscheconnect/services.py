@@ -57,7 +57,7 @@ def setup_services(
     config_entry: ConfigEntry,
 ) -> None:
     """Register the Porsche Connect service actions."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
 
@@ -79,16 +79,23 @@ def setup_services(
         )
         vehicle = get_vehicle(service_call.data)
         try:
-            await vehicle.remote_services.climatise_on(
-                target_temperature=293.15
+            settings = {
+                "target_temperature": 293.15
                 if temperature is None
                 else temperature + 273.15,
-                front_left=front_left or False,
-                front_right=front_right or False,
-                rear_left=rear_left or False,
-                rear_right=rear_right or False,
+                "front_left": front_left or False,
+                "front_right": front_right or False,
+                "rear_left": rear_left or False,
+                "rear_right": rear_right or False,
+            }
+            coordinator = account.vehicle_coordinators[vehicle.vin]
+            await coordinator.async_remote_command(
+                "climatisation_start",
+                lambda: vehicle.remote_services.climatise_on(**settings),
+                tuple(settings.values()),
+                slot="climatise",
             )
-            coordinator.async_set_updated_data(vehicle.data)
+            coordinator.async_update_listeners()
         except PorscheExceptionError as ex:
             raise HomeAssistantError(ex) from ex
 
@@ -112,7 +119,7 @@ def setup_services(
                 translation_placeholders={"device_id": device_id},
             )
 
-        for vehicle in coordinator.vehicles:
+        for vehicle in account.vehicles:
             if (DOMAIN, vehicle.vin) in device_entry.identifiers:
                 return vehicle
 
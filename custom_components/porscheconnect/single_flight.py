@@ -0,0 +1,68 @@
+"""De-duplication of concurrent identical Porsche Connect API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class PorscheSingleFlight:
+    """Let concurrent identical calls share one in-flight call and its result.
+
+    Calls are identical when their operation and arguments are equal. A call
+    that arrives while an identical one is running waits for that one instead
+    of sending its own request, and is counted as merged.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialise the single-flight group."""
+        self.hass = hass
+        self.name = name
+        self.calls: Counter[str] = Counter()
+        self.merged: Counter[str] = Counter()
+
+        self._in_flight: dict[tuple[Hashable, ...], asyncio.Task[Any]] = {}
+
+    async def async_run(
+        self,
+        operation: str,
+        job: Callable[[], Awaitable[_T]],
+        args: tuple[Hashable, ...] = (),
+    ) -> _T:
+        """Run the job, or join the identical call that is already running."""
+        key = (operation, *args)
+        # A finished call stays listed until its done callback has run
+        if (task := self._in_flight.get(key)) is not None and not task.done():
+            self.merged[operation] += 1
+            _LOGGER.debug("Joining in-flight %s of %s", operation, self.name)
+            return await asyncio.shield(task)
+
+        self.calls[operation] += 1
+
+        async def run() -> _T:
+            return await job()
+
+        task = self.hass.async_create_task(
+            run(), f"porscheconnect {operation} {self.name}"
+        )
+        self._in_flight[key] = task
+
+        def done(task: asyncio.Task[Any]) -> None:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+            if not task.cancelled():
+                # Retrieved here in case every caller was cancelled meanwhile
+                task.exception()
+
+        task.add_done_callback(done)
+        # Callers that got cancelled must not cancel the call for the others
+        return await asyncio.shield(task)
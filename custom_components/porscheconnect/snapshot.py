@@ -0,0 +1,90 @@
+"""Persisted snapshot of the vehicles of a Porsche Connect account."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.vehicle import PorscheVehicle
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class PorscheSnapshotStore:
+    """Store the last known vehicle list and overviews of an account.
+
+    Entities are set up from the snapshot on startup, so Home Assistant does
+    not have to wait for the Porsche Connect API before the vehicles show up.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialise the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{config_entry.entry_id}",
+        )
+
+    async def async_load_vehicles(self, connection: Connection) -> list[PorscheVehicle]:
+        """Return the vehicles of the snapshot, or an empty list if there is none."""
+        if not (snapshot := await self._store.async_load()):
+            return []
+
+        vehicles = []
+        for vehicle in snapshot.get("vehicles", []):
+            data = vehicle["data"]
+            charging_summary = data.get("CHARGING_SUMMARY") or {}
+            if isinstance(
+                target := charging_summary.get("targetDateTimeWithOffset"), str
+            ):
+                # The library parses this one, but it is stored as a string
+                charging_summary["targetDateTimeWithOffset"] = dt_util.parse_datetime(
+                    target
+                )
+            vehicles.append(
+                PorscheVehicle(
+                    connection=connection,
+                    vin=vehicle["vin"],
+                    data=data,
+                    capabilities=vehicle["capabilities"],
+                    picture_locations=vehicle["picture_locations"],
+                )
+            )
+
+        _LOGGER.debug("Restored %d vehicles from snapshot", len(vehicles))
+        return vehicles
+
+    @callback
+    def async_schedule_save(
+        self, vehicles: Callable[[], Iterable[PorscheVehicle]]
+    ) -> None:
+        """Schedule a write of the vehicles, coalescing writes within the delay."""
+
+        def data_to_save() -> dict[str, Any]:
+            return {
+                "vehicles": [
+                    {
+                        "vin": vehicle.vin,
+                        "data": vehicle.data,
+                        "capabilities": vehicle.capabilities,
+                        "picture_locations": vehicle.picture_locations,
+                    }
+                    for vehicle in vehicles()
+                ]
+            }
+
+        self._store.async_delay_save(data_to_save, SNAPSHOT_SAVE_DELAY.total_seconds())
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
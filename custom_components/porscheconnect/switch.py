@@ -15,8 +15,11 @@ from pyporscheconnectapi.vehicle import PorscheVehicle
 from . import (
     PorscheBaseEntity,
     PorscheConnectDataUpdateCoordinator,
+    PorscheVehicleDataUpdateCoordinator,
+    async_add_vehicle_entities,
 )
 from .const import DOMAIN
+from .optimistic import ExpectedState
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -26,6 +29,7 @@ class PorscheSwitchEntityDescription(SwitchEntityDescription):
     value_fn: Callable[[PorscheVehicle], bool]
     remote_service_on: Callable[[PorscheVehicle], Coroutine[Any, Any, Any]]
     remote_service_off: Callable[[PorscheVehicle], Coroutine[Any, Any, Any]]
+    measurement_nodes: tuple[str, ...]
     is_available: Callable[[PorscheVehicle], bool] = lambda _: False
 
 
@@ -34,6 +38,7 @@ NUMBER_TYPES: list[PorscheSwitchEntityDescription] = [
         key="climatise",
         translation_key="climatise",
         is_available=lambda v: v.has_remote_climatisation and v.has_remote_services,
+        measurement_nodes=("CLIMATIZER_STATE",),
         value_fn=lambda v: v.remote_climatise_on,
         remote_service_on=lambda v: v.remote_services.climatise_on(),
         remote_service_off=lambda v: v.remote_services.climatise_off(),
@@ -42,6 +47,7 @@ NUMBER_TYPES: list[PorscheSwitchEntityDescription] = [
         key="direct_charging",
         translation_key="direct_charging",
         is_available=lambda v: v.has_direct_charge and v.has_remote_services,
+        measurement_nodes=("CHARGING_SUMMARY",),
         value_fn=lambda v: v.direct_charge_on,
         remote_service_on=lambda v: v.remote_services.direct_charge_on(),
         remote_service_off=lambda v: v.remote_services.direct_charge_off(),
@@ -55,21 +61,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Porsche switch from config entry."""
-    coordinator: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
+    account: PorscheConnectDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
 
-    entities: list[PorscheSwitch] = []
-
-    for vehicle in coordinator.vehicles:
-        entities.extend(
-            [
-                PorscheSwitch(coordinator, vehicle, description)
-                for description in NUMBER_TYPES
-                if description.is_available(vehicle)
-            ],
-        )
-    async_add_entities(entities)
+    await async_add_vehicle_entities(
+        account,
+        async_add_entities,
+        lambda coordinator: [
+            PorscheSwitch(coordinator, coordinator.vehicle, description)
+            for description in NUMBER_TYPES
+            if description.is_available(coordinator.vehicle)
+        ],
+    )
 
 
 class PorscheSwitch(PorscheBaseEntity, SwitchEntity):
@@ -79,34 +83,58 @@ class PorscheSwitch(PorscheBaseEntity, SwitchEntity):
 
     def __init__(
         self,
-        coordinator: PorscheConnectDataUpdateCoordinator,
+        coordinator: PorscheVehicleDataUpdateCoordinator,
         vehicle: PorscheVehicle,
         description: PorscheSwitchEntityDescription,
     ) -> None:
         """Initialize an Porsche Switch."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.measurement_nodes)
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
 
     @property
     def is_on(self) -> bool:
         """Return the entity value to represent the entity state."""
-        return self.entity_description.value_fn(self.vehicle)
+        return self.coordinator.optimistic.get(
+            self.entity_description.key,
+            self.entity_description.value_fn(self.vehicle),
+        )
 
     async def async_turn_on(self) -> None:
         """Turn the switch on."""
-        try:
-            await self.entity_description.remote_service_on(self.vehicle)
-        except PorscheExceptionError as ex:
-            raise HomeAssistantError(ex) from ex
-
-        self.coordinator.async_update_listeners()
+        await self._async_switch(
+            True,  # noqa: FBT003
+            f"{self.entity_description.key}_on",
+            lambda: self.entity_description.remote_service_on(self.vehicle),
+        )
 
     async def async_turn_off(self) -> None:
         """Turn the switch off."""
+        await self._async_switch(
+            False,  # noqa: FBT003
+            f"{self.entity_description.key}_off",
+            lambda: self.entity_description.remote_service_off(self.vehicle),
+        )
+
+    async def _async_switch(
+        self,
+        value: bool,  # noqa: FBT001
+        operation: str,
+        job: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> None:
+        """Switch to the value, showing it until the vehicle confirms it."""
+        description = self.entity_description
         try:
-            await self.entity_description.remote_service_off(self.vehicle)
+            await self.coordinator.async_optimistic_command(
+                ExpectedState(
+                    description.key,
+                    value,
+                    lambda v: bool(description.value_fn(v)) is value,
+                    frozenset(description.measurement_nodes),
+                ),
+                operation,
+                job,
+                slot=description.key,
+            )
         except PorscheExceptionError as ex:
             raise HomeAssistantError(ex) from ex
-
-        self.coordinator.async_update_listeners()
@@ -0,0 +1,263 @@
+"""Access token management for the Porsche Connect integration."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime
+
+import httpx
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.connection import Connection
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pyporscheconnectapi.oauth2 import OAuth2Token
+
+from .const import TOKEN_REFRESH_AHEAD, TOKEN_REFRESH_RETRY, TOKEN_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PorscheTokenManager:
+    """Keep the access token of an account valid ahead of its expiry.
+
+    The token is refreshed in the background shortly before it expires.
+    Callers that find the token expired share a single in-flight refresh
+    instead of each starting their own token exchange.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: Connection,
+        on_refresh: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialise the token manager."""
+        self.hass = hass
+        self.connection = connection
+        self.refresh_latency: float | None = None
+        self.last_refresh: datetime | None = None
+
+        self._on_refresh = on_refresh
+        self._refresh_task: asyncio.Task | None = None
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+
+        # Let the connection wait on us before every request
+        connection.token_manager = self
+
+    @property
+    def token(self) -> OAuth2Token:
+        """Return the current token of the connection.
+
+        A missing or malformed token is treated as an empty one, which is
+        refreshed on the next request.
+        """
+        token = self.connection.token
+        if isinstance(token, OAuth2Token):
+            return token
+        if not isinstance(token, Mapping):
+            _LOGGER.debug("Ignoring malformed access token of type %s", type(token))
+            token = {}
+        self.connection.token = OAuth2Token(dict(token))
+        return self.connection.token
+
+    @property
+    def expires_at(self) -> float | None:
+        """Return when the current access token expires as a timestamp."""
+        expires_at = self.token.get("expires_at")
+        if isinstance(expires_at, bool) or not isinstance(expires_at, int | float):
+            return None
+        return expires_at or None
+
+    @property
+    def issued_at(self) -> datetime | None:
+        """Return when the current access token was issued."""
+        expires_at = self.expires_at
+        try:
+            expires_in = int(self.token.get("expires_in"))
+        except (TypeError, ValueError):
+            return None
+        if expires_at is None:
+            return None
+        return dt_util.utc_from_timestamp(expires_at - expires_in)
+
+    @property
+    def token_age(self) -> float | None:
+        """Return the age of the current access token in seconds."""
+        if (issued_at := self.issued_at) is None:
+            return None
+        return (dt_util.utcnow() - issued_at).total_seconds()
+
+    def _needs_refresh(self) -> bool:
+        """Return True if the token is missing or about to expire."""
+        if self.token.access_token is None or self.expires_at is None:
+            return True
+        return self.token.is_expired(self.connection.oauth2_client.leeway)
+
+    async def async_get_access_token(self) -> OAuth2Token:
+        """Return a valid token, joining an in-flight refresh if there is one."""
+        if self._refreshing() or self._needs_refresh():
+            await self.async_refresh()
+        return self.token
+
+    def _refreshing(self) -> bool:
+        """Return True if a refresh is in flight.
+
+        A refresh that did not suspend finishes before it is stored, so its
+        task may already be done.
+        """
+        return self._refresh_task is not None and not self._refresh_task.done()
+
+    async def async_refresh(self) -> None:
+        """Refresh the token, sharing one in-flight refresh between callers."""
+        if not self._refreshing():
+            self._refresh_task = self.hass.async_create_task(
+                self._async_refresh(),
+                "porscheconnect token refresh",
+            )
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh(self) -> None:
+        """Exchange the refresh token, or log in again if it was rejected."""
+        start = time.monotonic()
+        try:
+            async with self.connection.token_lock:
+                token = self.token
+                oauth2_client = self.connection.oauth2_client
+                token_data = None
+                if token.refresh_token:
+                    token_data = await oauth2_client.refresh_token(token.refresh_token)
+                if not token_data or token_data.get("access_token") is None:
+                    auth_code = await oauth2_client.fetch_authorization_code()
+                    token_data = await oauth2_client.fetch_access_token(auth_code)
+                token.update(token_data)
+                token.expires_at = token_data["expires_in"]
+        finally:
+            self._refresh_task = None
+
+        self.refresh_latency = time.monotonic() - start
+        self.last_refresh = dt_util.utcnow()
+        _LOGGER.debug("Refreshed access token in %.3f s", self.refresh_latency)
+
+        self.async_schedule_refresh()
+        if self._on_refresh is not None:
+            self._on_refresh()
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Schedule the next background refresh ahead of token expiry."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+        if (expires_at := self.expires_at) is None:
+            return
+
+        when = dt_util.utc_from_timestamp(expires_at) - TOKEN_REFRESH_AHEAD
+        self._schedule_refresh_at(max(when, dt_util.utcnow()))
+
+    @callback
+    def _schedule_refresh_at(self, when: datetime) -> None:
+        """Schedule a background refresh at the given point in time."""
+        self._unsub_refresh = async_track_point_in_utc_time(
+            self.hass,
+            self._async_handle_refresh_interval,
+            when,
+        )
+
+    @callback
+    def _async_handle_refresh_interval(self, _now: datetime) -> None:
+        """Start a background refresh."""
+        self._unsub_refresh = None
+        self.hass.async_create_background_task(
+            self._async_background_refresh(),
+            "porscheconnect background token refresh",
+        )
+
+    async def _async_background_refresh(self) -> None:
+        """Refresh the token, retrying later if it fails."""
+        try:
+            await self.async_refresh()
+        except (PorscheExceptionError, httpx.HTTPError, TimeoutError) as exc:
+            _LOGGER.warning("Background token refresh failed: %s", exc)
+            self._schedule_refresh_at(dt_util.utcnow() + TOKEN_REFRESH_RETRY)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the scheduled background refresh."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+
+class PorscheTokenPersistence:
+    """Persist the account token in the config entry without redundant writes.
+
+    Every config entry update rewrites the whole config entry storage file, so
+    unchanged tokens are skipped and changes within the save delay are written
+    once.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialise the token persistence."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.writes = 0
+        self.skipped = 0
+
+        self._pending: dict | None = None
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TOKEN_SAVE_DELAY.total_seconds(),
+            immediate=False,
+            function=self._async_write,
+        )
+
+    @callback
+    def async_schedule_save(self, token: Mapping) -> None:
+        """Schedule a write of the token if it differs from the stored one."""
+        if not isinstance(token, Mapping):
+            return
+
+        if token == self.config_entry.data.get(CONF_ACCESS_TOKEN):
+            self._pending = None
+            self.skipped += 1
+            return
+
+        if token == self._pending:
+            self.skipped += 1
+            return
+
+        self._pending = copy.deepcopy(dict(token))
+        self._debouncer.async_schedule_call()
+
+    @callback
+    def _async_write(self) -> None:
+        """Write the pending token to the config entry."""
+        if self._pending is None:
+            return
+
+        _LOGGER.debug("Saving updated access token")
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **self.config_entry.data,
+                CONF_ACCESS_TOKEN: self._pending,
+            },
+        )
+        self._pending = None
+        self.writes += 1
+
+    @callback
+    def async_flush(self) -> None:
+        """Write a pending token right away."""
+        self._debouncer.async_cancel()
+        self._async_write()
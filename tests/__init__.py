@@ -3,15 +3,18 @@ from __future__ import annotations
 
 import json
 from typing import Any
+from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
 from custom_components.porscheconnect import DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from pyporscheconnectapi.oauth2 import OAuth2Token
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from .const import MOCK_CONFIG
+from .const import MOCK_TOKEN
 
 TEST_CONFIG_ENTRY_ID = "77889900ac"
 
@@ -22,6 +25,13 @@ def load_fixture_json(name):
         return data
 
 
+def mock_controller(vehicles: list | None = None) -> Mock:
+    """Return a mocked account controller with a valid access token."""
+    controller = Mock(get_vehicles=AsyncMock(return_value=vehicles or []))
+    controller.connection.token = OAuth2Token(dict(MOCK_TOKEN))
+    return controller
+
+
 def create_mock_porscheconnect_config_entry(
     hass: HomeAssistant,
     data: dict[str, Any] | None = None,
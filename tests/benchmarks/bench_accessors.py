@@ -0,0 +1,79 @@
+"""Benchmark measurement lookups for a fleet sized set of entities.
+
+Run with ``python -m tests.benchmarks.bench_accessors [vehicles]``.
+"""
+import sys
+import timeit
+
+from custom_components.porscheconnect import compile_measurement_accessor
+from custom_components.porscheconnect import get_from_dict
+from custom_components.porscheconnect.binary_sensor import (
+    SENSOR_TYPES as BINARY_SENSOR_TYPES,
+)
+from custom_components.porscheconnect.sensor import SENSOR_TYPES
+
+REPEAT = 5
+NUMBER = 20
+
+
+def entity_paths():
+    """Return the node and leaf pairs read by sensors and binary sensors."""
+    return [
+        (description.measurement_node, description.measurement_leaf)
+        for description in [*SENSOR_TYPES, *BINARY_SENSOR_TYPES]
+        if description.measurement_node and description.measurement_leaf
+    ]
+
+
+def vehicle_data(paths):
+    """Return vehicle data with a value for every path."""
+    data = {}
+    for node, leaf in paths:
+        value = data.setdefault(node, {})
+        *keys, last = leaf.split(".")
+        for key in keys:
+            value = value.setdefault(key, {})
+        value[last] = 42
+    return data
+
+
+def bench(vehicles):
+    """Return seconds per fleet update with get_from_dict and accessors."""
+    paths = entity_paths()
+    fleet = [vehicle_data(paths) for _ in range(vehicles)]
+    accessors = [compile_measurement_accessor(node, leaf) for node, leaf in paths]
+
+    def update_get_from_dict():
+        for data in fleet:
+            for node, leaf in paths:
+                get_from_dict(get_from_dict(data, node), leaf)
+
+    def update_accessors():
+        for data in fleet:
+            for accessor in accessors:
+                accessor(data)
+
+    return {
+        name: min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER
+        for name, func in (
+            ("get_from_dict", update_get_from_dict),
+            ("accessor", update_accessors),
+        )
+    }
+
+
+def main():
+    """Print the benchmark results."""
+    vehicles = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    entities = len(entity_paths()) * vehicles
+    results = bench(vehicles)
+    for name, seconds in results.items():
+        print(
+            f"{name:>14}: {seconds * 1000:8.3f} ms per update "
+            f"({seconds / entities * 1e9:6.0f} ns per entity, {entities} entities)"
+        )
+    print(f"{'speedup':>14}: {results['get_from_dict'] / results['accessor']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Benchmark steady-state poll cycles of accounts with 1, 10 and 100 vehicles.
+
+Each account is set up through its config entry with every platform, served
+by synthetic API payloads through an httpx mock transport. A cycle polls
+every vehicle as the coordinator does. The benchmark measures the cycle, a
+full fan-out of coordinator updates to every entity, the memory allocated
+during a cycle and the number of state writes.
+
+Run with ``python -m tests.benchmarks.bench_coordinator [vehicles ...]`` to
+compare with the stored baseline, exiting with an error on a regression.
+Add ``--update-baseline`` to store the results as the new baseline. Times
+depend on the machine, so record the baseline where the comparison runs.
+The stored baseline was recorded with Home Assistant 2025.4 on Python 3.13.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+from custom_components.porscheconnect.const import DOMAIN
+from homeassistant import loader
+from homeassistant.const import CONF_ACCESS_TOKEN, EVENT_STATE_CHANGED
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+from pytest_homeassistant_custom_component.common import mock_storage
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .. import synthetic
+from ..const import MOCK_CONFIG
+
+SIZES = (1, 10, 100)
+CYCLES = 5
+BASELINE = Path(__file__).with_name("baseline_coordinator.json")
+
+# Allowed factor over the baseline, and absolute slack for tiny accounts
+THRESHOLDS = {
+    "update_ms": (1.5, 2.0),
+    "dispatch_ms": (1.5, 2.0),
+    "allocated_kib": (1.25, 64),
+    "state_writes": (1.0, 0),
+}
+
+
+class FakeApi:
+    """Serve synthetic payloads for the vehicles of an account."""
+
+    def __init__(self, vehicles):
+        """Initialise the fake API."""
+        self.vehicles = vehicles
+        self.cycle = 0
+        self.requests = 0
+
+    def handler(self, request):
+        """Answer a request to the Porsche Connect API."""
+        self.requests += 1
+        path = request.url.path.removeprefix("/app").strip("/").split("/")
+        if path == ["connect", "v1", "vehicles"]:
+            return httpx.Response(200, json=synthetic.vehicle_list(self.vehicles))
+        index = int(path[3].removeprefix("WPTAYCAN"))
+        if path[4:] == ["pictures"]:
+            return httpx.Response(200, json=synthetic.pictures(index))
+        if not path[4:]:
+            measurements = request.url.params.get_list("mf") or None
+            return httpx.Response(
+                200, json=synthetic.overview(index, self.cycle, measurements)
+            )
+        return httpx.Response(404)
+
+
+def access_token():
+    """Return an access token that does not expire during the benchmark."""
+    expires_in = 365 * 24 * 3600
+    return {
+        "access_token": "benchmark",
+        "token_type": "Bearer",
+        "expires_in": expires_in,
+        "expires_at": int(time.time()) + expires_in,
+    }
+
+
+async def async_setup_account(hass, api):
+    """Set up a config entry for the account served by the fake API."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG | {CONF_ACCESS_TOKEN: access_token()},
+        entry_id=f"bench{api.vehicles}",
+    )
+    config_entry.add_to_hass(hass)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    with patch(
+        "custom_components.porscheconnect.get_async_client", return_value=client
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    return hass.data[DOMAIN][config_entry.entry_id]
+
+
+async def async_cycle(hass, account, api):
+    """Poll every vehicle of the account once."""
+    api.cycle += 1
+    await account._async_update_data()
+    await hass.async_block_till_done()
+
+
+async def async_bench_account(hass, vehicles):
+    """Return the steady-state cost of a poll cycle of an account."""
+    api = FakeApi(vehicles)
+    account = await async_setup_account(hass, api)
+    coordinators = list(account.vehicle_coordinators.values())
+    # The first cycles fetch everything and settle the fetch plans
+    for _ in range(2):
+        await async_cycle(hass, account, api)
+
+    state_changes = 0
+
+    def count_state_change(_event):
+        nonlocal state_changes
+        state_changes += 1
+
+    writes = 0
+    write_ha_state = Entity.async_write_ha_state
+
+    def count_write(entity):
+        nonlocal writes
+        writes += 1
+        write_ha_state(entity)
+
+    update, dispatch = [], []
+    requests = api.requests
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_change)
+    with patch.object(Entity, "async_write_ha_state", count_write):
+        for _ in range(CYCLES):
+            start = time.perf_counter()
+            await async_cycle(hass, account, api)
+            update.append(time.perf_counter() - start)
+        state_writes, cycle_changes = writes / CYCLES, state_changes / CYCLES
+        requests = (api.requests - requests) / CYCLES
+
+        for _ in range(CYCLES):
+            start = time.perf_counter()
+            for coordinator in coordinators:
+                # Every listener, as after a change of availability
+                coordinator._async_dispatch(None)
+            dispatch.append(time.perf_counter() - start)
+    unsub()
+
+    tracemalloc.start()
+    await async_cycle(hass, account, api)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "entities": len(hass.states.async_all()),
+        "requests_per_cycle": requests,
+        "update_ms": round(statistics.median(update) * 1000, 3),
+        "dispatch_ms": round(statistics.median(dispatch) * 1000, 3),
+        "allocated_kib": round(peak / 1024, 1),
+        "state_writes": state_writes,
+        "state_changes": cycle_changes,
+        "throttled_calls": account.rate_limiter.throttled.total(),
+    }
+
+
+async def async_bench(sizes):
+    """Return the results for accounts of each size."""
+    results = {}
+    for vehicles in sizes:
+        with mock_storage():
+            async with async_test_home_assistant() as hass:
+                # Load the integration from custom_components
+                hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+                results[str(vehicles)] = await async_bench_account(hass, vehicles)
+    return results
+
+
+def compare(results, baseline):
+    """Return the results that regressed from the baseline."""
+    regressions = []
+    for size, metrics in results.items():
+        if (base := baseline.get(size)) is None:
+            continue
+        for metric, (factor, slack) in THRESHOLDS.items():
+            limit = base[metric] * factor + slack
+            if metrics[metric] > limit:
+                regressions.append(
+                    f"{size} vehicles: {metric} {metrics[metric]} "
+                    f"exceeds {limit:.1f} (baseline {base[metric]})"
+                )
+    return regressions
+
+
+def main():
+    """Run the benchmark and compare it with the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("vehicles", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_bench(args.vehicles))
+    for size, metrics in results.items():
+        print(
+            f"{size:>4} vehicles: {metrics['entities']:5} entities, "
+            f"update {metrics['update_ms']:9.3f} ms, "
+            f"fan-out {metrics['dispatch_ms']:9.3f} ms, "
+            f"{metrics['allocated_kib']:9.1f} KiB, "
+            f"{metrics['state_writes']:6.0f} state writes per cycle"
+        )
+
+    # Throttled polls skip work, which would make the account look faster
+    if throttled := [size for size, m in results.items() if m["throttled_calls"]]:
+        print(f"Quota throttled the accounts of {', '.join(throttled)} vehicles")
+        return 1
+
+    if args.update_baseline:
+        baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+        BASELINE.write_text(json.dumps(baseline | results, indent=2) + "\n")
+        print(f"Stored baseline in {BASELINE}")
+        return 0
+    if not BASELINE.exists():
+        print("No baseline stored, run with --update-baseline to record one")
+        return 0
+
+    regressions = compare(results, json.loads(BASELINE.read_text()))
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Benchmark fleet mode setup and poll cycles of accounts with many vehicles.
+
+Each account is set up in fleet mode through its config entry with every
+platform, served by synthetic API payloads as in the coordinator benchmark.
+The benchmark measures the setup, a poll cycle of every vehicle and the
+peak memory allocated during a cycle, and checks that each grows linearly
+with the number of vehicles: the cost per vehicle of every size may not
+exceed that of the smallest size by more than the allowed factor. The
+account keeps its default API quota, which may not throttle any call.
+
+Run with ``python -m tests.benchmarks.bench_fleet [vehicles ...]``, exiting
+with an error when a cost grows faster than linearly. Add ``--no-fleet`` to
+compare with the default mode.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import httpx
+from custom_components.porscheconnect.const import CONF_FLEET_MODE
+from custom_components.porscheconnect.const import DOMAIN
+from homeassistant import loader
+from homeassistant.const import CONF_ACCESS_TOKEN
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+from pytest_homeassistant_custom_component.common import mock_storage
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from ..const import MOCK_CONFIG
+from .bench_coordinator import CYCLES
+from .bench_coordinator import FakeApi
+from .bench_coordinator import access_token
+from .bench_coordinator import async_cycle
+
+SIZES = (50, 100, 200, 400)
+
+# Allowed factor over the cost per vehicle of the smallest size, and
+# absolute slack per vehicle for noise
+LINEARITY = {
+    "setup_ms": (1.5, 0.5),
+    "cycle_ms": (1.5, 0.2),
+    "allocated_kib": (1.25, 2),
+}
+
+
+async def async_bench_account(hass, vehicles, *, fleet_mode):
+    """Return the cost of setting up and polling an account."""
+    api = FakeApi(vehicles)
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG | {CONF_ACCESS_TOKEN: access_token()},
+        options={CONF_FLEET_MODE: fleet_mode},
+        entry_id=f"fleet{vehicles}",
+    )
+    config_entry.add_to_hass(hass)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    with patch(
+        "custom_components.porscheconnect.get_async_client", return_value=client
+    ):
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        setup = time.perf_counter() - start
+
+    account = hass.data[DOMAIN][config_entry.entry_id]
+    # The first cycles fetch everything and settle the fetch plans
+    for _ in range(2):
+        await async_cycle(hass, account, api)
+
+    cycles = []
+    for _ in range(CYCLES):
+        start = time.perf_counter()
+        await async_cycle(hass, account, api)
+        cycles.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    await async_cycle(hass, account, api)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "entities": len(hass.states.async_all()),
+        "setup_ms": round(setup * 1000, 1),
+        "cycle_ms": round(statistics.median(cycles) * 1000, 3),
+        "allocated_kib": round(peak / 1024, 1),
+        "throttled_calls": account.rate_limiter.throttled.total(),
+    }
+
+
+async def async_bench(sizes, *, fleet_mode):
+    """Return the results for accounts of each size."""
+    results = {}
+    for vehicles in sizes:
+        with mock_storage():
+            async with async_test_home_assistant() as hass:
+                # Load the integration from custom_components
+                hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+                results[vehicles] = await async_bench_account(
+                    hass, vehicles, fleet_mode=fleet_mode
+                )
+    return results
+
+
+def check_linear(results):
+    """Return the costs that grew faster than linearly."""
+    smallest = min(results)
+    violations = []
+    for vehicles, metrics in results.items():
+        # The quota is sized by the number of vehicles, a fleet is not throttled
+        if metrics["throttled_calls"]:
+            violations.append(
+                f"{vehicles} vehicles: {metrics['throttled_calls']} calls throttled"
+            )
+        for metric, (factor, slack) in LINEARITY.items():
+            base = results[smallest][metric] / smallest
+            limit = base * factor + slack
+            if (per_vehicle := metrics[metric] / vehicles) > limit:
+                violations.append(
+                    f"{vehicles} vehicles: {metric} {per_vehicle:.3f} per vehicle "
+                    f"exceeds {limit:.3f} ({base:.3f} at {smallest} vehicles)"
+                )
+    return violations
+
+
+def main():
+    """Run the benchmark and check that it scales linearly."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("vehicles", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--no-fleet", action="store_true")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_bench(args.vehicles, fleet_mode=not args.no_fleet))
+    for size, metrics in results.items():
+        print(
+            f"{size:>4} vehicles: {metrics['entities']:6} entities, "
+            f"setup {metrics['setup_ms']:9.1f} ms, "
+            f"cycle {metrics['cycle_ms']:9.3f} ms, "
+            f"{metrics['allocated_kib']:9.1f} KiB, "
+            f"{metrics['allocated_kib'] / size:6.1f} KiB per vehicle"
+        )
+
+    violations = check_linear(results)
+    for violation in violations:
+        print(f"SUPERLINEAR {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
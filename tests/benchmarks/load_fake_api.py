@@ -0,0 +1,215 @@
+"""Load-test accounts against the local fake Porsche Connect API.
+
+Each account is set up through its config entry with every platform, and
+talks to its own fake API server over HTTP through the real connection, so
+the token refresh, quota, circuit breaker and command tracking all take part.
+Once set up, the faults are switched on and every vehicle is polled for a
+number of cycles, optionally locking each vehicle as a non-blocking command.
+
+Run with ``python -m tests.benchmarks.load_fake_api`` and see ``--help`` for
+the latency, error and throttling knobs.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+from unittest.mock import patch
+
+from custom_components.porscheconnect.const import CONF_NON_BLOCKING_COMMANDS
+from custom_components.porscheconnect.const import DOMAIN
+from custom_components.porscheconnect.const import EVENT_COMMAND_COMPLETED
+from homeassistant import loader
+from homeassistant.const import CONF_ACCESS_TOKEN
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+from pytest_homeassistant_custom_component.common import mock_storage
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from ..const import MOCK_CONFIG
+from ..fake_api import FakePorscheApi
+from ..fake_api import Faults
+from ..fake_api import lognormal
+
+
+async def async_setup_account(hass, api, index):
+    """Set up a config entry for the account served by a fake API."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG | {CONF_ACCESS_TOKEN: api.token()},
+        options={CONF_NON_BLOCKING_COMMANDS: True},
+        entry_id=f"load{index}",
+    )
+    config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.porscheconnect.get_async_client",
+        return_value=api.client(),
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    return hass.data[DOMAIN][config_entry.entry_id]
+
+
+async def async_send_commands(hass, accounts):
+    """Lock every vehicle and return the completed commands by status."""
+    coordinators = [
+        coordinator
+        for account in accounts
+        for coordinator in account.vehicle_coordinators.values()
+    ]
+    completed = []
+    done = asyncio.Event()
+
+    def command_completed(event):
+        completed.append(event.data)
+        if len(completed) == len(coordinators):
+            done.set()
+
+    unsub = hass.bus.async_listen(EVENT_COMMAND_COMPLETED, command_completed)
+    results = await asyncio.gather(
+        *(
+            coordinator.async_remote_command(
+                "lock", coordinator.vehicle.remote_services.lock_vehicle
+            )
+            for coordinator in coordinators
+        ),
+        return_exceptions=True,
+    )
+    rejected = sum(isinstance(result, Exception) for result in results)
+    if rejected < len(coordinators):
+        await done.wait()
+    unsub()
+    return completed, rejected
+
+
+async def async_load(args):
+    """Run the load test and return what happened."""
+    faults = Faults(
+        latency=lognormal(args.latency / 1000, args.latency_sigma),
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        command_delay=args.command_delay,
+        command_error_rate=args.command_error_rate,
+    )
+    # Each account has its own vehicles
+    servers = [
+        FakePorscheApi(args.vehicles, first_vehicle=index * args.vehicles)
+        for index in range(args.accounts)
+    ]
+    with mock_storage():
+        async with async_test_home_assistant() as hass:
+            # Load the integration from custom_components
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            for server in servers:
+                await server.__aenter__()
+            try:
+                accounts = [
+                    await async_setup_account(hass, server, index)
+                    for index, server in enumerate(servers)
+                ]
+                for server in servers:
+                    server.faults = faults
+
+                cycles = []
+                for _ in range(args.cycles):
+                    start = time.monotonic()
+                    for server in servers:
+                        server.cycle += 1
+                    await asyncio.gather(
+                        *(account._async_refresh_vehicles() for account in accounts)
+                    )
+                    await hass.async_block_till_done()
+                    cycles.append(time.monotonic() - start)
+                    await asyncio.sleep(args.interval)
+
+                commands = ([], 0)
+                if args.commands:
+                    commands = await async_send_commands(hass, accounts)
+            finally:
+                for server in servers:
+                    await server.__aexit__(None, None, None)
+    return accounts, servers, cycles, commands
+
+
+def report(accounts, servers, cycles, commands):
+    """Print what happened during the load test."""
+    coordinators = [
+        coordinator
+        for account in accounts
+        for coordinator in account.vehicle_coordinators.values()
+    ]
+    # The most recent polls of each vehicle
+    durations = sorted(
+        duration
+        for coordinator in coordinators
+        for duration in coordinator.poll_metrics.durations
+    )
+    succeeded = sum(
+        coordinator.poll_metrics.durations.count for coordinator in coordinators
+    )
+    failed = sum(coordinator.poll_metrics.failures for coordinator in coordinators)
+    responses = sum((server.responses for server in servers), Counter())
+    requests = sum(sum(server.requests.values()) for server in servers)
+
+    print(
+        f"{len(accounts)} accounts of {len(coordinators) // len(accounts)} "
+        f"vehicles, {len(cycles)} cycles, median cycle "
+        f"{statistics.median(cycles) * 1000:.1f} ms"
+    )
+    print(f"polls: {succeeded} succeeded, {failed} failed")
+    if durations:
+        p95 = durations[int(0.95 * (len(durations) - 1))]
+        print(
+            f"poll duration: p50 {statistics.median(durations) * 1000:.1f} ms, "
+            f"p95 {p95 * 1000:.1f} ms"
+        )
+    print(
+        f"server: {requests} requests, "
+        + ", ".join(
+            f"{count} x {status}" for status, count in sorted(responses.items())
+        )
+    )
+    print(
+        "circuit breakers: "
+        f"{sum(account.circuit_breaker.trips > 0 for account in accounts)} tripped, "
+        f"{sum(account.circuit_breaker.state != 'closed' for account in accounts)} "
+        "still open"
+    )
+
+    completed, rejected = commands
+    if completed:
+        statuses = Counter(command["status"] for command in completed)
+        median = statistics.median(command["duration"] for command in completed)
+        print(
+            f"commands: {rejected} rejected, "
+            + ", ".join(f"{count} {status}" for status, count in statuses.items())
+            + f", median completion {median:.1f} s"
+        )
+    elif rejected:
+        print(f"commands: {rejected} rejected")
+
+
+def main():
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=5)
+    parser.add_argument("--vehicles", type=int, default=2)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.0, help="seconds")
+    parser.add_argument("--latency", type=float, default=200, help="median ms")
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=30, help="seconds")
+    parser.add_argument("--commands", action="store_true")
+    parser.add_argument("--command-delay", type=float, default=5, help="seconds")
+    parser.add_argument("--command-error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    report(*asyncio.run(async_load(args)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
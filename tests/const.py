@@ -4,3 +4,12 @@ from homeassistant.const import CONF_PASSWORD
 
 
 MOCK_CONFIG = {CONF_EMAIL: "test_username", CONF_PASSWORD: "test_password"}
+
+# Expires on 1 January 2100
+MOCK_TOKEN = {
+    "access_token": "test_access_token",
+    "refresh_token": "test_refresh_token",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "expires_at": 4102444800,
+}
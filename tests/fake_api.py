@@ -0,0 +1,240 @@
+"""Local stand-in for the Porsche Connect API and identity provider.
+
+The server answers the endpoints the integration uses with the synthetic
+payloads of ``tests.synthetic``: the vehicle list, overviews, pictures,
+remote commands and their status, the authorization code and the token
+exchange. Latency, server errors, throttling and how long commands take to
+complete can be set per server, to load-test polling, backoff and commands
+offline with the real ``Connection``:
+
+    async with FakePorscheApi(vehicles=10, faults=Faults(error_rate=0.1)) as api:
+        connection = PorscheConnection(async_client=api.client(), token=api.token())
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+
+import httpx
+from aiohttp import web
+from pyporscheconnectapi.const import REDIRECT_URI
+
+from . import synthetic
+
+API_PREFIX = "/app/connect/v1/vehicles"
+
+
+def constant(seconds: float) -> Callable[[random.Random], float]:
+    """Return a latency distribution that always takes the given time."""
+    return lambda _rng: seconds
+
+
+def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+    """Return a latency distribution uniform between two times."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float) -> Callable[[random.Random], float]:
+    """Return a long tailed latency distribution around a median."""
+    return lambda rng: median * rng.lognormvariate(0, sigma)
+
+
+@dataclass
+class Faults:
+    """How the fake API misbehaves.
+
+    Rates are the share of API requests answered with a 503 or a 429. Token
+    requests are never faulted. Commands are performed after the command
+    delay, or fail at the command error rate.
+    """
+
+    latency: Callable[[random.Random], float] = field(default=constant(0))
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int | None = 30
+    command_delay: float = 0.0
+    command_error_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class _Command:
+    """A remote command sent to the fake API."""
+
+    vin: str
+    command: dict
+    done_at: float
+    fails: bool
+
+
+class _LocalTransport(httpx.AsyncBaseTransport):
+    """Send requests for any host to the local server."""
+
+    def __init__(self, port: int) -> None:
+        """Initialise the transport."""
+        self._port = port
+        self._transport = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Rewrite the URL of the request to the local server and send it."""
+        request.url = request.url.copy_with(
+            scheme="http", host="127.0.0.1", port=self._port
+        )
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the connections to the local server."""
+        await self._transport.aclose()
+
+
+class FakePorscheApi:
+    """Serve a fake Porsche Connect account on a local port."""
+
+    def __init__(
+        self,
+        vehicles: int = 1,
+        faults: Faults | None = None,
+        first_vehicle: int = 0,
+    ) -> None:
+        """Initialise the fake API, numbering its vehicles from the first."""
+        self.vehicles = vehicles
+        self.first_vehicle = first_vehicle
+        self.faults = faults or Faults()
+        self.cycle = 0
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[int] = Counter()
+        self.commands: dict[str, _Command] = {}
+        self.port: int | None = None
+
+        self._rng = random.Random(self.faults.seed)
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> FakePorscheApi:
+        """Start the server."""
+        app = web.Application(middlewares=[self._faults_middleware])
+        app.router.add_get("/authorize", self._authorize)
+        app.router.add_post("/oauth/token", self._token)
+        app.router.add_get(API_PREFIX, self._vehicle_list)
+        app.router.add_get(f"{API_PREFIX}/{{vin}}", self._overview)
+        app.router.add_get(f"{API_PREFIX}/{{vin}}/pictures", self._pictures)
+        app.router.add_post(f"{API_PREFIX}/{{vin}}/commands", self._send_command)
+        app.router.add_get(
+            f"{API_PREFIX}/{{vin}}/commands/{{status_id}}", self._command_status
+        )
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        await self._runner.cleanup()
+
+    def client(self) -> httpx.AsyncClient:
+        """Return an HTTP client sending every request to the fake API."""
+        return httpx.AsyncClient(transport=_LocalTransport(self.port))
+
+    def token(self, expires_in: int = 3600) -> dict:
+        """Return an access token as stored in the config entry."""
+        return self._new_token(expires_in) | {
+            "expires_at": int(time.time()) + expires_in
+        }
+
+    def _new_token(self, expires_in: int = 3600) -> dict:
+        """Return a freshly issued token."""
+        return {
+            "access_token": f"access-{uuid.uuid4()}",
+            "refresh_token": f"refresh-{uuid.uuid4()}",
+            "id_token": "id",
+            "token_type": "Bearer",
+            "expires_in": expires_in,
+        }
+
+    @web.middleware
+    async def _faults_middleware(self, request, handler):
+        """Delay requests and answer some of them with errors."""
+        endpoint = request.match_info.route.resource.canonical
+        self.requests[endpoint] += 1
+        await asyncio.sleep(max(0.0, self.faults.latency(self._rng)))
+
+        response = None
+        if request.path.startswith(API_PREFIX):
+            roll = self._rng.random()
+            if roll < self.faults.throttle_rate:
+                headers = {}
+                if self.faults.retry_after is not None:
+                    headers["Retry-After"] = str(self.faults.retry_after)
+                response = web.Response(status=429, headers=headers)
+            elif roll < self.faults.throttle_rate + self.faults.error_rate:
+                response = web.Response(status=503)
+        if response is None:
+            response = await handler(request)
+        self.responses[response.status] += 1
+        return response
+
+    def _index(self, request) -> int:
+        """Return the index of the synthetic vehicle of a request."""
+        index = int(request.match_info["vin"].removeprefix("WPTAYCAN"))
+        if not 0 <= index - self.first_vehicle < self.vehicles:
+            raise web.HTTPNotFound
+        return index
+
+    async def _authorize(self, request):
+        """Hand out an authorization code, as for an existing session."""
+        state = request.query.get("state", "")
+        raise web.HTTPFound(f"{REDIRECT_URI}?code=fake-code&state={state}")
+
+    async def _token(self, request):
+        """Exchange an authorization code or refresh token for a token."""
+        data = await request.post()
+        if data.get("grant_type") not in ("authorization_code", "refresh_token"):
+            return web.json_response({"error": "unsupported_grant_type"}, status=400)
+        return web.json_response(self._new_token())
+
+    async def _vehicle_list(self, _request):
+        """Return the vehicle list."""
+        return web.json_response(
+            synthetic.vehicle_list(self.vehicles, self.first_vehicle)
+        )
+
+    async def _overview(self, request):
+        """Return the stored overview of the requested measurements."""
+        measurements = request.query.getall("mf", []) or None
+        return web.json_response(
+            synthetic.overview(self._index(request), self.cycle, measurements)
+        )
+
+    async def _pictures(self, request):
+        """Return the picture locations."""
+        return web.json_response(synthetic.pictures(self._index(request)))
+
+    async def _send_command(self, request):
+        """Accept a remote command, to be performed after the command delay."""
+        self._index(request)
+        status_id = str(uuid.uuid4())
+        self.commands[status_id] = _Command(
+            vin=request.match_info["vin"],
+            command=await request.json(),
+            done_at=time.monotonic() + self.faults.command_delay,
+            fails=self._rng.random() < self.faults.command_error_rate,
+        )
+        return web.json_response({"status": {"id": status_id, "result": "ACCEPTED"}})
+
+    async def _command_status(self, request):
+        """Return the execution state of a remote command."""
+        if (command := self.commands.get(request.match_info["status_id"])) is None:
+            raise web.HTTPNotFound
+        if time.monotonic() < command.done_at:
+            result = "UNKNOWN"
+        else:
+            result = "ERROR" if command.fails else "PERFORMED"
+        return web.json_response({"status": {"result": result}})
@@ -0,0 +1,151 @@
+"""Synthetic Porsche Connect API payloads for benchmarks and load tests.
+
+The JSON fixtures were recorded from the retired Porsche Connect API. The
+payloads built here follow the current API, with the model and the
+measurements of the taycan fixture, so any number of vehicles can be made.
+"""
+from __future__ import annotations
+
+import copy
+from functools import cache
+from typing import Any
+
+from custom_components.porscheconnect.binary_sensor import (
+    SENSOR_TYPES as BINARY_SENSOR_TYPES,
+)
+from custom_components.porscheconnect.sensor import SENSOR_TYPES
+from pyporscheconnectapi.const import MEASUREMENTS
+
+from . import load_fixture_json
+
+FIXTURE = "taycan"
+FIXTURE_VEHICLES = "https://api.porsche.com/core/api/v3/de/de_DE/vehicles"
+FIXTURE_STORED = (
+    "https://api.porsche.com/service-vehicle/de/de_DE/vehicle-data/WPTAYCAN/stored"
+)
+PICTURE_VIEWS = ("frontView", "sideView", "rearView", "rearTopView", "topView")
+TIMESTAMP = "2024-05-01T12:00:00.000Z"
+
+
+def vin(index: int) -> str:
+    """Return the VIN of the synthetic vehicle with the given index."""
+    return f"WPTAYCAN{index:09d}"
+
+
+@cache
+def _seed() -> dict[str, Any]:
+    """Return the values taken from the taycan fixture."""
+    fixture = load_fixture_json(FIXTURE)["GET"]
+    (vehicle,) = fixture[FIXTURE_VEHICLES]
+    stored = fixture[FIXTURE_STORED]
+    electric = stored["remainingRanges"]["electricalRange"]["distance"]
+    return {
+        "model_name": vehicle["modelDescription"],
+        "model_code": vehicle["modelType"],
+        "model_year": vehicle["modelYear"],
+        "battery_level": stored["batteryLevel"]["value"],
+        "mileage": stored["mileage"]["valueInKilometers"],
+        "electric_range": electric["valueInKilometers"],
+    }
+
+
+@cache
+def _measurement_values() -> dict[str, dict[str, Any]]:
+    """Return a value for every measurement, covering every entity."""
+    values: dict[str, dict[str, Any]] = {node: {} for node in MEASUREMENTS}
+    for description in [*SENSOR_TYPES, *BINARY_SENSOR_TYPES]:
+        node, leaf = description.measurement_node, description.measurement_leaf
+        if not node or not leaf:
+            continue
+        value = values.setdefault(node, {})
+        *keys, last = leaf.split(".")
+        for key in keys:
+            value = value.setdefault(key, {})
+        value[last] = 42
+
+    seed = _seed()
+    values["BATTERY_LEVEL"]["percent"] = seed["battery_level"]
+    values["MILEAGE"]["kilometers"] = seed["mileage"]
+    values["E_RANGE"]["kilometers"] = seed["electric_range"]
+    values["GLOBAL_PRIVACY_MODE"] = {"isEnabled": False}
+    values["REMOTE_ACCESS_AUTHORIZATION"] = {"isEnabled": True}
+    values["LOCK_STATE_VEHICLE"] = {"isLocked": True}
+    values["CLIMATIZER_STATE"] = {"isOn": False}
+    values["GPS_LOCATION"] = {
+        "location": "59.329300,18.068600",
+        "direction": 90,
+        "lastModified": TIMESTAMP,
+    }
+    for node in values:
+        if node.startswith("OPEN_STATE_"):
+            values[node] = {"isOpen": False}
+    values["TIRE_PRESSURE"] = {
+        f"{tire}Tire": {
+            "actualPressureBar": 2.9,
+            "optimalPressureBar": 2.9,
+            "differenceBar": 0.0,
+        }
+        for tire in ("frontLeft", "frontRight", "backLeft", "backRight")
+    }
+    values["CHARGING_RATE"] = {"chargingRate": 0, "chargingPower": 0}
+    values["CHARGING_SUMMARY"] = {
+        "mode": "DIRECT",
+        "status": "NOT_CHARGING",
+        "minSoC": 80,
+    }
+    return values
+
+
+def base_data(index: int) -> dict[str, Any]:
+    """Return the vehicle list entry of a synthetic vehicle."""
+    seed = _seed()
+    return {
+        "vin": vin(index),
+        "modelName": seed["model_name"],
+        "customName": f"{seed['model_name']} {index}",
+        "modelType": {
+            "code": seed["model_code"],
+            "year": seed["model_year"],
+            "engine": "BEV",
+        },
+        "systemInfo": {"platform": "J1"},
+        "timestamp": TIMESTAMP,
+    }
+
+
+def vehicle_list(count: int, first: int = 0) -> list[dict[str, Any]]:
+    """Return the vehicle list of an account with the given number of cars.
+
+    The cars are numbered from the first index, so that several accounts can
+    each have their own cars.
+    """
+    return [base_data(index) for index in range(first, first + count)]
+
+
+def overview(
+    index: int, cycle: int = 0, measurements: list[str] | None = None
+) -> dict[str, Any]:
+    """Return the stored overview of a synthetic vehicle.
+
+    The battery level, mileage and range move with the cycle, so each poll
+    reports a few changed measurements, as a driving car would.
+    """
+    values = copy.deepcopy(_measurement_values())
+    values["BATTERY_LEVEL"]["percent"] -= cycle % 10
+    values["MILEAGE"]["kilometers"] += cycle
+    values["E_RANGE"]["kilometers"] -= cycle % 10
+    return base_data(index) | {
+        "measurements": [
+            {"key": key, "status": {"isEnabled": True}, "value": value}
+            for key, value in values.items()
+            if measurements is None or key in measurements
+        ]
+    }
+
+
+def pictures(index: int) -> list[dict[str, str]]:
+    """Return the picture locations of a synthetic vehicle."""
+    return [
+        {"view": view, "url": f"https://pictures.example.com/{vin(index)}/{view}.png"}
+        for view in PICTURE_VIEWS
+    ]
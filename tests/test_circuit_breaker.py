@@ -0,0 +1,92 @@
+"""Test porscheconnect API circuit breaker."""
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from custom_components.porscheconnect.circuit_breaker import PorscheCircuitBreaker
+from custom_components.porscheconnect.circuit_breaker import PorscheCircuitOpenError
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pyporscheconnectapi.exceptions import PorscheWrongCredentialsError
+
+
+def api_error(status_code, headers=None):
+    """Return the error the library raises for an API response."""
+    request = httpx.Request("GET", "https://api.ppa.porsche.com/connect/v1/vehicles")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    try:
+        raise PorscheExceptionError(status_code) from httpx.HTTPStatusError(
+            "error", request=request, response=response
+        )
+    except PorscheExceptionError as exc:
+        return exc
+
+
+def breaker(hass):
+    """Return a circuit breaker with a mocked config entry."""
+    return PorscheCircuitBreaker(hass, Mock(), Mock(), on_change=Mock())
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_failures_and_recovers(hass):
+    """Test that repeated backend failures open the circuit until a trial call."""
+    circuit = breaker(hass)
+
+    for _ in range(3):
+        circuit.async_before_call()
+        circuit.async_record_failure(api_error(503))
+    assert circuit.state == "open"
+    with pytest.raises(PorscheCircuitOpenError):
+        circuit.async_before_call()
+
+    with patch(
+        "custom_components.porscheconnect.circuit_breaker.dt_util.utcnow",
+        return_value=circuit.retry_at + timedelta(seconds=1),
+    ):
+        circuit.async_before_call()
+        assert circuit.state == "half_open"
+        # Only one trial call at a time
+        with pytest.raises(PorscheCircuitOpenError):
+            circuit.async_before_call()
+
+    circuit.async_record_success()
+    assert circuit.state == "closed"
+    assert circuit.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_opens_circuit_right_away(hass):
+    """Test that a Retry-After header decides when to try again."""
+    circuit = breaker(hass)
+
+    circuit.async_before_call()
+    circuit.async_record_failure(api_error(429, {"retry-after": "120"}))
+
+    assert circuit.state == "open"
+    assert circuit.retry_at - dt_util.utcnow() > timedelta(seconds=110)
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_circuit(hass):
+    """Test that refused requests are not counted as backend failures."""
+    circuit = breaker(hass)
+
+    for _ in range(5):
+        circuit.async_before_call()
+        circuit.async_record_failure(api_error(404))
+
+    assert circuit.state == "closed"
+    assert circuit.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_auth_errors_start_reauth(hass):
+    """Test that rejected credentials start a reauth flow instead of retrying."""
+    circuit = breaker(hass)
+
+    circuit.async_before_call()
+    circuit.async_record_failure(PorscheWrongCredentialsError("Wrong credentials"))
+
+    circuit.config_entry.async_start_reauth.assert_called_once_with(hass)
+    assert circuit.state == "closed"
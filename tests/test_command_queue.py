@@ -0,0 +1,77 @@
+"""Test porscheconnect remote command queue."""
+import asyncio
+
+import pytest
+from custom_components.porscheconnect.command_queue import PorscheCommandQueue
+from custom_components.porscheconnect.command_queue import (
+    PorscheCommandQueueFullError,
+)
+
+
+@pytest.mark.asyncio
+async def test_commands_are_serialized_and_coalesced(hass):
+    """Test that a waiting command is superseded by a later one in its slot."""
+    queue = PorscheCommandQueue(hass, "WPTAYCAN0")
+    executed = []
+    running = 0
+
+    def command(value):
+        async def job():
+            nonlocal running
+            running += 1
+            assert running == 1
+            await asyncio.sleep(0.01)
+            executed.append(value)
+            running -= 1
+            return value
+
+        return job
+
+    results = await asyncio.gather(
+        queue.async_submit("target_soc", command(60)),
+        queue.async_submit("climatise", command("on")),
+        queue.async_submit("target_soc", command(70)),
+        queue.async_submit("target_soc", command(80)),
+    )
+
+    assert executed == [60, "on", 80]
+    assert results == [60, "on", 80, 80]
+    assert queue.coalesced == 1
+    assert queue.executed == 3
+    assert queue.queue_wait is not None
+    assert queue.execution_time is not None
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_commands(hass):
+    """Test that commands for new slots are rejected while the queue is full."""
+    queue = PorscheCommandQueue(hass, "WPTAYCAN0", max_depth=1)
+    release = asyncio.Event()
+
+    async def job():
+        await release.wait()
+
+    running = asyncio.ensure_future(queue.async_submit("lock", job))
+    await asyncio.sleep(0)
+    waiting = asyncio.ensure_future(queue.async_submit("climatise", job))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PorscheCommandQueueFullError):
+        await queue.async_submit("direct_charging", job)
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert queue.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_commands_run_after_a_command_that_did_not_suspend(hass):
+    """Test that a worker finishing right away does not stall later commands."""
+    queue = PorscheCommandQueue(hass, "WPTAYCAN0")
+
+    async def job():
+        return "done"
+
+    assert await queue.async_submit("lock", job) == "done"
+    assert await asyncio.wait_for(queue.async_submit("lock", job), 1) == "done"
+    assert queue.executed == 2
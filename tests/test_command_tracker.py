@@ -0,0 +1,123 @@
+"""Test porscheconnect non-blocking remote commands."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from custom_components.porscheconnect import PorscheConnectDataUpdateCoordinator
+from custom_components.porscheconnect.api import PendingRemoteServiceStatus
+from custom_components.porscheconnect.const import (
+    CONF_NON_BLOCKING_COMMANDS,
+    DOMAIN,
+    EVENT_COMMAND_COMPLETED,
+)
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from . import mock_controller
+from .const import MOCK_CONFIG
+from .test_init import mock_vehicle
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("result", "status"), [("PERFORMED", "performed"), ("ERROR", "error")]
+)
+async def test_command_completion_tracked_in_background(hass, result, status):
+    """Test that commands return once accepted and complete in the background."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        options={CONF_NON_BLOCKING_COMMANDS: True},
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+    events = async_capture_events(hass, EVENT_COMMAND_COMPLETED)
+
+    vehicle = mock_vehicle("WPTAYCAN0", AsyncMock(return_value={}))
+    vehicle.connection.post = AsyncMock(
+        return_value={"status": {"id": "42", "result": "ACCEPTED"}}
+    )
+    controller = mock_controller([vehicle])
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+    await coordinator._async_update_data()
+    vehicle_coordinator = coordinator.vehicle_coordinators["WPTAYCAN0"]
+    on_failure = Mock()
+
+    vehicle.connection.get = AsyncMock(return_value={"status": {"result": result}})
+    with patch(
+        "custom_components.porscheconnect.command_tracker.COMMAND_STATUS_POLL_MIN",
+        timedelta(0),
+    ):
+        pending = await vehicle_coordinator.async_remote_command(
+            "flash_indicators",
+            vehicle.remote_services.flash_indicators,
+            on_failure=on_failure,
+        )
+        assert isinstance(pending, PendingRemoteServiceStatus)
+        assert vehicle_coordinator.command_tracker.status == "pending"
+
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    vehicle.connection.get.assert_any_call(
+        "/connect/v1/vehicles/WPTAYCAN0/commands/42"
+    )
+    assert vehicle_coordinator.command_tracker.status == status
+    assert on_failure.call_count == (status == "error")
+    assert len(events) == 1
+    assert events[0].data["command"] == "flash_indicators"
+    assert events[0].data["status"] == status
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_command_tracking_survives_transport_errors(hass):
+    """Test that a failing status poll is retried instead of ending tracking."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        options={CONF_NON_BLOCKING_COMMANDS: True},
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+    events = async_capture_events(hass, EVENT_COMMAND_COMPLETED)
+
+    vehicle = mock_vehicle("WPTAYCAN0", AsyncMock(return_value={}))
+    vehicle.connection.post = AsyncMock(
+        return_value={"status": {"id": "42", "result": "ACCEPTED"}}
+    )
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=mock_controller([vehicle])
+    )
+    await coordinator._async_update_data()
+    vehicle_coordinator = coordinator.vehicle_coordinators["WPTAYCAN0"]
+
+    failures = [httpx.ConnectError("unreachable"), TimeoutError()]
+
+    async def mock_get(url, params=None):
+        if failures:
+            raise failures.pop(0)
+        return {"status": {"result": "PERFORMED"}}
+
+    vehicle.connection.get = AsyncMock(side_effect=mock_get)
+    with patch(
+        "custom_components.porscheconnect.command_tracker.COMMAND_STATUS_POLL_MIN",
+        timedelta(0),
+    ), patch(
+        "custom_components.porscheconnect.command_tracker.COMMAND_STATUS_POLL_MAX",
+        timedelta(0),
+    ):
+        await vehicle_coordinator.async_remote_command(
+            "flash_indicators", vehicle.remote_services.flash_indicators
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not failures
+    assert vehicle_coordinator.command_tracker.status == "performed"
+    assert not vehicle_coordinator.command_tracker._pending
+    assert [event.data["status"] for event in events] == ["performed"]
+    await coordinator.async_shutdown()
@@ -3,17 +3,18 @@ from unittest.mock import patch
 
 import pytest
 from custom_components.porscheconnect.const import (
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
     DOMAIN,
 )
 from homeassistant import config_entries
 from homeassistant import data_entry_flow
+from homeassistant.const import CONF_SCAN_INTERVAL
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from .const import MOCK_CONFIG
 
 
-# from pytest_homeassistant_custom_component.common import MockConfigEntry
-
-
 # This fixture bypasses the actual setup of the integration
 # since we only want to test the config flow. We test the
 # actual functionality of the integration in other test modules.
@@ -103,3 +104,30 @@ async def test_failed_config_flow_login(hass, error_connection_login):
 
     assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
     assert result["errors"] == {"base": "auth"}
+
+
+@pytest.mark.asyncio
+async def test_options_flow_rejects_inverted_intervals(hass):
+    """Test that the fast, base and slow intervals must be in order."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    config_entry.add_to_hass(hass)
+    intervals = {
+        CONF_FAST_SCAN_INTERVAL: 600,
+        CONF_SCAN_INTERVAL: 300,
+        CONF_SLOW_SCAN_INTERVAL: 3600,
+    }
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=intervals
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_scan_intervals"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=intervals | {CONF_FAST_SCAN_INTERVAL: 120}
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert config_entry.options[CONF_FAST_SCAN_INTERVAL] == 120
@@ -0,0 +1,92 @@
+"""Test porscheconnect diagnostics."""
+from unittest.mock import AsyncMock
+
+import pytest
+from custom_components.porscheconnect import PorscheConnectDataUpdateCoordinator
+from custom_components.porscheconnect.const import DOMAIN
+from custom_components.porscheconnect.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.porscheconnect.poll_trace import PollTrace
+from custom_components.porscheconnect.poll_trace import trace_phase
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from . import mock_controller
+from . import synthetic
+from .const import MOCK_CONFIG
+from .test_init import mock_vehicle
+
+
+def test_trace_phases_outside_poll_are_ignored():
+    """Test that phases only count towards the poll they happen in."""
+    trace = PollTrace("WPTAYCAN0")
+    with trace_phase("parse"):
+        pass
+    with trace.activate(), trace_phase("parse"):
+        pass
+
+    assert trace.parse > 0
+    assert trace.duration >= trace.parse
+    assert trace.error is None
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics(hass):
+    """Test that recent polls are traced and personal data is redacted."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    config_entry.add_to_hass(hass)
+    overview = synthetic.overview(0, measurements=["BATTERY_LEVEL"])
+    working_vin, failing_vin = synthetic.vin(0), synthetic.vin(1)
+    vehicles = [
+        mock_vehicle(working_vin, AsyncMock(return_value=overview)),
+        mock_vehicle(failing_vin, AsyncMock(side_effect=PorscheExceptionError(503))),
+    ]
+    controller = mock_controller(vehicles)
+    account = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = account
+
+    await account._async_update_data()
+    await account.vehicle_coordinators[failing_vin].async_refresh()
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    await account.async_shutdown()
+
+    assert diagnostics["entry"]["data"]["password"] == "**REDACTED**"
+    working, failing = diagnostics["vehicles"]
+    assert working["vin"] == "**REDACTED**"
+    assert working["last_overview"]["vin"] == "**REDACTED**"
+    assert working["last_overview"]["measurements"] == overview["measurements"]
+    (trace,) = working["poll_traces"]
+    assert trace["error"] is None
+    assert trace["dispatch_ms"] is not None
+    assert [trace["retries"] for trace in failing["poll_traces"]] == [0, 1]
+    assert "PorscheExceptionError" in failing["poll_traces"][-1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_shared_vehicle_diagnostics(hass):
+    """Test that an entry not polling a shared vehicle shows its last overview."""
+    overview = synthetic.overview(0, measurements=["BATTERY_LEVEL"])
+    accounts = []
+    for entry_id in ("personal", "fleet"):
+        config_entry = MockConfigEntry(
+            domain=DOMAIN, data=MOCK_CONFIG, entry_id=entry_id
+        )
+        config_entry.add_to_hass(hass)
+        vehicle = mock_vehicle(synthetic.vin(0), AsyncMock(return_value=overview))
+        account = PorscheConnectDataUpdateCoordinator(
+            hass, config_entry=config_entry, controller=mock_controller([vehicle])
+        )
+        hass.data.setdefault(DOMAIN, {})[entry_id] = account
+        await account._async_update_data()
+        accounts.append(account)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    for account in accounts:
+        await account.async_shutdown()
+
+    (shared,) = diagnostics["vehicles"]
+    assert shared["polled_by_other_entry"]
+    assert shared["last_overview"]["measurements"] == overview["measurements"]
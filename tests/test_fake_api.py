@@ -0,0 +1,70 @@
+"""Test the porscheconnect integration against the local fake API."""
+from unittest.mock import Mock
+
+import pytest
+from custom_components.porscheconnect.api import PendingRemoteServiceStatus
+from custom_components.porscheconnect.api import PorscheConnection
+from custom_components.porscheconnect.api import PorscheRemoteServices
+from custom_components.porscheconnect.api import async_get_command_status
+from custom_components.porscheconnect.api import async_get_stored_overview
+from custom_components.porscheconnect.circuit_breaker import PorscheCircuitBreaker
+from custom_components.porscheconnect.metrics import PorscheApiMetrics
+from pyporscheconnectapi.account import PorscheConnectAccount
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pyporscheconnectapi.remote_services import ExecutionState
+
+from . import synthetic
+from .fake_api import FakePorscheApi
+from .fake_api import Faults
+
+
+@pytest.mark.asyncio
+async def test_poll_fake_api(socket_enabled):
+    """Test that an account logs in and polls its vehicles from the fake API."""
+    async with FakePorscheApi(vehicles=3) as api:
+        connection = PorscheConnection(async_client=api.client())
+        metrics = PorscheApiMetrics(connection)
+        vehicles = await PorscheConnectAccount(connection=connection).get_vehicles()
+        await async_get_stored_overview(vehicles[2], ["BATTERY_LEVEL"])
+
+    assert [vehicle.vin for vehicle in vehicles] == [synthetic.vin(i) for i in range(3)]
+    (battery,) = synthetic.overview(2, measurements=["BATTERY_LEVEL"])["measurements"]
+    assert vehicles[2].main_battery_level == battery["value"]["percent"]
+    assert api.requests["/oauth/token"] == 1
+    assert metrics.calls["overview"] == 1
+    assert metrics.payload_bytes["overview"] > 0
+
+
+@pytest.mark.asyncio
+async def test_throttled_fake_api_opens_circuit(hass, socket_enabled):
+    """Test that a 429 with Retry-After from the fake API opens the circuit."""
+    async with FakePorscheApi(faults=Faults(throttle_rate=1, retry_after=60)) as api:
+        connection = PorscheConnection(async_client=api.client(), token=api.token())
+        circuit = PorscheCircuitBreaker(hass, Mock(), connection)
+        with pytest.raises(PorscheExceptionError):
+            await connection.get("/connect/v1/vehicles")
+
+    assert api.responses[429] == 1
+    assert circuit.state == "open"
+    assert circuit.trips == 1
+
+
+@pytest.mark.asyncio
+async def test_fake_api_performs_commands_after_delay(socket_enabled):
+    """Test that commands stay pending until the fake vehicle performs them."""
+    async with FakePorscheApi(faults=Faults(command_delay=60)) as api:
+        connection = PorscheConnection(async_client=api.client(), token=api.token())
+        (vehicle,) = await PorscheConnectAccount(connection=connection).get_vehicles()
+        remote_services = PorscheRemoteServices(vehicle, non_blocking=True)
+
+        status = await remote_services.lock_vehicle()
+        assert isinstance(status, PendingRemoteServiceStatus)
+        pending = await async_get_command_status(vehicle, status.status_id)
+        # Let the vehicle perform the command without waiting for it
+        (command,) = api.commands.values()
+        command.done_at = 0
+        performed = await async_get_command_status(vehicle, status.status_id)
+
+    assert pending.state == ExecutionState.UNKNOWN
+    assert performed.state == ExecutionState.PERFORMED
+    assert command.vin == vehicle.vin
@@ -0,0 +1,51 @@
+"""Test porscheconnect HTTP client timings."""
+from unittest.mock import Mock
+
+import pytest
+from custom_components.porscheconnect.http_client import PorscheHttpTimings
+
+
+async def replay(trace, events):
+    """Replay the trace events of a request."""
+    for event in events:
+        await trace(event, {})
+
+
+@pytest.mark.asyncio
+async def test_timings_measure_new_and_reused_connections():
+    """Test that connect and TLS times only count for new connections."""
+    connection = Mock()
+    timings = PorscheHttpTimings(connection)
+    assert connection.timings is timings
+    assert timings.first_byte_time is None
+
+    await replay(
+        timings.trace(),
+        [
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "connection.start_tls.started",
+            "connection.start_tls.complete",
+            "http2.send_request_headers.started",
+            "http2.send_request_headers.complete",
+            "http2.receive_response_headers.started",
+            "http2.receive_response_headers.complete",
+        ],
+    )
+    await replay(
+        timings.trace(),
+        [
+            "http2.send_request_headers.started",
+            "http2.send_request_headers.complete",
+            "http2.receive_response_headers.started",
+            "http2.receive_response_headers.complete",
+        ],
+    )
+
+    assert timings.requests == 2
+    assert timings.connections == 1
+    assert timings.http_version == "HTTP/2"
+    assert timings.connect_time is not None
+    assert timings.tls_time is not None
+    assert timings.first_byte_time is not None
+    assert timings.as_dict()["new_connections"] == 1
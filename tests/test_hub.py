@@ -0,0 +1,100 @@
+"""Test porscheconnect vehicle hub shared by config entries."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from custom_components.porscheconnect import PorscheConnectDataUpdateCoordinator
+from custom_components.porscheconnect.const import DOMAIN
+from custom_components.porscheconnect.hub import async_get_vehicle_hub
+from custom_components.porscheconnect.hub import PorscheVehicleHub
+from custom_components.porscheconnect.sensor import DIAGNOSTIC_SENSOR_TYPES
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from . import mock_controller
+from .const import MOCK_CONFIG
+from .test_init import mock_vehicle
+
+
+@pytest.mark.asyncio
+async def test_shared_vehicle_polled_once(hass):
+    """Test that a vehicle shown by two config entries is polled by one of them."""
+    accounts = []
+    for entry_id, name in (("personal", "My Taycan"), ("fleet", "Pool car 7")):
+        config_entry = MockConfigEntry(
+            domain=DOMAIN, data=MOCK_CONFIG, entry_id=entry_id
+        )
+        config_entry.add_to_hass(hass)
+        vehicle = mock_vehicle("WPTAYCAN0", AsyncMock(return_value={}))
+        vehicle.data = {"name": name}
+        controller = mock_controller([vehicle])
+        accounts.append(
+            PorscheConnectDataUpdateCoordinator(
+                hass, config_entry=config_entry, controller=controller
+            )
+        )
+    personal, fleet = accounts
+    personal_vehicle = personal.controller.get_vehicles.return_value[0]
+    personal_vehicle.data["modelName"] = "Taycan"
+    personal_vehicle.data["BATTERY_LEVEL"] = {"percent": 80}
+    fleet_vehicle = fleet.controller.get_vehicles.return_value[0]
+
+    await personal._async_update_data()
+    await fleet._async_update_data()
+
+    fleet_vehicle.connection.get.assert_not_called()
+    # Base data the entry lacks comes from the primary, its own is kept
+    assert fleet_vehicle.data == {
+        "name": "Pool car 7",
+        "modelName": "Taycan",
+        "BATTERY_LEVEL": {"percent": 80},
+    }
+    fleet_coordinator = fleet.vehicle_coordinators["WPTAYCAN0"]
+    assert fleet_coordinator.update_interval is None
+    # The secondary reports the interval its vehicle is polled at
+    (polling_interval,) = (
+        d for d in DIAGNOSTIC_SENSOR_TYPES if d.key == "polling_interval"
+    )
+    primary = personal.vehicle_coordinators["WPTAYCAN0"]
+    assert polling_interval.value_fn(fleet_coordinator) == (
+        primary.update_interval.total_seconds()
+    )
+
+    # Polls of the primary reach the other entry
+    personal_vehicle.data = {**personal_vehicle.data, "BATTERY_LEVEL": {"percent": 79}}
+    await personal.vehicle_coordinators["WPTAYCAN0"].async_refresh()
+    assert fleet_vehicle.data["BATTERY_LEVEL"] == {"percent": 79}
+    assert fleet_vehicle.data["name"] == "Pool car 7"
+
+    # The other entry takes over when the primary goes away
+    async_get_vehicle_hub(hass).async_unregister(
+        personal.vehicle_coordinators["WPTAYCAN0"]
+    )
+    assert fleet_coordinator.update_interval is not None
+    for account in accounts:
+        await account.async_shutdown()
+
+
+def test_stagger_offset_spreads_entries_and_vehicles():
+    """Test that polls are spread over entries, and over vehicles by poll slot."""
+    hub = PorscheVehicleHub()
+    coordinators = [
+        Mock(
+            config_entry=Mock(entry_id=entry_id),
+            vehicle=Mock(vin=vin),
+            update_interval=timedelta(minutes=40),
+            poll_slot=poll_slot,
+        )
+        for entry_id, vin, poll_slot in (
+            ("fleet", "WPTAYCAN0", 0),
+            ("fleet", "WPTAYCAN1", 0.5),
+            ("personal", "WPTAYCAN2", 0),
+        )
+    ]
+    for coordinator in coordinators:
+        hub.async_register(coordinator)
+
+    assert [hub.stagger_offset(c) for c in coordinators] == [
+        timedelta(0),
+        timedelta(minutes=10),
+        timedelta(minutes=20),
+    ]
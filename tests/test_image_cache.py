@@ -0,0 +1,164 @@
+"""Test porscheconnect vehicle image cache."""
+import asyncio
+import io
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from custom_components.porscheconnect.image_cache import async_get_image_cache
+
+URL = "https://example.com/front.png"
+OTHER_URL = "https://example.com/other/front.png"
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass, tmp_path):
+    """Keep the cached images of each test apart."""
+    hass.config.config_dir = str(tmp_path)
+
+
+def response(status_code, content=b"", headers=None):
+    """Return an httpx response for the image URL."""
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers=headers,
+        request=httpx.Request("GET", URL),
+    )
+
+
+@pytest.mark.asyncio
+async def test_image_cache_revalidates(hass):
+    """Test that images are downloaded once and then revalidated."""
+    cache = async_get_image_cache(hass)
+    client = Mock(
+        get=AsyncMock(
+            side_effect=[
+                response(200, b"png", {"etag": '"v1"', "content-type": "image/png"}),
+                response(304),
+            ]
+        )
+    )
+
+    with patch(
+        "custom_components.porscheconnect.image_cache.get_async_client",
+        return_value=client,
+    ):
+        first = await cache.async_get(URL)
+        cached = await cache.async_get(URL)
+        cache._checked.clear()
+        revalidated = await cache.async_get(URL)
+
+    assert first.content == cached.content == revalidated.content == b"png"
+    assert first.digest == revalidated.digest
+    assert client.get.await_count == 2
+    assert client.get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert (cache.downloads, cache.hits, cache.revalidations) == (1, 1, 1)
+    assert async_get_image_cache(hass) is cache
+
+
+@pytest.mark.asyncio
+async def test_image_cache_variants(hass):
+    """Test that the smallest acceptable variant is served."""
+    pil_image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    pil_image.new("RGB", (1200, 600), "red").save(buffer, "PNG")
+    original = buffer.getvalue()
+    cache = async_get_image_cache(hass)
+    client = Mock(get=AsyncMock(return_value=response(200, original)))
+
+    with patch(
+        "custom_components.porscheconnect.image_cache.get_async_client",
+        return_value=client,
+    ):
+        webp = await cache.async_get_variant(URL, 300, ("image/webp", "image/png"))
+        png = await cache.async_get_variant(URL, 300)
+        full = await cache.async_get_variant(URL)
+
+    assert webp.content_type == "image/webp"
+    assert pil_image.open(io.BytesIO(webp.content)).width == 512
+    assert png.content_type == "image/png"
+    assert pil_image.open(io.BytesIO(png.content)).width == 512
+    assert full.content == original
+    assert client.get.await_count == 1
+    # Generated variants are read from disk from then on
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert not cache._variant_tasks
+
+
+@pytest.mark.asyncio
+async def test_image_cache_retries_variants(hass):
+    """Test that variants that could not be generated are tried again."""
+    pil_image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    pil_image.new("RGB", (1200, 600), "red").save(buffer, "PNG")
+    original = buffer.getvalue()
+    cache = async_get_image_cache(hass)
+    client = Mock(get=AsyncMock(return_value=response(200, original)))
+
+    with patch(
+        "custom_components.porscheconnect.image_cache.get_async_client",
+        return_value=client,
+    ):
+        with patch.object(cache, "_generate_variants"):
+            failed = await cache.async_get_variant(URL, 300)
+            await hass.async_block_till_done(wait_background_tasks=True)
+        retried = await cache.async_get_variant(URL, 300)
+
+    assert failed.content == original
+    assert pil_image.open(io.BytesIO(retried.content)).width == 512
+
+
+@pytest.mark.asyncio
+async def test_image_cache_keeps_images_shared_by_urls(hass):
+    """Test that an image replaced for one URL is kept for another using it."""
+    cache = async_get_image_cache(hass)
+    client = Mock(
+        get=AsyncMock(
+            side_effect=[
+                response(200, b"png"),
+                response(200, b"png"),
+                response(200, b"new"),
+                response(304),
+            ]
+        )
+    )
+
+    with patch(
+        "custom_components.porscheconnect.image_cache.get_async_client",
+        return_value=client,
+    ):
+        shared = await cache.async_get(URL)
+        await cache.async_get(OTHER_URL)
+        cache._checked.clear()
+        await cache.async_get(URL)
+        # Read the image of the other URL back from disk
+        cache._memory.clear()
+        other = await cache.async_get(OTHER_URL)
+
+    assert other.digest == shared.digest
+    assert other.content == b"png"
+
+
+@pytest.mark.asyncio
+async def test_image_cache_fetch_survives_cancelled_caller(hass):
+    """Test that joined callers get the image when the first caller is cancelled."""
+    cache = async_get_image_cache(hass)
+    release = asyncio.Event()
+
+    async def get(*args, **kwargs):
+        await release.wait()
+        return response(200, b"png")
+
+    with patch(
+        "custom_components.porscheconnect.image_cache.get_async_client",
+        return_value=Mock(get=get),
+    ):
+        first = asyncio.ensure_future(cache.async_get(URL))
+        joined = asyncio.ensure_future(cache.async_get(URL))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        image = await asyncio.wait_for(joined, 1)
+
+    assert image.content == b"png"
@@ -1,20 +1,34 @@
 """Test Porsche Connect setup process."""
 
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
 import pytest
 from custom_components.porscheconnect import async_reload_entry
 from custom_components.porscheconnect import async_setup_entry
 from custom_components.porscheconnect import async_unload_entry
+from custom_components.porscheconnect import compile_measurement_accessor
+from custom_components.porscheconnect import get_from_dict
 from custom_components.porscheconnect import PorscheConnectDataUpdateCoordinator
 from custom_components.porscheconnect.const import (
+    CONF_FLEET_MODE,
+    CONF_MAX_CONCURRENT_REQUESTS,
     DOMAIN,
+    FLEET_POLL_TRACES,
+    SIGNAL_PICTURE_LOCATIONS_UPDATED,
 )
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from pyporscheconnectapi.connection import Connection
 from pyporscheconnectapi.account import PorscheConnectAccount
+from pyporscheconnectapi.const import MEASUREMENTS
+from pyporscheconnectapi.exceptions import PorscheExceptionError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from . import mock_controller
 from .const import MOCK_CONFIG
 
 
@@ -133,3 +147,243 @@ async def test_update_error(hass, mock_connection, mock_client_update_error):
     )
     with pytest.raises(UpdateFailed):
         assert await coordinator._async_update_data()
+
+
+def mock_vehicle(vin, get_stored_overview):
+    """Return a mocked vehicle."""
+    return Mock(
+        vin=vin,
+        data={},
+        picture_locations={},
+        privacy_mode=False,
+        location=(None, None, None),
+        remote_climatise_on=False,
+        direct_charge_on=False,
+        connection=Mock(get=get_stored_overview),
+        get_picture_locations=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_fetches_vehicles_concurrently(hass):
+    """Test that vehicle overviews are fetched concurrently within the limit."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        options={CONF_MAX_CONCURRENT_REQUESTS: 2},
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_overview(url):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    vehicles = [mock_vehicle(f"WPTAYCAN{i}", mock_overview) for i in range(6)]
+    controller = mock_controller(vehicles)
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+
+    await coordinator._async_update_data()
+
+    assert max_in_flight == 2
+    assert set(coordinator.vehicle_coordinators) == {v.vin for v in vehicles}
+    assert all(
+        vehicle_coordinator.latency is not None
+        for vehicle_coordinator in coordinator.vehicle_coordinators.values()
+    )
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_fleet_mode_polls_vehicles_in_pages(hass):
+    """Test that fleet mode polls a page of vehicles at a time."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        options={CONF_FLEET_MODE: True},
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_overview(url):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"measurements": []}
+
+    vehicles = [mock_vehicle(f"WPTAYCAN{i}", mock_overview) for i in range(5)]
+    controller = mock_controller(vehicles)
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+
+    with patch("custom_components.porscheconnect.FLEET_PAGE_SIZE", 2):
+        assert [len(page) for page in coordinator._pages(vehicles)] == [2, 2, 1]
+        await coordinator._async_update_data()
+
+    assert max_in_flight == 2
+    vehicle_coordinators = list(coordinator.vehicle_coordinators.values())
+    assert [c.poll_slot for c in vehicle_coordinators] == [0, 0.2, 0.4, 0.6, 0.8]
+    assert vehicle_coordinators[0].poll_traces.maxlen == FLEET_POLL_TRACES
+    # Status backed entities keep reading the last overview
+    assert all(vehicle.status == {"measurements": []} for vehicle in vehicles)
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failing_vehicle_does_not_block_others(hass):
+    """Test that one failing vehicle only affects its own coordinator."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    config_entry.add_to_hass(hass)
+
+    vehicles = [
+        mock_vehicle("WPTAYCAN0", AsyncMock()),
+        mock_vehicle("WPTAYCAN1", AsyncMock(side_effect=PorscheExceptionError(503))),
+        mock_vehicle("WPTAYCAN2", AsyncMock(side_effect=httpx.ReadError("reset"))),
+    ]
+    controller = mock_controller(vehicles)
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+
+    await coordinator._async_update_data()
+
+    assert coordinator.vehicle_coordinators["WPTAYCAN0"].last_update_success
+    assert not coordinator.vehicle_coordinators["WPTAYCAN1"].last_update_success
+    # A dropped connection is a failed poll like an API error
+    dropped = coordinator.vehicle_coordinators["WPTAYCAN2"]
+    assert not dropped.last_update_success
+    assert dropped.poll_metrics.failures == 1
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_listeners_only_updated_on_changed_nodes(hass):
+    """Test that listeners are only called when a node they read changes."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    config_entry.add_to_hass(hass)
+
+    vehicle = mock_vehicle("WPTAYCAN0", AsyncMock())
+    vehicle.data = {"BATTERY_LEVEL": {"percent": 80}, "MILEAGE": {"value": 100}}
+    controller = mock_controller([vehicle])
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+    await coordinator._async_update_data()
+    vehicle_coordinator = coordinator.vehicle_coordinators["WPTAYCAN0"]
+
+    battery_listener = Mock()
+    mileage_listener = Mock()
+    vehicle_coordinator.async_add_listener(
+        battery_listener, frozenset({"BATTERY_LEVEL"})
+    )
+    vehicle_coordinator.async_add_listener(mileage_listener, frozenset({"MILEAGE"}))
+
+    vehicle.data = {**vehicle.data, "BATTERY_LEVEL": {"percent": 79}}
+    vehicle_coordinator.async_update_listeners()
+
+    assert battery_listener.call_count == 1
+    assert mileage_listener.call_count == 0
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.parametrize(
+    ("node", "leaf"),
+    [
+        ("BATTERY_LEVEL", "percent"),
+        ("E_RANGE", "kilometers"),
+        ("CHARGING_SUMMARY", "chargingProfile.minSoC"),
+        ("CHARGING_SUMMARY", "missing"),
+        ("MISSING", "percent"),
+        ("EMPTY", "percent"),
+    ],
+)
+def test_measurement_accessor_matches_get_from_dict(node, leaf):
+    """Test that compiled accessors return the same values as get_from_dict."""
+    data = {
+        "BATTERY_LEVEL": {"percent": 80},
+        "E_RANGE": {"kilometers": None},
+        "CHARGING_SUMMARY": {"chargingProfile": {"minSoC": 30}},
+        "EMPTY": None,
+    }
+
+    assert compile_measurement_accessor(node, leaf)(data) == get_from_dict(
+        get_from_dict(data, node), leaf
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_plan_follows_enabled_entities(hass):
+    """Test that only the measurements read by entities are fetched."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    config_entry.add_to_hass(hass)
+
+    get = AsyncMock(return_value={})
+    vehicle = mock_vehicle("WPTAYCAN0", get)
+    controller = mock_controller([vehicle])
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+    await coordinator._async_update_data()
+    vehicle_coordinator = coordinator.vehicle_coordinators["WPTAYCAN0"]
+
+    # The first fetch is a full one
+    assert all(f"mf={node}" in get.call_args.args[0] for node in MEASUREMENTS)
+
+    remove_listener = vehicle_coordinator.async_add_listener(
+        Mock(), frozenset({"MILEAGE"})
+    )
+    assert "MILEAGE" in vehicle_coordinator.fetch_plan
+    assert "TIRE_PRESSURE" not in vehicle_coordinator.fetch_plan
+    assert "GPS_LOCATION" in vehicle_coordinator.fetch_plan
+
+    await vehicle_coordinator.async_refresh()
+    assert "mf=MILEAGE" in get.call_args.args[0]
+    assert "mf=TIRE_PRESSURE" not in get.call_args.args[0]
+
+    remove_listener()
+    assert "MILEAGE" not in vehicle_coordinator.fetch_plan
+
+    vehicle.privacy_mode = True
+    vehicle_coordinator._fetch_plan = None
+    assert "GPS_LOCATION" not in vehicle_coordinator.fetch_plan
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_picture_locations_fetched_after_setup(hass):
+    """Test that picture locations are fetched outside of the vehicle polls."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    config_entry.add_to_hass(hass)
+
+    vehicles = [mock_vehicle(f"WPTAYCAN{i}", AsyncMock()) for i in range(2)]
+    controller = mock_controller(vehicles)
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+    await coordinator._async_update_data()
+    for vehicle in vehicles:
+        vehicle.get_picture_locations.assert_not_called()
+
+    announced = Mock()
+    async_dispatcher_connect(
+        hass, SIGNAL_PICTURE_LOCATIONS_UPDATED.format("test"), announced
+    )
+    coordinator.async_schedule_picture_locations_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    for vehicle in vehicles:
+        vehicle.get_picture_locations.assert_awaited_once()
+    announced.assert_called_once()
+    await coordinator.async_shutdown()
@@ -0,0 +1,55 @@
+"""Test porscheconnect API and polling metrics."""
+from unittest.mock import Mock
+
+from custom_components.porscheconnect.metrics import PorscheApiMetrics
+from custom_components.porscheconnect.metrics import PorscheSamples
+from custom_components.porscheconnect.metrics import endpoint_of
+
+
+def test_endpoint_of_api_paths():
+    """Test that API paths are attributed to their endpoint and vehicle."""
+    assert endpoint_of("/connect/v1/vehicles") == ("vehicles", None)
+    assert endpoint_of("/connect/v1/vehicles/VIN1?mf=BATTERY_LEVEL") == (
+        "overview",
+        "VIN1",
+    )
+    assert endpoint_of("/connect/v1/vehicles/VIN1/pictures") == ("pictures", "VIN1")
+    assert endpoint_of("/connect/v1/vehicles/VIN1/commands") == ("commands", "VIN1")
+    assert endpoint_of("/connect/v1/vehicles/VIN1/commands/42") == (
+        "command_status",
+        "VIN1",
+    )
+    assert endpoint_of("/profile") == ("other", None)
+
+
+def test_samples_keep_recent_values():
+    """Test that only the most recent samples count for the percentile."""
+    samples = PorscheSamples(maxlen=20)
+    for value in range(1, 41):
+        samples.add(value)
+
+    assert samples.count == 40
+    assert len(samples) == 20
+    assert samples.last == 40
+    assert samples.p95 == 39
+    assert samples.mean == 30.5
+
+
+def test_api_metrics_record_calls():
+    """Test that calls, errors and payload sizes are counted per endpoint."""
+    connection = Mock()
+    metrics = PorscheApiMetrics(connection)
+    assert connection.metrics is metrics
+
+    metrics.record("/connect/v1/vehicles/VIN1?mf=A", 0.2, 1000)
+    metrics.record("/connect/v1/vehicles/VIN1?mf=A", 0.4, 10, error=True)
+    metrics.record_token_refresh(0.6)
+
+    assert metrics.calls == {"overview": 2, "token": 1}
+    assert metrics.errors == {"overview": 1}
+    assert metrics.payload_bytes["overview"] == 1010
+    # A failed call does not replace the size of the last overview
+    assert metrics.overview_bytes == {"VIN1": 1000}
+    assert metrics.latency_by_endpoint() == {"overview": 300, "token": 600}
+    assert round(metrics.mean_latency, 3) == 0.4
+    assert metrics.last_success is not None
@@ -2,6 +2,8 @@
 from unittest.mock import MagicMock
 
 import pytest
+from custom_components.porscheconnect.fetch_plan import build_fetch_plan
+from custom_components.porscheconnect.number import NUMBER_TYPES
 from homeassistant.components.number import DOMAIN as NUMBER_DOMAIN
 from homeassistant.components.number import SERVICE_SET_VALUE
 from homeassistant.const import (
@@ -38,3 +40,14 @@ async def test_number(hass: HomeAssistant, mock_set_charging_level: MagicMock) -
     mock_set_charging_level.assert_called_with(
         "WPTAYCAN", None, 4, minimumChargeLevel=58.0
     )
+
+
+def test_target_soc_fetches_charging_profiles():
+    """Verify the charging profiles rewritten by the target SoC are fetched."""
+    (target_soc,) = (d for d in NUMBER_TYPES if d.key == "target_soc")
+
+    plan = build_fetch_plan(
+        [frozenset(target_soc.measurement_nodes)], privacy_mode=False
+    )
+
+    assert "CHARGING_PROFILES" in plan
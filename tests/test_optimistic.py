@@ -0,0 +1,199 @@
+"""Test porscheconnect optimistic command state."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from custom_components.porscheconnect import PorscheConnectDataUpdateCoordinator
+from custom_components.porscheconnect.const import CONF_NON_BLOCKING_COMMANDS
+from custom_components.porscheconnect.const import DOMAIN
+from custom_components.porscheconnect.optimistic import ExpectedState
+from pyporscheconnectapi.exceptions import PorscheExceptionError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from . import mock_controller
+from .const import MOCK_CONFIG
+from .test_init import mock_vehicle
+
+
+async def setup_vehicle_coordinator(hass, get_stored_overview, options=None):
+    """Return the coordinator of a vehicle with climatisation off."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, options=options or {}, entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+
+    vehicle = mock_vehicle("WPTAYCAN0", get_stored_overview)
+    vehicle.data = {"CLIMATIZER_STATE": {"isOn": False}}
+    controller = mock_controller([vehicle])
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+    await coordinator._async_update_data()
+    return coordinator.vehicle_coordinators["WPTAYCAN0"]
+
+
+def climatise_on():
+    """Return the expected state of turning climatisation on."""
+    return ExpectedState(
+        "climatise",
+        True,
+        lambda v: v.data["CLIMATIZER_STATE"]["isOn"],
+        frozenset({"CLIMATIZER_STATE"}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_requested_state_shown_until_confirmed(hass):
+    """Test that the requested state is shown before the vehicle reports it."""
+    vehicle_coordinator = await setup_vehicle_coordinator(hass, AsyncMock())
+    listener = Mock()
+    vehicle_coordinator.async_add_listener(listener, frozenset({"CLIMATIZER_STATE"}))
+    release = asyncio.Event()
+
+    command = asyncio.ensure_future(
+        vehicle_coordinator.async_optimistic_command(
+            climatise_on(), "climatise_on", release.wait
+        )
+    )
+    await asyncio.sleep(0)
+    assert vehicle_coordinator.optimistic.get("climatise", False) is True
+    assert listener.call_count == 1
+
+    release.set()
+    await command
+    # Not reported by the vehicle yet
+    assert vehicle_coordinator.optimistic.get("climatise", False) is True
+
+    vehicle_coordinator.vehicle.data = {"CLIMATIZER_STATE": {"isOn": True}}
+    vehicle_coordinator.async_update_listeners()
+    assert vehicle_coordinator.optimistic.get("climatise", False) is False
+    assert vehicle_coordinator.optimistic.confirmed == 1
+    await vehicle_coordinator.account.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_requested_state_rolled_back_on_error(hass):
+    """Test that the requested state is rolled back when the command fails."""
+    vehicle_coordinator = await setup_vehicle_coordinator(hass, AsyncMock())
+
+    with pytest.raises(PorscheExceptionError):
+        await vehicle_coordinator.async_optimistic_command(
+            climatise_on(),
+            "climatise_on",
+            AsyncMock(side_effect=PorscheExceptionError(502)),
+        )
+
+    assert vehicle_coordinator.optimistic.get("climatise", False) is False
+    assert vehicle_coordinator.optimistic.rolled_back == 1
+    await vehicle_coordinator.account.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unconfirmed_state_rolled_back_after_deadline(hass):
+    """Test that targeted fetches confirm the state until the deadline."""
+    get = AsyncMock(return_value={})
+    vehicle_coordinator = await setup_vehicle_coordinator(hass, get)
+    get.reset_mock()
+
+    with patch(
+        "custom_components.porscheconnect.optimistic.COMMAND_CONFIRM_DELAYS", (0.01,)
+    ), patch(
+        "custom_components.porscheconnect.optimistic.COMMAND_CONFIRM_DEADLINE",
+        timedelta(seconds=0.03),
+    ):
+        await vehicle_coordinator.async_optimistic_command(
+            climatise_on(), "climatise_on", AsyncMock()
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert "mf=CLIMATIZER_STATE" in get.call_args.args[0]
+    assert "mf=BATTERY_LEVEL" not in get.call_args.args[0]
+    assert vehicle_coordinator.optimistic.get("climatise", False) is False
+    assert vehicle_coordinator.optimistic.rolled_back == 1
+    await vehicle_coordinator.account.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_confirmation_survives_transport_errors(hass):
+    """Test that a failing targeted fetch is retried until the deadline."""
+    get = AsyncMock(return_value={})
+    vehicle_coordinator = await setup_vehicle_coordinator(hass, get)
+    get.reset_mock()
+    get.side_effect = httpx.ReadError("reset")
+
+    with patch(
+        "custom_components.porscheconnect.optimistic.COMMAND_CONFIRM_DELAYS", (0.01,)
+    ), patch(
+        "custom_components.porscheconnect.optimistic.COMMAND_CONFIRM_DEADLINE",
+        timedelta(seconds=0.03),
+    ):
+        await vehicle_coordinator.async_optimistic_command(
+            climatise_on(), "climatise_on", AsyncMock()
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert get.call_count > 1
+    assert vehicle_coordinator.optimistic.get("climatise", False) is False
+    assert vehicle_coordinator.optimistic.rolled_back == 1
+    await vehicle_coordinator.account.async_shutdown()
+
+@pytest.mark.asyncio
+async def test_confirmation_continues_after_failed_command(hass):
+    """Test that a command failing after it was accepted is no longer confirmed."""
+    vehicle_coordinator = await setup_vehicle_coordinator(
+        hass, AsyncMock(), options={CONF_NON_BLOCKING_COMMANDS: True}
+    )
+    vehicle = vehicle_coordinator.vehicle
+
+    async def get(url):
+        if "/commands/" in url:
+            result = "ERROR" if url.endswith("/commands/1") else "PERFORMED"
+            return {"status": {"result": result}}
+        return {}
+
+    vehicle.connection.get = AsyncMock(side_effect=get)
+    vehicle.connection.post = AsyncMock(
+        side_effect=[
+            {"status": {"id": status_id, "result": "ACCEPTED"}}
+            for status_id in ("1", "2")
+        ]
+    )
+    direct_charging_on = ExpectedState(
+        "direct_charging",
+        True,
+        lambda v: False,
+        frozenset({"CHARGING_SUMMARY"}),
+    )
+
+    with patch(
+        "custom_components.porscheconnect.command_tracker.COMMAND_STATUS_POLL_MIN",
+        timedelta(0),
+    ), patch(
+        "custom_components.porscheconnect.optimistic.COMMAND_CONFIRM_DELAYS", (0.01,)
+    ), patch(
+        "custom_components.porscheconnect.optimistic.COMMAND_CONFIRM_DEADLINE",
+        timedelta(seconds=0.05),
+    ):
+        await vehicle_coordinator.async_optimistic_command(
+            climatise_on(), "climatise_on", vehicle.remote_services.flash_indicators
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert vehicle_coordinator.optimistic.rolled_back == 1
+
+        await vehicle_coordinator.async_optimistic_command(
+            direct_charging_on,
+            "direct_charging_on",
+            vehicle.remote_services.flash_indicators,
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # The confirmation fetched the state of the second command until its deadline
+    assert any(
+        "mf=CHARGING_SUMMARY" in call.args[0]
+        for call in vehicle.connection.get.call_args_list
+    )
+    assert vehicle_coordinator.optimistic.get("direct_charging", False) is False
+    assert vehicle_coordinator.optimistic.rolled_back == 2
+    await vehicle_coordinator.account.async_shutdown()
@@ -0,0 +1,95 @@
+"""Test porscheconnect account API quota."""
+from unittest.mock import Mock
+
+import pytest
+from custom_components.porscheconnect.const import CONF_QUOTA_CAPACITY
+from custom_components.porscheconnect.const import DOMAIN
+from custom_components.porscheconnect.const import QUOTA_CAPACITY_PER_VEHICLE
+from custom_components.porscheconnect.rate_limiter import PRIORITY_COMMAND
+from custom_components.porscheconnect.rate_limiter import PorscheQuotaExceededError
+from custom_components.porscheconnect.rate_limiter import PorscheRateLimiter
+from custom_components.porscheconnect.rate_limiter import request_priority
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .const import MOCK_CONFIG
+
+
+@pytest.mark.asyncio
+async def test_polls_leave_quota_for_commands(hass):
+    """Test that polls are throttled before they use the reserve for commands."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    limiter = PorscheRateLimiter(hass, config_entry, Mock())
+    limiter.tokens = limiter.capacity * 0.2 + 1
+
+    await limiter.async_acquire()
+    with pytest.raises(PorscheQuotaExceededError):
+        await limiter.async_acquire()
+
+    with request_priority(PRIORITY_COMMAND):
+        await limiter.async_acquire()
+
+    assert limiter.calls == {"poll": 1, "command": 1}
+    assert limiter.throttled == {"poll": 1}
+
+
+@pytest.mark.asyncio
+async def test_quota_restored_after_restart(hass, hass_storage):
+    """Test that the bucket and counters survive a restart."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    hass_storage[f"{DOMAIN}.test.quota"] = {
+        "version": 1,
+        "data": {
+            "tokens": 10,
+            "updated": dt_util.utcnow().isoformat(),
+            "calls": {"poll": 290},
+            "throttled": {"background": 3},
+        },
+    }
+
+    limiter = PorscheRateLimiter(hass, config_entry, Mock())
+    await limiter.async_load()
+
+    assert limiter.remaining == 10
+    assert limiter.calls["poll"] == 290
+    assert limiter.throttled["background"] == 3
+
+
+@pytest.mark.asyncio
+async def test_quota_sized_by_vehicles(hass):
+    """Test that the quota grows with the vehicles unless it is configured."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    limiter = PorscheRateLimiter(hass, config_entry, Mock())
+    await limiter.async_acquire()
+
+    limiter.async_set_vehicles(100)
+
+    assert limiter.capacity == 100 * QUOTA_CAPACITY_PER_VEHICLE
+    assert limiter.remaining == limiter.capacity - 1
+
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        options={CONF_QUOTA_CAPACITY: 500},
+        entry_id="configured",
+    )
+    limiter = PorscheRateLimiter(hass, config_entry, Mock())
+    limiter.async_set_vehicles(100)
+
+    assert limiter.capacity == 500
+
+
+@pytest.mark.asyncio
+async def test_quota_changes_update_entities_now_and_then(hass):
+    """Test that a burst of calls updates the account entities once."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    on_change = Mock()
+    limiter = PorscheRateLimiter(hass, config_entry, Mock(), on_change=on_change)
+
+    for _ in range(10):
+        await limiter.async_acquire()
+    await hass.async_block_till_done()
+
+    assert limiter.calls["poll"] == 10
+    assert on_change.call_count == 1
+    limiter.async_shutdown()
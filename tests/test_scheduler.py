@@ -0,0 +1,54 @@
+"""Test porscheconnect adaptive polling scheduler."""
+from datetime import timedelta
+from unittest.mock import Mock
+
+from custom_components.porscheconnect.scheduler import PorschePollingScheduler
+from custom_components.porscheconnect.scheduler import REASON_CHARGING
+from custom_components.porscheconnect.scheduler import REASON_MOVING
+from custom_components.porscheconnect.scheduler import REASON_PARKED
+
+BASE = timedelta(minutes=30)
+FAST = timedelta(minutes=5)
+SLOW = timedelta(hours=4)
+
+
+def mock_vehicle(status="NOT_CHARGING", location=(59.3, 18.0, 90)):
+    """Return a mocked vehicle in the given state."""
+    return Mock(
+        data={"CHARGING_SUMMARY": {"status": status}},
+        remote_climatise_on=False,
+        direct_charge_on=False,
+        location=location,
+    )
+
+
+def test_parked_vehicle_backs_off_to_slow_interval():
+    """Verify a parked vehicle backs off exponentially up to the slow bound."""
+    scheduler = PorschePollingScheduler(BASE, FAST, SLOW)
+    vehicle = mock_vehicle()
+
+    intervals = [scheduler.next_interval(vehicle) for _ in range(6)]
+
+    assert intervals[:4] == [BASE, BASE * 2, BASE * 4, SLOW]
+    assert intervals[-1] == SLOW
+    assert scheduler.reason == REASON_PARKED
+
+
+def test_charging_vehicle_uses_fast_interval():
+    """Verify charging resets the back-off and polls fast."""
+    scheduler = PorschePollingScheduler(BASE, FAST, SLOW)
+    scheduler.next_interval(mock_vehicle())
+    scheduler.next_interval(mock_vehicle())
+
+    assert scheduler.next_interval(mock_vehicle(status="CHARGING")) == FAST
+    assert scheduler.reason == REASON_CHARGING
+    assert scheduler.next_interval(mock_vehicle()) == BASE
+
+
+def test_moving_vehicle_uses_fast_interval():
+    """Verify a changed location polls fast."""
+    scheduler = PorschePollingScheduler(BASE, FAST, SLOW)
+    scheduler.next_interval(mock_vehicle())
+
+    assert scheduler.next_interval(mock_vehicle(location=(59.4, 18.1, 0))) == FAST
+    assert scheduler.reason == REASON_MOVING
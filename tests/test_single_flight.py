@@ -0,0 +1,67 @@
+"""Test porscheconnect single-flight de-duplication."""
+import asyncio
+
+import pytest
+from custom_components.porscheconnect.single_flight import PorscheSingleFlight
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_are_merged(hass):
+    """Test that concurrent identical calls share one call and its result."""
+    single_flight = PorscheSingleFlight(hass, "WPTAYCAN0")
+    calls = 0
+
+    async def job():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        single_flight.async_run("get_current_overview", job),
+        single_flight.async_run("get_current_overview", job),
+        single_flight.async_run("target_soc", job, (80,)),
+        single_flight.async_run("target_soc", job, (90,)),
+    )
+
+    assert results[0] == results[1]
+    assert calls == 3
+    assert single_flight.calls == {"get_current_overview": 1, "target_soc": 2}
+    assert single_flight.merged == {"get_current_overview": 1}
+
+
+@pytest.mark.asyncio
+async def test_merged_calls_share_errors(hass):
+    """Test that merged calls see the error of the shared call."""
+    single_flight = PorscheSingleFlight(hass, "WPTAYCAN0")
+
+    async def job():
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    results = await asyncio.gather(
+        single_flight.async_run("lock", job),
+        single_flight.async_run("lock", job),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert single_flight.merged == {"lock": 1}
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_merged(hass):
+    """Test that a call right after a finished one runs the job again."""
+    single_flight = PorscheSingleFlight(hass, "WPTAYCAN0")
+    calls = 0
+
+    async def job():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    first = await single_flight.async_run("get_current_overview", job)
+    second = await single_flight.async_run("get_current_overview", job)
+
+    assert (first, second) == (1, 2)
+    assert not single_flight.merged
@@ -0,0 +1,59 @@
+"""Test porscheconnect vehicle snapshot."""
+from datetime import datetime
+
+import pytest
+from custom_components.porscheconnect import PorscheConnectDataUpdateCoordinator
+from custom_components.porscheconnect.const import DOMAIN
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from . import mock_controller
+from .const import MOCK_CONFIG
+
+VEHICLE_DATA = {
+    "vin": "WPTAYCAN0",
+    "modelName": "Taycan",
+    "name": "Taycan",
+    "BATTERY_LEVEL": {"percent": 80},
+    "CHARGING_SUMMARY": {"targetDateTimeWithOffset": "2024-05-01T07:00:00+02:00"},
+}
+
+
+@pytest.mark.asyncio
+async def test_vehicles_restored_from_snapshot(hass, hass_storage):
+    """Test that vehicles are set up from the snapshot without polling."""
+    hass_storage[f"{DOMAIN}.test"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.test",
+        "data": {
+            "vehicles": [
+                {
+                    "vin": "WPTAYCAN0",
+                    "data": VEHICLE_DATA,
+                    "capabilities": {},
+                    "picture_locations": {"front": "https://example.com/front"},
+                }
+            ]
+        },
+    }
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    config_entry.add_to_hass(hass)
+    controller = mock_controller()
+    coordinator = PorscheConnectDataUpdateCoordinator(
+        hass, config_entry=config_entry, controller=controller
+    )
+
+    await coordinator._async_update_data()
+
+    controller.get_vehicles.assert_not_called()
+    controller.connection.get.assert_not_called()
+    vehicle_coordinator = coordinator.vehicle_coordinators["WPTAYCAN0"]
+    assert vehicle_coordinator.data["BATTERY_LEVEL"] == {"percent": 80}
+    assert isinstance(
+        vehicle_coordinator.data["CHARGING_SUMMARY"]["targetDateTimeWithOffset"],
+        datetime,
+    )
+    assert vehicle_coordinator.vehicle.picture_locations == {
+        "front": "https://example.com/front"
+    }
+    await coordinator.async_shutdown()
@@ -0,0 +1,150 @@
+"""Test porscheconnect token manager."""
+import asyncio
+import time
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from custom_components.porscheconnect.const import DOMAIN
+from custom_components.porscheconnect.const import TOKEN_REFRESH_RETRY
+from custom_components.porscheconnect.token_manager import PorscheTokenManager
+from custom_components.porscheconnect.token_manager import PorscheTokenPersistence
+from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pyporscheconnectapi.oauth2 import OAuth2Token
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from .const import MOCK_CONFIG
+
+
+def mock_connection(expires_in: int) -> Mock:
+    """Return a mocked connection holding a token expiring in expires_in seconds."""
+
+    async def mock_refresh(refresh_token):
+        await asyncio.sleep(0.01)
+        return {
+            "access_token": "new",
+            "refresh_token": refresh_token,
+            "expires_in": 3600,
+        }
+
+    return Mock(
+        token=OAuth2Token(
+            {
+                "access_token": "old",
+                "refresh_token": "refresh",
+                "expires_at": int(time.time()) + expires_in,
+                "expires_in": 3600,
+            }
+        ),
+        token_lock=asyncio.Lock(),
+        oauth2_client=Mock(leeway=60, refresh_token=AsyncMock(side_effect=mock_refresh)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh(hass: HomeAssistant) -> None:
+    """Verify concurrent callers wait on a single in-flight refresh."""
+    connection = mock_connection(expires_in=0)
+    on_refresh = Mock()
+    manager = PorscheTokenManager(hass, connection, on_refresh=on_refresh)
+
+    tokens = await asyncio.gather(
+        *(manager.async_get_access_token() for _ in range(5))
+    )
+
+    assert connection.oauth2_client.refresh_token.call_count == 1
+    assert {token.access_token for token in tokens} == {"new"}
+    assert manager.refresh_latency is not None
+    assert on_refresh.call_count == 1
+    manager.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_retried_after_transport_error(
+    hass: HomeAssistant,
+) -> None:
+    """Verify a dropped connection during a background refresh is retried."""
+    connection = mock_connection(expires_in=0)
+    refresh_token = connection.oauth2_client.refresh_token
+    mock_refresh = refresh_token.side_effect
+
+    async def refresh_once_connected(token):
+        if refresh_token.call_count == 1:
+            raise httpx.ConnectError("reset")
+        return await mock_refresh(token)
+
+    refresh_token.side_effect = refresh_once_connected
+    manager = PorscheTokenManager(hass, connection)
+
+    manager.async_schedule_refresh()
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert connection.token.access_token == "old"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + TOKEN_REFRESH_RETRY)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert refresh_token.call_count == 2
+    assert connection.token.access_token == "new"
+    manager.async_shutdown()
+
+@pytest.mark.asyncio
+async def test_valid_token_is_not_refreshed(hass: HomeAssistant) -> None:
+    """Verify a valid token is returned without a token exchange."""
+    connection = mock_connection(expires_in=3000)
+    manager = PorscheTokenManager(hass, connection)
+
+    token = await manager.async_get_access_token()
+
+    assert token.access_token == "old"
+    assert connection.oauth2_client.refresh_token.call_count == 0
+    assert 0 <= manager.token_age < 700
+
+
+@pytest.mark.asyncio
+async def test_malformed_token_is_replaced(hass: HomeAssistant) -> None:
+    """Verify a malformed token is treated as missing instead of failing."""
+    connection = mock_connection(expires_in=3000)
+    connection.token = Mock()
+    connection.oauth2_client.fetch_authorization_code = AsyncMock(return_value="code")
+    connection.oauth2_client.fetch_access_token = AsyncMock(
+        return_value={"access_token": "new", "expires_in": 3600}
+    )
+    manager = PorscheTokenManager(hass, connection)
+
+    manager.async_schedule_refresh()
+    assert manager.token_age is None
+
+    token = await manager.async_get_access_token()
+
+    assert token.access_token == "new"
+    assert isinstance(connection.token, OAuth2Token)
+    assert connection.oauth2_client.refresh_token.call_count == 0
+    manager.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_token_persistence_skips_and_coalesces_writes(
+    hass: HomeAssistant,
+) -> None:
+    """Verify unchanged tokens are not written and changes are batched."""
+    stored = {"access_token": "old", "expires_at": 1}
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data={**MOCK_CONFIG, CONF_ACCESS_TOKEN: stored}
+    )
+    config_entry.add_to_hass(hass)
+    persistence = PorscheTokenPersistence(hass, config_entry)
+
+    persistence.async_schedule_save(OAuth2Token(dict(stored)))
+    persistence.async_schedule_save({"access_token": "new", "expires_at": 2})
+    persistence.async_schedule_save({"access_token": "newer", "expires_at": 3})
+    assert persistence.writes == 0
+
+    persistence.async_flush()
+
+    assert persistence.skipped == 1
+    assert persistence.writes == 1
+    assert config_entry.data[CONF_ACCESS_TOKEN]["access_token"] == "newer"